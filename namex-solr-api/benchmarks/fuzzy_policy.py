@@ -0,0 +1,176 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the fuzzy clause policy: replays name searches from search_history under each policy.
+
+Runs the saved possible conflict name searches (query.value) through namex_search against the configured solr
+follower with each fuzzy policy and prints the p95 solr QTime / request time and the mean overlap (jaccard) of
+the top results with the default policy (every fuzzy clause).
+
+    python benchmarks/fuzzy_policy.py --limit 1000  # latest 1000 searches in the configured db
+    python benchmarks/fuzzy_policy.py --queries-file queries.json  # json list of query values instead
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from sqlalchemy import select
+
+from namex_solr_api import create_app
+from namex_solr_api.models import SearchHistory, db
+from namex_solr_api.services import solr
+from namex_solr_api.services.base_solr.utils import FuzzyPolicy, QueryParams
+from namex_solr_api.services.namex_solr.doc_models import (
+    CONFLICT_EXCLUDED_SUB_TYPES,
+    CONFLICT_NAME_STATES,
+    CONFLICT_STATES,
+    NameField,
+    PCField,
+)
+from namex_solr_api.services.namex_solr.utils import namex_search, prep_query_str_namex
+
+
+def get_history_values(limit: int) -> list[str]:
+    """Return the query values of the latest name searches."""
+    stmt = select(SearchHistory.query).order_by(SearchHistory.id.desc()).limit(limit)
+    return [value for query in db.session.scalars(stmt) if (value := (query or {}).get("query", {}).get("value"))]
+
+
+def get_params(value: str, rows: int) -> QueryParams:
+    """Return the name search params used by the possible conflict names endpoint."""
+    return QueryParams(
+        query={"value": prep_query_str_namex(value, "replace")},
+        rows=rows,
+        start=0,
+        categories={PCField.STATE: sorted(CONFLICT_STATES)},
+        child_query={},
+        child_categories={NameField.NAME_STATE: sorted(CONFLICT_NAME_STATES)},
+        fields=[NameField.UNIQUE_KEY.value],
+        highlighted_fields=[],
+        query_boost_fields={
+            NameField.NAME_Q_AGRO: 2,
+            NameField.NAME_Q_SINGLE: 2,
+            NameField.NAME_Q_XTRA: 2,
+            NameField.NAME_Q_SYN: 2
+        },
+        query_fields={
+            NameField.NAME_Q: "child",
+            NameField.NAME_Q_AGRO: "child",
+            NameField.NAME_Q_STEM_HIGHLIGHT: "child",
+            NameField.NAME_Q_SINGLE: "child",
+            NameField.NAME_Q_XTRA: "child",
+            NameField.NAME_Q_PHON_EN: "child",
+        },
+        query_fuzzy_fields={
+            NameField.NAME_Q: {"short": 1, "long": 2},
+            NameField.NAME_Q_AGRO: {"short": 1, "long": 2},
+            NameField.NAME_Q_SINGLE: {"short": 0, "long": 2}
+        },
+        query_synonym_fields={
+            NameField.NAME_Q_SYN: "child"
+        },
+        full_query_boosts=solr.get_name_search_full_query_boost(value),
+        exclude_sub_types=sorted(CONFLICT_EXCLUDED_SUB_TYPES),
+    )
+
+
+def run(values: list[str], policy: FuzzyPolicy, rows: int) -> tuple[list[int], list[float], list[set[str]]]:
+    """Return the solr QTimes, request times (ms) and result ids of each search under the policy."""
+    solr.query_builder.fuzzy_policy = policy
+    qtimes, times, results = [], [], []
+    for value in values:
+        start = time.perf_counter()
+        resp = namex_search(get_params(value, rows), solr, True)
+        times.append((time.perf_counter() - start) * 1000)
+        qtimes.append(resp["responseHeader"]["QTime"])
+        results.append({doc[NameField.UNIQUE_KEY.value] for doc in resp.get("response", {}).get("docs", [])})
+    return qtimes, times, results
+
+
+def jaccard(first: set[str], second: set[str]) -> float:
+    """Return the jaccard similarity of the result sets."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def p95(times: list[float]) -> float:
+    """Return the 95th percentile."""
+    return statistics.quantiles(times, n=20)[-1] if len(times) > 1 else times[0]
+
+
+def main():
+    """Run the benchmark for each policy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=1000, help="number of search_history searches to replay")
+    parser.add_argument("--queries-file", help="json list of query values to replay instead of search_history")
+    parser.add_argument("--rows", type=int, default=100, help="top results compared with the default policy")
+    parser.add_argument("--max-clauses", type=int, default=6)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if args.queries_file:
+            with open(args.queries_file, encoding="utf-8") as file:
+                values = json.load(file)
+        else:
+            values = get_history_values(args.limit)
+        if not values:
+            print("No searches to replay.")  # noqa: T201
+            return
+
+        ngram_fields = solr.ngram_fields
+        policies = {
+            "default": FuzzyPolicy(),
+            "capped": FuzzyPolicy(max_clauses=args.max_clauses),
+            "skip ngram": FuzzyPolicy(skip_fields=ngram_fields),
+            "skip exact": FuzzyPolicy(exact_terms_lookup=solr.get_indexed_terms),
+            "all": FuzzyPolicy(max_clauses=args.max_clauses,
+                               skip_fields=ngram_fields,
+                               exact_terms_lookup=solr.get_indexed_terms),
+        }
+        baseline = None
+        for label, policy in policies.items():
+            qtimes, times, results = run(values, policy, args.rows)
+            baseline = baseline or results
+            overlap = statistics.mean(jaccard(first, second) for first, second in zip(baseline, results, strict=True))
+            print(  # noqa: T201
+                f"{label:<12} qtime p95 {p95(qtimes):>7.1f}ms  request p95 {p95(times):>7.1f}ms  "
+                f"top {args.rows} overlap {overlap:.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the possible conflict highlight post-processing for a page of results.
+
+Times the page classification (classify_highlights) against the previous per result loop and the local
+highlighting mode (get_local_highlights) on synthetic pages of 10, 100 and 1000 rows. No solr / db needed.
+
+    python benchmarks/highlight_classification.py --repeat 20
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from namex_solr_api.services.namex_solr.doc_models import NameField
+from namex_solr_api.services.namex_solr.utils import classify_highlights, get_local_highlights
+
+WORDS = ["PACIFIC", "COAST", "HOLDINGS", "MOUNTAIN", "RIVER", "NORTHERN", "CONSULTING", "VENTURES", "CEDAR", "BAY"]
+QUERY = "pacific coast holding ventures"
+
+
+def get_page(rows: int) -> tuple[list[str], list[dict[str, list[str]]]]:
+    """Return the names and parsed solr highlighting of a synthetic result page."""
+    rand = random.Random(rows)
+    names, highlighting = [], []
+    for _ in range(rows):
+        words = rand.sample(WORDS, 4)
+        names.append(f"{' '.join(words)} LTD.")
+        highlighting.append({
+            NameField.NAME_Q_SINGLE.value: words[:2],
+            NameField.NAME_Q_STEM_HIGHLIGHT.value: words[1:3],
+            NameField.NAME_Q_PHON_EN.value: [word.lower() for word in words],
+            NameField.NAME_Q_SYN.value: [words[3].lower()],
+        })
+    return names, highlighting
+
+
+def classify_per_result(query_value: str, highlighting: list[dict[str, list[str]]]) -> list[dict[str, list[str]]]:
+    """Return the highlight classes with the previous per result loop (baseline)."""
+    page = []
+    for highlight_raw in highlighting:
+        def split_highlights(highlights: list[str]):
+            resp = []
+            for highlight in highlights:
+                clean = re.sub(r"<[^>]+>", "", highlight)
+                resp += [term for term in clean.upper().split(" ") if term]
+            return resp
+
+        exact_highlights, stem_highlights, phonetic_highlights, synonym_highlights = [], [], [], []
+        if exact_highlights_full_terms := highlight_raw.get(NameField.NAME_Q_SINGLE.value, []):
+            exact_highlights_full_terms = split_highlights(exact_highlights_full_terms)
+            for term in query_value.split(" "):
+                if any(x for x in exact_highlights_full_terms if term.upper() in x):
+                    exact_highlights.append(term.upper())
+        if stem_highlights := highlight_raw.get(NameField.NAME_Q_STEM_HIGHLIGHT.value, []):
+            stem_highlights = [x for x in split_highlights(stem_highlights) if x not in (exact_highlights)]
+        if phonetic_highlights := highlight_raw.get(NameField.NAME_Q_PHON_EN.value, []):
+            other_highlights = exact_highlights + stem_highlights
+            phonetic_highlights = [x.upper() for x in split_highlights(phonetic_highlights)
+                                   if x.upper() not in other_highlights and x.strip()]
+        if synonym_highlights := highlight_raw.get(NameField.NAME_Q_SYN.value, []):
+            other_highlights = exact_highlights + stem_highlights + phonetic_highlights
+            synonym_highlights = [x.upper() for x in synonym_highlights if x.upper() not in other_highlights]
+        page.append({
+            "exact": list(set(exact_highlights)),
+            "stems": list(set(stem_highlights)),
+            "phonetic": list(set(phonetic_highlights)),
+            "synonyms": list(set(synonym_highlights)),
+        })
+    return page
+
+
+def main():
+    """Run the benchmark for each page size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for rows in (10, 100, 1000):
+        names, highlighting = get_page(rows)
+        expected = [{key: sorted(value) for key, value in result.items()}
+                    for result in classify_per_result(QUERY, highlighting)]
+        assert expected == [{key: sorted(value) for key, value in result.items()}
+                            for result in classify_highlights(QUERY, highlighting)]
+        timings = {
+            "per result loop": lambda h=highlighting: classify_per_result(QUERY, h),
+            "classify page": lambda h=highlighting: classify_highlights(QUERY, h),
+            "local highlights": lambda n=names: get_local_highlights(QUERY, n, {}),
+        }
+        for label, func in timings.items():
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat)) * 1000
+            print(f"{rows:>5} rows  {label:<17} {best:>8.3f}ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
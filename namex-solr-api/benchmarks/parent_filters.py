@@ -0,0 +1,140 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the name search parent filters: block join vs the denormalized parent_* name fields.
+
+Runs the same name searches against a local core with the parent filters (state, jurisdiction, corp/nr num)
+as block joins ({!child of=...}) and as flat filters on the name docs, and prints the solr QTime per mode.
+Filters are sent with cache=false so each run measures the filter itself, not the filterCache.
+
+    python benchmarks/parent_filters.py --load 2000000  # index synthetic docs first (local core only!)
+    python benchmarks/parent_filters.py --runs 200
+"""
+
+import argparse
+import random
+import statistics
+
+import requests
+
+from namex_solr_api.services.namex_solr import NamexSolr
+from namex_solr_api.services.namex_solr.doc_models import Name, NameField, PCField, PossibleConflict
+
+WORDS = ["PACIFIC", "COAST", "HOLDINGS", "MOUNTAIN", "RIVER", "NORTHERN", "CONSULTING", "VENTURES", "CEDAR", "BAY"]
+CORP_STATES = ["ACTIVE", "HISTORICAL"]
+NR_STATES = ["APPROVED", "CONDITION", "DRAFT", "EXPIRED", "CONSUMED", "REJECTED"]
+
+
+def get_docs(start: int, count: int) -> list[dict]:
+    """Return synthetic corp (1 name) and nr (3 names) docs."""
+    rand = random.Random(start)
+    docs = []
+    for num in range(start, start + count):
+        words = " ".join(rand.sample(WORDS, 3))
+        if num % 3:
+            doc = PossibleConflict(id=f"BC{num:07d}", names=[Name(name=f"{words} LTD.", name_state="CORP")],
+                                   state=rand.choice(CORP_STATES), type="CORP", sub_type="BC",
+                                   corp_num=f"BC{num:07d}", jurisdiction=rand.choice(["BC", "AB", "ON"]))
+        else:
+            doc = PossibleConflict(id=f"NR{num:07d}", names=[Name(name=f"{words} {choice} INC.", name_state="NE",
+                                                                  choice=choice) for choice in (1, 2, 3)],
+                                   state=rand.choice(NR_STATES), type="NR", sub_type="CR",
+                                   nr_num=f"NR{num:07d}", jurisdiction="BC")
+        docs.append(doc.to_dict())
+    return docs
+
+
+def load(url: str, count: int, batch_size: int):
+    """Index the synthetic docs into the core."""
+    for start in range(0, count, batch_size):
+        resp = requests.post(f"{url}/update", json=get_docs(start, min(batch_size, count - start)), timeout=600)
+        resp.raise_for_status()
+    requests.get(f"{url}/update", params={"commit": "true"}, timeout=600).raise_for_status()
+
+
+def no_cache(filter_q: str) -> str:
+    """Return the filter with caching disabled."""
+    if filter_q.startswith("{!"):
+        return filter_q.replace("}", " cache=false}", 1)
+    return "{!cache=false}" + filter_q
+
+
+def get_payload(solr: NamexSolr, flat: bool, term: str, id_filter: dict[str, str]) -> dict:
+    """Return a name search payload with its parent filters built for the mode."""
+    builder = solr.query_builder
+    builder.flat_parent_filters = flat
+    filters = builder.build_filter_clause({"value": term, **id_filter}, True)
+    filters.append(builder.build_facet_query(PCField.STATE, ["ACTIVE", "APPROVED", "CONDITION"], False, True))
+    filters.append(builder.build_facet_query(PCField.JURISDICTION, ["BC"], False, True))
+    filters.append(builder.build_facet_query(NameField.NAME_STATE, ["A", "C", "CORP", "NE"], True, True))
+    return {
+        "query": f"{NameField.NAME_Q.value}:{term}",
+        "filter": [no_cache(filter_q) for filter_q in filters],
+        "limit": 10,
+        "fields": ["id", "score"],
+    }
+
+
+def main():
+    """Run the benchmark for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--solr-url", default="http://localhost:8863/solr")
+    parser.add_argument("--core", default="name_request")
+    parser.add_argument("--load", type=int, default=0, help="index this many synthetic docs first")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+
+    url = f"{args.solr_url}/{args.core}"
+    if args.load:
+        load(url, args.load, args.batch_size)
+
+    solr = NamexSolr("SOLR_SVC_NAMEX")
+    id_filters = [{}, {PCField.CORP_NUM_Q.value: "BC00012"}, {PCField.NR_NUM_Q.value: "NR00003"}]
+    for label, id_filter in zip(["state/jurisdiction", "+ corp num", "+ nr num"], id_filters, strict=True):
+        for flat in (False, True):
+            times = []
+            for run in range(args.runs):
+                payload = get_payload(solr, flat, WORDS[run % len(WORDS)].lower(), id_filter)
+                resp = requests.post(f"{url}/query", json=payload, timeout=60)
+                resp.raise_for_status()
+                times.append(resp.json()["responseHeader"]["QTime"])
+            mode = "flat" if flat else "block join"
+            print(  # noqa: T201
+                f"{label:<20} {mode:<10} median {statistics.median(times):>6.1f}ms  "
+                f"p95 {statistics.quantiles(times, n=20)[-1]:>6.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
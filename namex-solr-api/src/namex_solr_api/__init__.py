@@ -44,6 +44,7 @@ from flask_migrate import Migrate
 
 from flask_jwt_oidc import JwtManager
 from namex_solr_api import models
+from namex_solr_api.common.compression import DecompressRequestMiddleware
 from namex_solr_api.config import DevelopmentConfig, MigrationConfig, ProductionConfig, UnitTestingConfig
 from namex_solr_api.models import db
 from namex_solr_api.resources import internal_bp, ops_bp, v1_bp
@@ -64,6 +65,10 @@ def create_app(environment: str = os.getenv("DEPLOYMENT_ENV", "production"), **k
     app = Flask(__name__)
     app.logger = StructuredLogging(app).get_logger().new(worker_id=str(uuid4()))
     app.config.from_object(CONFIG_MAP.get(environment, ProductionConfig))
+    # NOTE: only the (system role) import endpoints accept compressed bodies
+    app.wsgi_app = DecompressRequestMiddleware(app.wsgi_app,
+                                               app.config["MAX_DECOMPRESSED_REQUEST_SIZE"],
+                                               path_prefix="/internal/solr/import")
 
     db.init_app(app)
 
@@ -0,0 +1,122 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Request body compression helpers (gzip / zstd)."""
+import gzip
+import json
+from http import HTTPStatus
+from io import BytesIO
+
+import zstandard
+
+SUPPORTED_ENCODINGS = ["gzip", "zstd"]
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Return the data compressed with the given content encoding."""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def decompress(data: bytes, encoding: str, max_size: int) -> bytes:
+    """Return the decompressed data (raises a ValueError if invalid or larger than the max_size)."""
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    try:
+        if encoding == "gzip":
+            reader = gzip.GzipFile(fileobj=BytesIO(data))
+        else:
+            reader = zstandard.ZstdDecompressor().stream_reader(data)
+        with reader:
+            chunks = []
+            size = 0
+            # NOTE: read in chunks so a small body can't be expanded past the max_size in memory
+            while chunk := reader.read(min(1024 * 1024, max_size + 1 - size)):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > max_size:
+                    raise ValueError(f"Decompressed body is larger than {max_size} bytes.")
+    except (OSError, EOFError, zstandard.ZstdError) as err:
+        raise ValueError(f"Invalid {encoding} body.") from err
+    return b"".join(chunks)
+
+
+class DecompressRequestMiddleware:
+    """WSGI middleware that decompresses request bodies sent with a Content-Encoding header.
+
+    Only requests under the path_prefix are decompressed (compressed bodies sent anywhere else are rejected) so the
+    other routes can't be used to inflate large bodies before their auth is checked.
+    """
+
+    WIRE_BYTES_KEY = "namex_solr_api.request_wire_bytes"
+
+    def __init__(self, wsgi_app, max_size: int, path_prefix: str = ""):
+        """Initialize the middleware."""
+        self.wsgi_app = wsgi_app
+        self.max_size = max_size
+        self.path_prefix = path_prefix
+
+    @staticmethod
+    def _error_response(start_response, status: HTTPStatus, detail: str):
+        """Return the json error response."""
+        payload = json.dumps({"message": "Invalid payload.", "detail": detail}).encode()
+        start_response(f"{status.value} {status.phrase}",
+                       [("Content-Type", "application/json"), ("Content-Length", str(len(payload)))])
+        return [payload]
+
+    def __call__(self, environ, start_response):
+        """Replace the compressed input stream with the decompressed body before passing the request on."""
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding and encoding != "identity":
+            if not environ.get("PATH_INFO", "").startswith(self.path_prefix):
+                return self._error_response(start_response,
+                                            HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                                            f"Compressed request bodies are only accepted under {self.path_prefix}.")
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            wire_body = environ["wsgi.input"].read(length) if length else environ["wsgi.input"].read()
+            try:
+                body = decompress(wire_body, encoding, self.max_size)
+            except ValueError as err:
+                status = HTTPStatus.UNSUPPORTED_MEDIA_TYPE if encoding not in SUPPORTED_ENCODINGS \
+                    else HTTPStatus.BAD_REQUEST
+                return self._error_response(start_response, status, str(err))
+
+            environ["wsgi.input"] = BytesIO(body)
+            environ["CONTENT_LENGTH"] = str(len(body))
+            environ[self.WIRE_BYTES_KEY] = len(wire_body)
+            del environ["HTTP_CONTENT_ENCODING"]
+
+        return self.wsgi_app(environ, start_response)
@@ -43,6 +43,8 @@ import os
 
 from dotenv import find_dotenv, load_dotenv
 
+from namex_solr_api.common.designations import DEFAULT_DESIGNATIONS
+
 # this will load all the envars from a .env file located in the project root (api)
 load_dotenv(find_dotenv())
 
@@ -61,10 +63,64 @@ class Config:
 
     SOLR_SVC_NAMEX_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_LEADER_CORE", "name_request")
     SOLR_SVC_NAMEX_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_FOLLOWER_CORE", "name_request_follower")
+    # blue/green reindex: core rebuilt from the leader configset and then swapped with the leader core
+    SOLR_SVC_NAMEX_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_SHADOW_CORE", "name_request_shadow")
+    SOLR_SVC_NAMEX_SHADOW_CONFIG_SET = os.getenv("SOLR_SVC_NAMEX_SHADOW_CONFIG_SET", "name_request")
+    # the rebuilt core must have at least this fraction of the live core's docs to be swapped in
+    REINDEX_SWAP_MIN_DOC_RATIO = float(os.getenv("REINDEX_SWAP_MIN_DOC_RATIO", "0.9"))
+    # pending/running reindex jobs not updated within this time are assumed abandoned (i.e. the worker restarted)
+    REINDEX_JOB_STALE_SECONDS = int(os.getenv("REINDEX_JOB_STALE_SECONDS", "3600"))
     SOLR_SVC_NAMEX_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_LEADER_URL", "http://localhost:8863/solr")
     SOLR_SVC_NAMEX_FOLLOWER_URL = os.getenv("SOLR_SVC_NAMEX_FOLLOWER_URL", "http://localhost:8863/solr")
     SOLR_SVC_NAMEX_MAX_ROWS = int(os.getenv("SOLR_SVC_NAMEX_MAX_ROWS", "10000"))
     SOLR_SVC_NAMEX_TIMEOUT = int(os.getenv("SOLR_SVC_NAMEX_TIMEOUT", "60"))
+    # gzip large request bodies sent to solr (requires request inflation enabled in solr's jetty gzip handler)
+    SOLR_SVC_NAMEX_REQUEST_COMPRESSION = os.getenv("SOLR_SVC_NAMEX_REQUEST_COMPRESSION", "")
+    # filter name searches on the denormalized parent_* name fields instead of block joining to the parent docs
+    SOLR_SVC_NAMEX_FLAT_PARENT_FILTERS = os.getenv("SOLR_SVC_NAMEX_FLAT_PARENT_FILTERS", "False") == "True"
+    # use the name docs' precomputed is_conflict_candidate flag for the default possible conflict filters
+    SOLR_SVC_NAMEX_CONFLICT_CANDIDATE_FILTER = os.getenv("SOLR_SVC_NAMEX_CONFLICT_CANDIDATE_FILTER", "False") == "True"
+    # match the full query boosts against the indexed name variants instead of sloppy phrase / dash variant clauses
+    SOLR_SVC_NAMEX_INDEXED_NAME_VARIANTS = os.getenv("SOLR_SVC_NAMEX_INDEXED_NAME_VARIANTS", "False") == "True"
+    # run a cheap exact match query first and only run the full fuzzy / phonetic / synonym query if it doesn't fill
+    # the first page (requests with exhaustive=true always run the full query, later pages pass back the returned tier)
+    SOLR_SVC_NAMEX_TIERED_SEARCH = os.getenv("SOLR_SVC_NAMEX_TIERED_SEARCH", "False") == "True"
+    # send the static search params (fields, highlighting, parents query) as a solr paramset (useParams)
+    SOLR_SVC_NAMEX_USE_PARAM_SETS = os.getenv("SOLR_SVC_NAMEX_USE_PARAM_SETS", "False") == "True"
+    # highlight the returned names in the api instead of asking solr for highlighting
+    SOLR_SVC_NAMEX_LOCAL_HIGHLIGHTING = os.getenv("SOLR_SVC_NAMEX_LOCAL_HIGHLIGHTING", "False") == "True"
+    # fuzzy clause policy: max fuzzy clauses per query (0 for no cap), skip fuzzy clauses on the ngram name fields
+    # and skip them for terms already indexed as is (costs a /terms lookup per query)
+    SOLR_SVC_NAMEX_FUZZY_MAX_CLAUSES = int(os.getenv("SOLR_SVC_NAMEX_FUZZY_MAX_CLAUSES", "0"))
+    SOLR_SVC_NAMEX_FUZZY_SKIP_NGRAM_FIELDS = os.getenv("SOLR_SVC_NAMEX_FUZZY_SKIP_NGRAM_FIELDS", "False") == "True"
+    SOLR_SVC_NAMEX_FUZZY_SKIP_EXACT_TERMS = os.getenv("SOLR_SVC_NAMEX_FUZZY_SKIP_EXACT_TERMS", "False") == "True"
+    # historical tier: docs that can't be possible conflicts (i.e. expired / cancelled / historical states) are kept
+    # in their own cores so possible conflict searches only run against the active docs (unset for a single tier)
+    SOLR_SVC_NAMEX_HISTORICAL_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_LEADER_CORE", "")
+    SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_CORE", "")
+    SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CORE",
+                                                      "name_request_historical_shadow")
+    SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CONFIG_SET = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CONFIG_SET",
+                                                            "name_request")
+    # defaults to the same solr nodes as the active tier
+    SOLR_SVC_NAMEX_HISTORICAL_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_LEADER_URL") or SOLR_SVC_NAMEX_LEADER_URL
+    SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_URL = (os.getenv("SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_URL")
+                                              or SOLR_SVC_NAMEX_FOLLOWER_URL)
+    SOLR_SVC_NAMEX_HISTORICAL_TIMEOUT = SOLR_SVC_NAMEX_TIMEOUT
+    SOLR_SVC_NAMEX_HISTORICAL_REQUEST_COMPRESSION = SOLR_SVC_NAMEX_REQUEST_COMPRESSION
+    # federated cores: the CORP docs are kept in their own cores (own commit / replication cadence and caches) and
+    # searches across both types query the cores in parallel and merge the results (unset to keep them together)
+    SOLR_SVC_NAMEX_CORP_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_LEADER_CORE", "")
+    SOLR_SVC_NAMEX_CORP_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_FOLLOWER_CORE", "")
+    SOLR_SVC_NAMEX_CORP_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_SHADOW_CORE", "name_request_corp_shadow")
+    SOLR_SVC_NAMEX_CORP_SHADOW_CONFIG_SET = os.getenv("SOLR_SVC_NAMEX_CORP_SHADOW_CONFIG_SET", "name_request")
+    SOLR_SVC_NAMEX_CORP_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_CORP_LEADER_URL") or SOLR_SVC_NAMEX_LEADER_URL
+    SOLR_SVC_NAMEX_CORP_FOLLOWER_URL = os.getenv("SOLR_SVC_NAMEX_CORP_FOLLOWER_URL") or SOLR_SVC_NAMEX_FOLLOWER_URL
+    SOLR_SVC_NAMEX_CORP_TIMEOUT = SOLR_SVC_NAMEX_TIMEOUT
+    SOLR_SVC_NAMEX_CORP_REQUEST_COMPRESSION = SOLR_SVC_NAMEX_REQUEST_COMPRESSION
+
+    # Used for compressed (Content-Encoding: gzip/zstd) request bodies
+    MAX_DECOMPRESSED_REQUEST_SIZE = int(os.getenv("MAX_DECOMPRESSED_REQUEST_SIZE", str(200 * 1024 * 1024)))
 
     AUTH_SVC_URL = os.getenv("AUTH_API_URL", "") + os.getenv("AUTH_API_VERSION", "")
 
@@ -75,32 +131,7 @@ class Config:
     
     # Used for search parsing
     DESIGNATIONS = os.getenv("DESIGNATIONS")
-    if not DESIGNATIONS:
-        DESIGNATIONS = [
-            "corp.",
-            "corporation",
-            "inc.",
-            "incorporated",
-            "incorporee",
-            "l.l.c.",
-            "limited",
-            "limited liability co.",
-            "limited liability company",
-            "limited liability PARTNERSHIP",
-            "limitee",
-            "llc",
-            "llp",
-            "ltd.",
-            "ltee",
-            "sencrl",
-            "societe a responsabilite limitee",
-            "societe en nom collectif a responsabilite limitee",
-            "srl",
-            "ulc",
-            "unlimited liability company",
-        ]
-    else:
-        DESIGNATIONS = DESIGNATIONS.lower().split()
+    DESIGNATIONS = DESIGNATIONS.lower().split() if DESIGNATIONS else list(DEFAULT_DESIGNATIONS)
 
     # Cache stuff
     CACHE_TYPE = os.getenv("CACHE_TYPE", "FileSystemCache")
@@ -33,10 +33,11 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """This exports all of the models and schemas used by the application."""
 from .db import db
+from .reindex_job import ReindexJob
 from .search_history import SearchHistory
 from .solr_doc import SolrDoc
 from .solr_doc_event import SolrDocEvent
 from .solr_synonym_list import SolrSynonymList
 from .user import User
 
-__all__ = ("SearchHistory", "SolrDoc", "SolrDocEvent", "SolrSynonymList", "User", "db")
+__all__ = ("ReindexJob", "SearchHistory", "SolrDoc", "SolrDocEvent", "SolrSynonymList", "User", "db")
@@ -0,0 +1,159 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Manages the background reindex jobs (prep/post/recovery etc.) run against the Search Core."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from enum import auto
+
+from sqlalchemy import Column, DateTime, String, event, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from namex_solr_api.common.base_enum import BaseEnum
+
+from .base import Base
+from .db import db
+
+
+class ReindexJob(Base):
+    """Used to hold the status and step progress of a reindex job."""
+
+    class Status(BaseEnum):
+        """Enum of the reindex job statuses."""
+
+        COMPLETE = auto()
+        ERROR = auto()
+        PENDING = auto()
+        RUNNING = auto()
+
+    class Type(BaseEnum):
+        """Enum of the reindex job types."""
+
+        PREP = auto()
+        POST = auto()
+        RECOVERY = auto()
+        SWAP_PREP = auto()
+        SWAP_POST = auto()
+        SWAP_ROLLBACK = auto()
+
+    __tablename__ = "reindex_jobs"
+    # the postgres advisory lock key serializing the job starts (see lock_jobs)
+    LOCK_KEY = 4_740_221
+
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    job_type: Mapped[Type]
+    job_status: Mapped[Status] = mapped_column(default=Status.PENDING.value, index=True)
+    current_step: Mapped[str] = mapped_column(String(100), nullable=True)
+    # [{"name": str, "status": str, "started": iso str, "finished": iso str | None}]
+    steps = Column(JSONB, nullable=False, default=list)
+    error: Mapped[str] = mapped_column(String(1000), nullable=True)
+    created_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
+    last_update: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now())
+
+    @property
+    def json(self) -> dict:
+        """Return the job status as a dict."""
+        return {
+            "jobId": self.id,
+            "type": self.job_type.value,
+            "status": self.job_status.value,
+            "currentStep": self.current_step,
+            "steps": self.steps,
+            "error": self.error,
+            "created": self.created_date.isoformat() if self.created_date else None,
+            "lastUpdate": self.last_update.isoformat() if self.last_update else None,
+        }
+
+    @classmethod
+    def find_by_id(cls, job_id: int) -> ReindexJob | None:
+        """Return the reindex job by its ID."""
+        return cls.query.filter_by(id=job_id).one_or_none()
+
+    @classmethod
+    def find_active(cls, updated_since: datetime) -> ReindexJob | None:
+        """Return the pending/running job updated since the given date (older ones are assumed abandoned)."""
+        return (
+            cls.query.filter(cls.job_status.in_([cls.Status.PENDING, cls.Status.RUNNING]))
+            .filter(cls.last_update > updated_since)
+            .order_by(cls.created_date.desc())
+            .first()
+        )
+
+    @classmethod
+    def lock_jobs(cls):
+        """Block until no other transaction is starting a job (the lock is released on commit/rollback)."""
+        db.session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": cls.LOCK_KEY})
+
+    def heartbeat(self):
+        """Record that the job is still running (so long steps aren't mistaken for an abandoned job)."""
+        self.last_update = datetime.now(UTC)
+        self.save()
+
+    def start_step(self, name: str):
+        """Record the start of the step."""
+        self.job_status = ReindexJob.Status.RUNNING
+        self.current_step = name
+        # NOTE: reassigned (instead of appended) so the JSONB change is detected
+        self.steps = [
+            *self.steps,
+            {"name": name, "status": "RUNNING", "started": datetime.now(UTC).isoformat(), "finished": None},
+        ]
+        self.save()
+
+    def finish_step(self, status: str = "COMPLETE"):
+        """Record the end of the current step."""
+        if not self.steps:
+            return
+        self.steps = [
+            *self.steps[:-1],
+            {**self.steps[-1], "status": status, "finished": datetime.now(UTC).isoformat()},
+        ]
+        self.save()
+
+    def finish(self, error: str | None = None):
+        """Record the end of the job."""
+        if error:
+            self.finish_step("ERROR")
+            self.error = error[:1000]
+        self.job_status = ReindexJob.Status.ERROR if error else ReindexJob.Status.COMPLETE
+        self.current_step = None
+        self.save()
+
+
+@event.listens_for(ReindexJob, "before_update")
+def receive_before_change(mapper, connection, target: ReindexJob):
+    """Set the last updated value."""
+    target.last_update = datetime.now(UTC)
@@ -32,17 +32,54 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """API endpoint for bulk importing records into solr."""
+import json
+import re
 from http import HTTPStatus
 
 from flask import Blueprint, current_app, jsonify, request
 from flask_cors import cross_origin
 
+from namex_solr_api.common.compression import DecompressRequestMiddleware
 from namex_solr_api.exceptions import bad_request_response, exception_response
 from namex_solr_api.models import User
 from namex_solr_api.services import jwt, solr
 
 bp = Blueprint("IMPORT", __name__, url_prefix="/import")
 
+JSON_LIST_START = re.compile(rb"\s*\[")
+JSON_LIST_END = re.compile(rb"\]\s*$")
+
+
+def get_target_core(args: dict) -> str | None:
+    """Return the core to import into (the shadow core during a blue/green reindex, otherwise the leader core)."""
+    return solr.shadow_core if args.get("core") == "shadow" else None
+
+
+def get_pass_through_errors(args: dict, body: bytes) -> list[str]:
+    """Return the envelope errors for a pass through import (docs list body, envelope in the query params)."""
+    errors = []
+    if args.get("type") not in ["full", "partial"]:
+        errors.append('Expecting query param "type" to be one of: "full", "partial".')
+    if not args.get("timeout", "25").isdigit() or int(args.get("timeout", "25")) > 200:  # noqa: PLR2004
+        errors.append('Expecting query param "timeout" to be a number under 200.')
+    if args.get("core", "live") not in ["live", "shadow"]:
+        errors.append('Expecting query param "core" to be one of: "live", "shadow".')
+    if not args.get("count", "").isdigit() or int(args["count"]) < 1:
+        errors.append('Expecting query param "count" to be the (positive) number of docs in the body.')
+    # NOTE: only the list boundaries are checked here, solr will reject any malformed docs
+    if not JSON_LIST_START.match(body) or not JSON_LIST_END.search(body[-64:]):
+        errors.append("Expecting the body to be a json list of possible conflicts.")
+    return errors
+
+
+def get_delete_errors(request_json) -> list[str]:
+    """Return the errors for a delete payload (a list of doc id strings)."""
+    if not isinstance(request_json, dict) or not (ids := request_json.get("ids", [])):
+        return ['Expecting required field: "ids"']
+    if not isinstance(ids, list) or not all(isinstance(doc_id, str) for doc_id in ids):
+        return ['Expecting "ids" to be a list of strings.']
+    return []
+
 
 @bp.put("")
 @cross_origin(origins="*")
@@ -50,6 +87,28 @@ bp = Blueprint("IMPORT", __name__, url_prefix="/import")
 def import_possible_conflicts():
     """Import 'possible conflicts' into namex search SOLR."""
     try:
+        body = request.get_data()
+        if JSON_LIST_START.match(body):
+            # pass through: the body is forwarded to solr as is (avoids building a dict for every doc)
+            if errors := get_pass_through_errors(request.args, body):
+                return bad_request_response("Invalid payload.", errors)
+
+            current_app.logger.debug(
+                f"Forwarding {request.args['count']} raw docs to SOLR: {len(body)} bytes, "
+                f"{request.environ.get(DecompressRequestMiddleware.WIRE_BYTES_KEY, len(body))} bytes on wire")
+            if len(solr.tiers) > 1:
+                # NOTE: the docs are split between the tiers by type / state so they can't be forwarded as is
+                solr.create_or_replace_docs(raw_docs=json.loads(body),
+                                            timeout=int(request.args.get("timeout", "25")),
+                                            core=get_target_core(request.args))
+            else:
+                solr.create_or_replace_raw_docs(payload=body,
+                                                doc_count=int(request.args["count"]),
+                                                timeout=int(request.args.get("timeout", "25")),
+                                                core=get_target_core(request.args))
+            current_app.logger.debug("Import completed.")
+            return jsonify({"message": "Import finished."}), HTTPStatus.CREATED
+
         request_json: dict = request.json
         if not (doc_list := request_json.get("possibleConflicts", [])):
             return bad_request_response("Invalid payload.", ['Expecting required field: "possibleConflicts"'])
@@ -72,3 +131,23 @@ def import_possible_conflicts():
 
     except Exception as exception:
         return exception_response(exception)
+
+
+@bp.post("/delete")
+@cross_origin(origins="*")
+@jwt.requires_roles([User.Role.system.value])
+def delete_possible_conflicts():
+    """Delete 'possible conflicts' (and their name child docs) from namex search SOLR."""
+    try:
+        request_json: dict = request.json
+        if errors := get_delete_errors(request_json):
+            return bad_request_response("Invalid payload.", errors)
+        ids = request_json["ids"]
+
+        current_app.logger.debug(f"Deleting {len(ids)} docs from SOLR...")
+        solr.delete_docs_by_id(ids, core=get_target_core(request.args))
+        current_app.logger.debug("Delete completed.")
+        return jsonify({"message": "Delete finished."}), HTTPStatus.OK
+
+    except Exception as exception:
+        return exception_response(exception)
@@ -31,167 +31,95 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+"""API endpoints for granular reindex operations in SOLR.
 
-"""API endpoints for granular reindex operations in SOLR."""
+Each operation is started as a background job (202 with the job id) and the job status is polled via
+GET /reindex/jobs/<job_id> so the api workers aren't tied up while waiting on solr.
+"""
 
-from datetime import UTC, datetime
 from http import HTTPStatus
-from time import sleep
 
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, jsonify, url_for
 from flask_cors import cross_origin
 
-from namex_solr_api.exceptions import SolrException, exception_response
-from namex_solr_api.models import User
-from namex_solr_api.services import jwt, solr
+from namex_solr_api.exceptions import exception_response
+from namex_solr_api.models import ReindexJob, User
+from namex_solr_api.services import jwt
+from namex_solr_api.services.reindex_jobs import start_reindex_job
 
 bp = Blueprint("REINDEX", __name__, url_prefix="/reindex")
 
 
-# -----------------------------
-# Helper function
-# -----------------------------
-def get_replication_detail(field: str, leader: bool):
-    """Return the replication detail for the core, safely handling optional follower."""
-    details: dict = solr.replication("details", leader).json().get("details", {})
-
-    # Remove unwanted data
-    if field != "commits" and "commits" in details:
-        del details["commits"]
-
-    follower_details = details.get("follower", {})  # safe fallback
-    if not leader and field != "leaderDetails" and "leaderDetails" in follower_details:
-        del follower_details["leaderDetails"]
-
-    current_app.logger.debug("Full replication details: %s", details)
+def _start_job_response(job_type: ReindexJob.Type):
+    """Start the job and return its status (409 with the other job's status if one is already in progress)."""
+    try:
+        job, started = start_reindex_job(job_type)
+        if not started:
+            return jsonify({"message": "Another reindex job is in progress.", **job.json}), HTTPStatus.CONFLICT
 
-    if leader:
-        return details.get(field)
-    return follower_details.get(field)
+        resp = jsonify({"message": f"Reindex job {job_type.value} started.", **job.json})
+        resp.headers["Location"] = url_for("INTERNAL.SOLR.REINDEX.get_reindex_job", job_id=job.id)
+        return resp, HTTPStatus.ACCEPTED
+    except Exception as err:
+        return exception_response(err)
 
 
-# -----------------------------
-# Reindex Prep
-# -----------------------------
 @bp.post("/prep")
 @cross_origin(origins="*")
 @jwt.requires_roles([User.Role.system.value])
 def reindex_prep_endpoint():
-    """Execute pre-reindex operations (backup, disable polling, delete index)."""
-    try:
-        backup_trigger_time = datetime.now(UTC)
-        current_app.logger.debug("Triggering leader backup...")
-        backup = solr.replication("backup", True)
-        current_app.logger.debug(backup.json())
-
-        if current_app.config.get("HAS_FOLLOWER", True):
-            disable_polling = solr.replication("disablepoll", False)
-            current_app.logger.debug(disable_polling.json())
-
-        current_app.logger.debug("Pausing 60s for backup/polling...")
-        sleep(60)
-
-        # Verify backup
-        backup_succeeded = False
-        for i in range(20):
-            current_app.logger.debug(f"Checking new backup {i+1}/20...")
-            if backup_detail := get_replication_detail("backup", True):
-                start_time_str = backup_detail.get("startTime")
-                if start_time_str and backup_detail.get("status") == "success":
-                    backup_start_time = datetime.fromisoformat(start_time_str)
-                    if backup_trigger_time < backup_start_time:
-                        backup_succeeded = True
-                        break
-            sleep(30 + (i*2))
-
-        if not backup_succeeded:
-            raise SolrException("Failed to backup leader index", HTTPStatus.INTERNAL_SERVER_ERROR)
-
-        if current_app.config.get("HAS_FOLLOWER", True):
-            is_polling_disabled = get_replication_detail("isPollingDisabled", False)
-            if is_polling_disabled is None:
-                current_app.logger.warning("Follower details missing; cannot verify polling status.")
-            elif not bool(is_polling_disabled):
-                raise SolrException(
-                    "Failed to disable polling on follower",
-                    str(is_polling_disabled),
-                    HTTPStatus.INTERNAL_SERVER_ERROR,
-                )
-
-            disable_replication = solr.replication("disablereplication", True)
-            current_app.logger.debug(disable_replication.json())
-
-        # Delete index
-        current_app.logger.debug("Deleting all documents in SOLR core...")
-        solr.delete_all_docs()
-
-        return jsonify({"message": "Pre-reindex steps completed successfully."}), HTTPStatus.OK
-    except Exception as err:
-        current_app.logger.exception("Pre-reindex failed.")
-        return exception_response(err)
+    """Start the pre-reindex operations (backup, disable polling, delete index)."""
+    return _start_job_response(ReindexJob.Type.PREP)
 
 
-# -----------------------------
-# Reindex Post
-# -----------------------------
 @bp.post("/post")
 @cross_origin(origins="*")
 @jwt.requires_roles([User.Role.system.value])
 def reindex_post_endpoint():
-    """Execute post-reindex operations on the follower."""
-    try:
-        if current_app.config.get("HAS_FOLLOWER", True):
-            enable_replication = solr.replication("enablereplication", True)
-            current_app.logger.debug(enable_replication.json())
-            sleep(5)
+    """Start the post-reindex operations on the follower."""
+    return _start_job_response(ReindexJob.Type.POST)
 
-            fetch_new_idx = solr.replication("fetchindex", False)
-            current_app.logger.debug(fetch_new_idx.json())
-            sleep(10)
 
-            enable_polling = solr.replication("enablepoll", False)
-            current_app.logger.debug(enable_polling.json())
+@bp.post("/recovery")
+@cross_origin(origins="*")
+@jwt.requires_roles([User.Role.system.value])
+def reindex_recovery_endpoint():
+    """Start the restore of the leader index (and re-enable follower polling if needed)."""
+    return _start_job_response(ReindexJob.Type.RECOVERY)
 
-        return jsonify({"message": "Post-reindex steps completed successfully."}), HTTPStatus.OK
-    except Exception as err:
-        current_app.logger.exception("Post-reindex failed.")
-        return exception_response(err)
 
+@bp.post("/swap/prep")
+@cross_origin(origins="*")
+@jwt.requires_roles([User.Role.system.value])
+def reindex_swap_prep_endpoint():
+    """Start the creation of an empty shadow core to rebuild the index into."""
+    return _start_job_response(ReindexJob.Type.SWAP_PREP)
 
-# -----------------------------
-# Reindex Recovery
-# -----------------------------
-@bp.post("/recovery")
+
+@bp.post("/swap/post")
 @cross_origin(origins="*")
 @jwt.requires_roles([User.Role.system.value])
-def reindex_recovery_endpoint():
-    """Restore leader index and re-enable follower polling if needed."""
+def reindex_swap_post_endpoint():
+    """Start warming the rebuilt shadow core and swapping it in (the previous index is kept as the shadow)."""
+    return _start_job_response(ReindexJob.Type.SWAP_POST)
+
+
+@bp.post("/swap/rollback")
+@cross_origin(origins="*")
+@jwt.requires_roles([User.Role.system.value])
+def reindex_swap_rollback_endpoint():
+    """Start swapping the previous index (kept as the shadow core) back in."""
+    return _start_job_response(ReindexJob.Type.SWAP_ROLLBACK)
+
+
+@bp.get("/jobs/<int:job_id>")
+@cross_origin(origins="*")
+@jwt.requires_roles([User.Role.system.value])
+def get_reindex_job(job_id: int):
+    """Return the status and step progress of the reindex job."""
     try:
-        restore = solr.replication("restore", True)
-        current_app.logger.debug(restore.json())
-        current_app.logger.debug("Awaiting restore completion...")
-
-        for i in range(100):
-            current_app.logger.debug(f"Checking restore status {i+1}/100...")
-            status = solr.replication("restorestatus", True)
-            current_app.logger.debug(status.json())
-            status_json = status.json()
-            restore_status = status_json.get("restorestatus", {}).get("status")
-            if restore_status == "success":
-                current_app.logger.debug("Restore complete.")
-                enable_replication = solr.replication("enablereplication", True)
-                current_app.logger.debug(enable_replication.json())
-                sleep(5)
-
-                enable_polling = solr.replication("enablepolling", False)
-                current_app.logger.debug(enable_polling.json())
-                return jsonify({"message": "Recovery completed successfully."}), HTTPStatus.OK
-            if status_json.get("status") == "failed":
-                break
-            sleep(10 + (i*2))
-
-        current_app.logger.error("Possible failure to restore leader index. Manual intervention required.")
-        return jsonify({"message": "Recovery may have failed; check logs."}), HTTPStatus.INTERNAL_SERVER_ERROR
+        if not (job := ReindexJob.find_by_id(job_id)):
+            return jsonify({"message": f"Reindex job {job_id} not found."}), HTTPStatus.NOT_FOUND
+        return jsonify(job.json), HTTPStatus.OK
     except Exception as err:
-        current_app.logger.exception("Recovery failed.")
         return exception_response(err)
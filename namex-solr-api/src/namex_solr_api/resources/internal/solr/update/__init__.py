@@ -33,7 +33,6 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Exposes all of the update endpoints in Flask-Blueprint style."""
 import re
-from dataclasses import asdict
 from http import HTTPStatus
 
 from flask import Blueprint, g, jsonify, request
@@ -72,7 +71,7 @@ def update_possible_conflict():
 
         possible_conflict = _parse_conflict(request_json)
         # Commit Possible Conflict. Ensures other flows (i.e. resync) will use the current data
-        solr_doc = SolrDoc(doc=asdict(possible_conflict), entity_id=possible_conflict.id, submitter_id=user.id)
+        solr_doc = SolrDoc(doc=possible_conflict.to_dict(), entity_id=possible_conflict.id, submitter_id=user.id)
         solr_doc.save()
         SolrDocEvent(event_type=SolrDocEvent.Type.UPDATE.value, solr_doc_id=solr_doc.id).save()
         # SOLR update will be triggered by job (does a frequent bulk update to solr)
@@ -109,7 +109,7 @@ def _resync_solr(identifiers: list[str]):
         doc_events.append(doc_event)
     try:
         if len(possible_conflicts) > 0:
-            solr.create_or_replace_docs(possible_conflicts, additive=False)
+            solr.create_or_replace_docs(possible_conflicts, additive=False, remove_moved=True)
             SolrDocEvent.update_events_status(SolrDocEvent.Status.COMPLETE, doc_events)
 
     except Exception as err:
@@ -96,7 +96,9 @@ def sync_follower_heartbeat():
             else:
                 current_app.logger.debug(f"Verifying sync for: {doc_obj_to_verify.entity_id}...")
                 expected_doc: dict = doc_obj_to_verify.doc
-                response = solr.query({"query": f"id:{expected_doc['id']}", "fields": "*, [child]"})
+                # NOTE: the doc is in the tier for its type / state when the index is split
+                response = solr.get_doc_tier(expected_doc).query({"query": f"id:{expected_doc['id']}",
+                                                                  "fields": "*, [child]"})
                 actual_doc: dict = response["response"]["docs"][0] if response["response"]["docs"] else {}
 
                 if not _is_synced(actual_doc, expected_doc):
@@ -123,7 +125,7 @@ def _update_solr(entity_ids: list[str], doc_events: list[SolrDocEvent]):
         possible_conflicts.append(PossibleConflict(**doc_update.doc))
     try:
         # update people
-        solr.create_or_replace_docs(possible_conflicts, additive=False)
+        solr.create_or_replace_docs(possible_conflicts, additive=False, remove_moved=True)
         SolrDocEvent.update_events_status(SolrDocEvent.Status.COMPLETE, doc_events)
 
     except Exception as err:
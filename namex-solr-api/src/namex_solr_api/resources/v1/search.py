@@ -33,7 +33,6 @@
 # POSSIBILITY OF SUCH DAMAGE.
 # TODO: add search endpoints replicating namex queries ? Maybe don't need this
 """Exposes all of the search endpoints in Flask-Blueprint style."""
-import re
 from http import HTTPStatus
 
 from flask import Blueprint, jsonify, request
@@ -44,8 +43,21 @@ from namex_solr_api.exceptions import exception_response
 from namex_solr_api.models import SearchHistory, User
 from namex_solr_api.services import jwt, solr
 from namex_solr_api.services.base_solr.utils import QueryParams
-from namex_solr_api.services.namex_solr.doc_models import NameField, PCField
-from namex_solr_api.services.namex_solr.utils import namex_search, normalize_nr_num, prep_query_str_namex
+from namex_solr_api.services.namex_solr.doc_models import (
+    CONFLICT_EXCLUDED_SUB_TYPES,
+    CONFLICT_NAME_STATES,
+    CONFLICT_STATES,
+    NameField,
+    PCField,
+)
+from namex_solr_api.services.namex_solr.utils import (
+    apply_conflict_candidate_filter,
+    classify_highlights,
+    get_local_highlights,
+    namex_search,
+    normalize_nr_num,
+    prep_query_str_namex,
+)
 
 bp = Blueprint("SEARCH", __name__, url_prefix="/search")
 
@@ -75,7 +87,7 @@ def possible_conflict_names():
         # set faceted category params
         categories_json: dict = request_json.get("categories", {})
         # TODO: verify these states
-        conflict_states = ["ACTIVE", "APPROVED", "CONDITION", "ACT", "LIQ"]
+        conflict_states = sorted(CONFLICT_STATES)
         categories = {
             PCField.JURISDICTION: categories_json.get(PCField.JURISDICTION.value, None),
             PCField.STATE: categories_json.get(PCField.STATE.value, conflict_states)
@@ -86,7 +98,7 @@ def possible_conflict_names():
         }
         # set nested child faceted category params
         # TODO: verify these states
-        conflict_name_states = ["A", "C", "CORP"]
+        conflict_name_states = sorted(CONFLICT_NAME_STATES)
         child_categories = {
             NameField.NAME_STATE: categories_json.get(NameField.NAME_STATE.value, conflict_name_states)
         }
@@ -102,7 +114,9 @@ def possible_conflict_names():
             child_query=child_query,
             child_categories=child_categories,
             fields=solr.resp_fields_nested,
-            highlighted_fields=[NameField.NAME_Q_SINGLE, NameField.NAME_Q_STEM_HIGHLIGHT, NameField.NAME_Q_PHON_EN, NameField.NAME_Q_SYN],
+            highlighted_fields=[] if solr.local_highlighting else [
+                NameField.NAME_Q_SINGLE, NameField.NAME_Q_STEM_HIGHLIGHT, NameField.NAME_Q_PHON_EN, NameField.NAME_Q_SYN
+            ],
             query_boost_fields={
                 NameField.NAME_Q_AGRO: 2,
                 NameField.NAME_Q_SINGLE: 2,
@@ -122,54 +136,36 @@ def possible_conflict_names():
                 NameField.NAME_Q_AGRO: {"short": 1, "long": 2},
                 NameField.NAME_Q_SINGLE: {"short": 0, "long": 2}
             },
+            precise_query_fields={
+                NameField.NAME_Q: "child",
+                NameField.NAME_Q_XTRA: "child",
+            },
+            exhaustive=request_json.get("exhaustive", False),
+            tier=request_json.get("tier"),
+            param_set=solr.name_search_param_set,
             query_synonym_fields={
                 NameField.NAME_Q_SYN: "child"
             },
             full_query_boosts=solr.get_name_search_full_query_boost(value),
             # TODO: add this as LD flag ? names ticket: #32885
-            exclude_sub_types=["DBA", "FR", "GP", "LL", "LP"]
+            exclude_sub_types=sorted(CONFLICT_EXCLUDED_SUB_TYPES)
         )
+        apply_conflict_candidate_filter(params, solr)
 
         results = namex_search(params, solr, True)
         solr_highlighting: dict[str, dict[str, list[str]]] = results.get("highlighting", {})
-        docs = []
-        for result in results.get("response", {}).get("docs"):
-            def split_highlights(highlights: list[str]):
-                """Split list of strings into list of single terms, removing HTML tags"""
-                resp = []
-                for highlight in highlights:
-                    clean = re.sub(r'<[^>]+>', '', highlight)
-                    resp += [term for term in clean.upper().split(" ") if term]
-                return resp
-
-            highlight_raw = solr_highlighting.get(result[NameField.UNIQUE_KEY.value], {})
-            exact_highlights = []
-            stem_highlights = []
-            phonetic_highlights = []
-            synonym_highlights = []
-            if exact_highlights_full_terms := highlight_raw.get(NameField.NAME_Q_SINGLE.value, []):
-                exact_highlights_full_terms = split_highlights(exact_highlights_full_terms)
-                for term in params.query["value"].split(" "):
-                    if any(x for x in exact_highlights_full_terms if term.upper() in x):
-                        exact_highlights.append(term.upper())
-            if stem_highlights := highlight_raw.get(NameField.NAME_Q_STEM_HIGHLIGHT.value, []):
-                stem_highlights = [x for x in split_highlights(stem_highlights) if x not in (exact_highlights)]
-            if phonetic_highlights := highlight_raw.get(NameField.NAME_Q_PHON_EN.value, []):
-                other_highlights = exact_highlights + stem_highlights
-                phonetic_highlights = [x.upper() for x in split_highlights(phonetic_highlights) if x.upper() not in other_highlights and x.strip()]
-            if synonym_highlights := highlight_raw.get(NameField.NAME_Q_SYN.value, []):
-                other_highlights = exact_highlights + stem_highlights + phonetic_highlights
-                synonym_highlights = [x.upper() for x in synonym_highlights if x.upper() not in other_highlights]
-            docs.append({
-                **result,
-                "name": result["name"].upper(),
-                "highlighting": {
-                    "exact": list(set(exact_highlights)),
-                    "stems": list(set(stem_highlights)),
-                    "phonetic": list(set(phonetic_highlights)),
-                    "synonyms": list(set(synonym_highlights))
-                }
-            })
+        results_docs = results.get("response", {}).get("docs")
+        if solr.local_highlighting:
+            highlights = get_local_highlights(params.query["value"], [result["name"] for result in results_docs])
+        else:
+            highlights = classify_highlights(
+                params.query["value"],
+                [solr_highlighting.get(result[NameField.UNIQUE_KEY.value], {}) for result in results_docs]
+            )
+        docs = [
+            {**result, "name": result["name"].upper(), "highlighting": highlight}
+            for result, highlight in zip(results_docs, highlights, strict=True)
+        ]
         # save search in the db
         SearchHistory(
             query=request_json,
@@ -192,6 +188,7 @@ def possible_conflict_names():
                     },
                     "rows": rows or solr.default_rows,
                     "start": start or solr.default_start,
+                    "tier": results.get("tier"),
                 },
                 "totalResults": results.get("response", {}).get("numFound"),
                 "results": docs
@@ -270,6 +267,15 @@ def nrs():
                 NameField.NAME_Q_AGRO: {"short": 1, "long": 2},
                 NameField.NAME_Q_SINGLE: {"short": 1, "long": 2}
             },
+            precise_query_fields={
+                PCField.NR_NUM_Q: "parent",
+                PCField.NR_NUM_Q_EDGE: "parent",
+                NameField.NAME_Q: "child",
+                NameField.NAME_Q_XTRA: "child",
+            },
+            exhaustive=request_json.get("exhaustive", False),
+            tier=request_json.get("tier"),
+            param_set=solr.nr_search_param_set,
             query_synonym_fields={
                 NameField.NAME_Q_SYN: "child"
             },
@@ -296,6 +302,7 @@ def nrs():
                     },
                     "rows": rows or solr.default_rows,
                     "start": start or solr.default_start,
+                    "tier": results.get("tier"),
                 },
                 "totalResults": results.get("response", {}).get("numFound"),
                 "results": docs,
@@ -33,6 +33,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """This module wraps the solr classes/fields for using solr."""
 
+import json
 from contextlib import suppress
 from http import HTTPStatus
 
@@ -42,6 +43,7 @@ from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import ConnectionError as SolrConnectionError
 
 from namex_solr_api.common.base_enum import BaseEnum
+from namex_solr_api.common.compression import compress
 from namex_solr_api.exceptions import SolrException
 
 
@@ -56,6 +58,11 @@ class Solr:
         # solr cores
         self.follower_core = None
         self.leader_core = None
+        # blue/green reindex: the core rebuilt and then swapped with the leader core (keeps the previous index)
+        self.shadow_core = None
+        self.shadow_config_set = None
+        # queries run against a rebuilt core before it is swapped in
+        self.warm_queries = [{"query": "*:*", "limit": 0}]
         # solr urls
         self.follower_url = None
         self.leader_url = None
@@ -64,11 +71,15 @@ class Solr:
         self.retry_backoff = 0
         # request timeout (seconds)
         self.solr_timeout = 60
+        # request body compression (solr/jetty only inflates gzip request bodies)
+        self.request_compression = None
+        self.compression_min_size = 16 * 1024
 
         self.default_start = 0
         self.default_rows = 10
 
         # base urls
+        self.core_admin_url = "{url}/admin/cores"
         self.reload_url = "{url}/admin/cores?action=RELOAD&core={core}"
         self.replication_url = "{url}/{core}/replication"
         self.search_url = "{url}/{core}/query"
@@ -85,9 +96,15 @@ class Solr:
         self.retry_total = app.config.get("SOLR_RETRY_TOTAL", 2)
         self.retry_backoff = app.config.get("SOLR_RETRY_BACKOFF_FACTOR", 5)
         self.solr_timeout = app.config.get(f"{self.config_prefix}_TIMEOUT", 60)
+        if request_compression := app.config.get(f"{self.config_prefix}_REQUEST_COMPRESSION"):
+            if request_compression != "gzip":
+                raise ValueError(f"Unsupported solr request compression: {request_compression}")
+            self.request_compression = request_compression
         # NOTE: for a single core implementation set leader/follower cores the same
         self.leader_core = app.config.get(f"{self.config_prefix}_LEADER_CORE")
         self.follower_core = app.config.get(f"{self.config_prefix}_FOLLOWER_CORE")
+        self.shadow_core = app.config.get(f"{self.config_prefix}_SHADOW_CORE", f"{self.leader_core}_shadow")
+        self.shadow_config_set = app.config.get(f"{self.config_prefix}_SHADOW_CONFIG_SET", self.leader_core)
         # NOTE: for a single node implementation set the leader/follower urls the same
         self.leader_url = app.config.get(f"{self.config_prefix}_LEADER_URL")
         self.follower_url = app.config.get(f"{self.config_prefix}_FOLLOWER_URL")
@@ -99,10 +116,12 @@ class Solr:
                   json_data: dict | None = None,
                   xml_data: str | None = None,
                   leader=True,
-                  timeout=None) -> Response:
-        """Call solr instance with given params."""
+                  timeout=None,
+                  raw_data: bytes | None = None,
+                  core: str | None = None) -> Response:
+        """Call solr instance with given params (core overrides the leader/follower core)."""
         base_url = self.leader_url if leader else self.follower_url
-        core = self.leader_core if leader else self.follower_core
+        core = core or (self.leader_core if leader else self.follower_core)
         url = query.format(url=base_url, core=core)
         if timeout is None:
             timeout = self.solr_timeout
@@ -113,17 +132,25 @@ class Solr:
         session = Session()
         session.mount(url, HTTPAdapter(max_retries=retries))
 
+        if self.request_compression and method == "POST" and json_data:
+            # serialize here so the body can be compressed below
+            raw_data, json_data = json.dumps(json_data).encode(), None
+
         response = None
         try:
             if method == "GET":
                 response = session.get(url, params=params, timeout=timeout)
             elif method == "POST" and json_data:
-                response = session.post(url=url, json=json_data, timeout=timeout)
+                response = session.post(url=url, json=json_data, params=params, timeout=timeout)
             elif method == "PUT" and json_data:
                 response = session.put(url=url, json=json_data, timeout=timeout)
             elif method == "POST" and xml_data:
                 headers = {"Content-Type": "application/xml"}
                 response = session.post(url=url, data=xml_data, headers=headers, timeout=timeout)
+            elif method == "POST" and raw_data:
+                # NOTE: already serialized json (i.e. passed through from the request) so send as is
+                wire_data, headers = self._encode_request_body(raw_data)
+                response = session.post(url=url, data=wire_data, headers=headers, params=params, timeout=timeout)
             else:
                 current_app.logger.debug(
                     f"Invalid function params: {method}, {query}, {params}, {json_data}, {xml_data}")
@@ -143,7 +170,7 @@ class Solr:
         except Exception as err:
             current_app.logger.debug(err.with_traceback(None))
             current_app.logger.debug("method: %s, query: %s, params: %s, data: %s",
-                                     method, query, params, xml_data or json_data)
+                                     method, query, params, xml_data or json_data or f"{len(raw_data or b'')} bytes")
             msg = "Error handling Solr request."
             status_code = HTTPStatus.INTERNAL_SERVER_ERROR
             with suppress(Exception):
@@ -152,10 +179,26 @@ class Solr:
             current_app.logger.debug(msg)
             raise SolrException(error=msg, status_code=status_code) from err
 
+    def _encode_request_body(self, raw_data: bytes) -> tuple[bytes, dict]:
+        """Return the (compressed if configured and large enough) json request body and its headers."""
+        headers = {"Content-Type": "application/json"}
+        if not self.request_compression or len(raw_data) < self.compression_min_size:
+            return raw_data, headers
+        wire_data = compress(raw_data, self.request_compression)
+        headers["Content-Encoding"] = self.request_compression
+        current_app.logger.debug(
+            f"Solr request body: {len(raw_data)} bytes, {len(wire_data)} bytes on wire ({self.request_compression})")
+        return wire_data, headers
+
     def create_or_update_synonyms(self, synonym_type: BaseEnum, synonyms: dict[str: list[str]]):
         """Create or update solr docs in the core."""
         return self.call_solr("PUT", f"{self.synonyms_url}/{synonym_type.value}", json_data=synonyms, timeout=180)
 
+    def create_or_replace_raw_docs(self, payload: bytes, doc_count: int, timeout=25, core: str | None = None):
+        """Create or replace solr docs in the core from an already serialized json list of docs."""
+        url = self.update_url if doc_count < 1000 else self.bulk_update_url  # noqa: PLR2004
+        return self.call_solr("POST", url, raw_data=payload, timeout=timeout, core=core)
+
     def delete_all_docs(self):
         """Delete all solr docs from the core."""
         payload = "<delete><query>*:*</query></delete>"
@@ -174,13 +217,57 @@ class Solr:
         response = self.call_solr("POST", self.update_url, xml_data=payload, timeout=60)
         return response
 
-    def query(self, payload: dict[str, str], start: int | None = None, rows: int | None = None) -> dict:
-        """Return a list of solr docs from the solr query handler for the given params."""
+    def delete_docs_by_id(self, unique_keys: list[str], timeout=60, core: str | None = None):
+        """Delete solr docs (including their nested child docs) from the core by id."""
+        payload = {"delete": [key.upper() for key in unique_keys]}
+        return self.call_solr("POST", self.update_url, json_data=payload, timeout=timeout, core=core)
+
+    def query(self,
+              payload: dict[str, str],
+              start: int | None = None,
+              rows: int | None = None,
+              params: dict | None = None) -> dict:
+        """Return a list of solr docs from the solr query handler for the given params (params go in the url)."""
         payload["offset"] = start if start else self.default_start
         payload["limit"] = rows if rows else self.default_rows
-        response = self.call_solr("POST", self.search_url, json_data=payload, leader=False)
+        response = self.call_solr("POST", self.search_url, params=params, json_data=payload, leader=False)
         return response.json()
 
+    def core_admin(self, action: str, timeout=None, **params) -> dict:
+        """Send a CoreAdmin action to the leader node."""
+        current_app.logger.info(f"Sending CoreAdmin {action}: {params}")
+        resp = self.call_solr("GET", self.core_admin_url, params={"action": action, **params}, timeout=timeout)
+        return resp.json()
+
+    def core_exists(self, core: str) -> bool:
+        """Return True if the core is loaded on the leader node."""
+        return bool(self.core_admin("STATUS", core=core).get("status", {}).get(core))
+
+    def create_shadow_core(self):
+        """Create an empty shadow core (replacing the one kept from the previous swap)."""
+        if self.core_exists(self.shadow_core):
+            self.core_admin("UNLOAD", core=self.shadow_core, deleteIndex="true", deleteDataDir="true")
+        return self.core_admin("CREATE",
+                               timeout=180,
+                               name=self.shadow_core,
+                               instanceDir=self.shadow_core,
+                               configSet=self.shadow_config_set)
+
+    def get_doc_count(self, core: str | None = None) -> int:
+        """Return the number of (parent and child) docs in the core."""
+        resp = self.call_solr("POST", self.search_url, json_data={"query": "*:*", "limit": 0}, core=core)
+        return resp.json()["response"]["numFound"]
+
+    def warm_core(self, core: str):
+        """Commit and run the warm queries against the core so it's ready to serve when swapped in."""
+        self.call_solr("POST", self.update_url, json_data={"commit": {}}, timeout=180, core=core)
+        for payload in self.warm_queries:
+            self.call_solr("POST", self.search_url, json_data=payload, timeout=180, core=core)
+
+    def swap_shadow_core(self):
+        """Atomically swap the shadow core with the leader core (the previous index is kept as the shadow)."""
+        return self.core_admin("SWAP", timeout=180, core=self.leader_core, other=self.shadow_core)
+
     def reload_core(self):
         """Reload the solr core."""
         current_app.logger.info("Reloading core...")
@@ -33,5 +33,6 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """This module manages helpful util functions for using the solr service."""
 from .formatting_helpers import parse_facets, prep_query_str
+from .fuzzy_policy import FuzzyPlan, FuzzyPolicy
 from .query_builder import QueryBuilder
 from .query_params import QueryParams
@@ -0,0 +1,84 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Solr fuzzy clause policy."""
+from collections.abc import Callable, Iterable
+
+
+class FuzzyPolicy:
+    """Decides which of a query's terms / fields get a fuzzy clause.
+
+    The default (no limits) adds a fuzzy clause on every fuzzy field for every term long enough to be fuzzed.
+    The policy can also cap the fuzzy clauses per query, skip fields where fuzzy expansion is expensive and
+    redundant (i.e. ngram analyzed fields) and skip terms that are already indexed as is (looked up once per
+    query with exact_terms_lookup).
+    """
+
+    def __init__(self,
+                 max_clauses: int = 0,
+                 skip_fields: Iterable[str] = (),
+                 exact_terms_lookup: Callable[[list[str]], set[str]] | None = None):
+        """Initialize the policy (0 max_clauses for no cap)."""
+        self.max_clauses = max_clauses
+        self.skip_fields = frozenset(skip_fields)
+        self.exact_terms_lookup = exact_terms_lookup
+
+    def plan(self, terms: list[str]) -> "FuzzyPlan":
+        """Return the fuzzy clause plan for a query's terms."""
+        exact_terms = set()
+        if self.exact_terms_lookup and terms:
+            exact_terms = self.exact_terms_lookup([term.replace("\\", "") for term in terms])
+        return FuzzyPlan(self, exact_terms)
+
+
+class FuzzyPlan:
+    """Keeps the fuzzy clause budget of a single query (the policy is shared across requests)."""
+
+    def __init__(self, policy: FuzzyPolicy, exact_terms: set[str]):
+        """Initialize the plan."""
+        self.policy = policy
+        self.exact_terms = exact_terms
+        self.remaining = policy.max_clauses or None
+        self.skipped = 0
+
+    def allow(self, field_value: str, term: str) -> bool:
+        """Return True if the term gets a fuzzy clause on the field (counting it against the budget)."""
+        if field_value in self.policy.skip_fields or term.replace("\\", "").lower() in self.exact_terms:
+            self.skipped += 1
+            return False
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                self.skipped += 1
+                return False
+            self.remaining -= 1
+        return True
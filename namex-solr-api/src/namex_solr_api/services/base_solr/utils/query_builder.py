@@ -36,6 +36,8 @@ import re
 
 from namex_solr_api.common.base_enum import BaseEnum
 
+from .fuzzy_policy import FuzzyPlan, FuzzyPolicy
+
 
 class QueryBuilder:
     """Manages shared query building code."""
@@ -43,23 +45,40 @@ class QueryBuilder:
     pre_child_filter_clause = None
     pre_parent_filter_clause = None
     synonym_field_map = None
-
-    def __init__(self, identifier_field_values: list[str], unique_parent_field: BaseEnum, synonym_field_map: dict[BaseEnum, BaseEnum]):
+    parent_field_map = None
+    flat_parent_filters = False
+    fuzzy_policy = None
+
+    def __init__(self,
+                 identifier_field_values: list[str],
+                 unique_parent_field: BaseEnum,
+                 synonym_field_map: dict[BaseEnum, BaseEnum],
+                 parent_field_map: dict[BaseEnum, BaseEnum] | None = None,
+                 fuzzy_policy: FuzzyPolicy | None = None):
         """Initialize the solr class."""
         self.identifier_field_values = identifier_field_values
         self.pre_child_filter_clause = "{!parent which=\"" + unique_parent_field.value + ":*\"}"
         self.pre_parent_filter_clause = "{!child of=\"" + unique_parent_field.value + ":*\"}"
         self.synonym_field_map = synonym_field_map
+        # parent field -> equivalent denormalized child field (used instead of the block join when flat_parent_filters)
+        self.parent_field_map = {parent.value: child.value for parent, child in (parent_field_map or {}).items()}
+        self.fuzzy_policy = fuzzy_policy or FuzzyPolicy()
+
+    def get_search_field(self, field_value: str, is_child: bool, is_child_search: bool) -> str:
+        """Return the field to query for the searched doc level (joined to the other level if needed)."""
+        if is_child and not is_child_search:
+            return self.pre_child_filter_clause + field_value
+        if not is_child and is_child_search:
+            if self.flat_parent_filters and (child_field_value := self.parent_field_map.get(field_value)):
+                return child_field_value
+            return self.pre_parent_filter_clause + field_value
+        return field_value
 
     def create_clause(self, field_value: str, term: str, is_child: bool, is_child_search: bool) -> str:
         """Return the query clause for the field and term."""
         corp_prefix_regex = r"(^[aA-zZ]+)[0-9]+$"
 
-        search_field = field_value
-        if is_child and not is_child_search:
-            search_field = self.pre_child_filter_clause + search_field
-        elif not is_child and is_child_search:
-            search_field = self.pre_parent_filter_clause + search_field
+        search_field = self.get_search_field(field_value, is_child, is_child_search)
 
         if field_value in self.identifier_field_values and (identifier := re.search(corp_prefix_regex, term)):
             prefix = identifier.group(1)
@@ -109,24 +128,21 @@ class QueryBuilder:
                           is_child: bool,
                           is_child_search: bool) -> str:
         """Return the facet filter clause for the given params."""
-        filter_q = ''
-        if is_child and not is_child_search:
-            filter_q = self.pre_child_filter_clause
-        elif not is_child and is_child_search:
-            filter_q = self.pre_parent_filter_clause
-        filter_q += f'{field.value}:("{values[0]}"'
+        filter_q = f'{self.get_search_field(field.value, is_child, is_child_search)}:("{values[0]}"'
         for val in values[1:]:
             filter_q += f' OR "{val}"'
         filter_q += ")"
         return filter_q
     
-    def build_term_clause(
+    def build_term_clause(  # noqa: PLR0913
         self,
         term: str,
         fields: dict[BaseEnum, str],
         boost_fields: dict[BaseEnum, int],
         fuzzy_fields: dict[BaseEnum, dict[str, int]],
-        is_child_search: bool
+        is_child_search: bool,
+        *,
+        fuzzy_plan: FuzzyPlan | None = None
     ) -> str:
         """Return the base term clause."""
         term_clause = ""
@@ -139,9 +155,9 @@ class QueryBuilder:
 
             term_clause = self.join_clause(term_clause, field_clause, "OR")
             # add fuzzy matching
-            if field in fuzzy_fields and (fuzzy_str := self.get_fuzzy_str(term,
-                                          fuzzy_fields[field]["short"],
-                                          fuzzy_fields[field]["long"])):
+            if (field in fuzzy_fields
+                    and (fuzzy_str := self.get_fuzzy_str(term, fuzzy_fields[field]["short"], fuzzy_fields[field]["long"]))
+                    and (not fuzzy_plan or fuzzy_plan.allow(field.value, term))):
                 # add another with fuzzy (this one will give a lower score on a hit if the original has a boost)
                 term_clause = self.join_clause(term_clause, f"{pre_boost_clause}{fuzzy_str}", "OR")
         return term_clause
@@ -164,11 +180,7 @@ class QueryBuilder:
             synonym_terms = synonym_info[field]["synonym_terms"]
             synonym_start_index = synonym_info[field]["synonym_start_index"]
 
-            field_value = field.value
-            if level == "child" and not is_child_search:
-                field_value = self.pre_child_filter_clause + field.value
-            elif level != "child" and is_child_search:
-                field_value = self.pre_parent_filter_clause + field.value
+            field_value = self.get_search_field(field.value, level == "child", is_child_search)
 
             synonym_clause = ""
             if synonym_terms and term_index < synonym_start_index + len(synonym_terms):
@@ -195,6 +207,7 @@ class QueryBuilder:
                          is_child_search: bool) -> dict[str, list[str]]:
         """Return a solr query with filters for each subsequent term."""
         terms = query["value"].split()
+        fuzzy_plan = self.fuzzy_policy.plan(terms) if fuzzy_fields else None
         synonym_info = {}
         query_clause = ""
         # Each term in the searched 'value' must match on at least one of:
@@ -202,7 +215,9 @@ class QueryBuilder:
         # This loop adds clauses for the all the given fields for each term
         for term_index, term in enumerate(terms):
             # Get the base clause, which references the fields, fuzzy fields and adds the boost clause for ordering
-            term_clause = self.build_term_clause(term, fields, boost_fields, fuzzy_fields, is_child_search)
+            term_clause = self.build_term_clause(
+                term, fields, boost_fields, fuzzy_fields, is_child_search, fuzzy_plan=fuzzy_plan
+            )
 
             # Add the synonym field clauses
             term_clause = self.build_term_synonym_clauses(term_clause, terms, term_index, synonym_info, synonym_fields, is_child_search, boost_fields)
@@ -32,7 +32,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """Solr query params."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from namex_solr_api.common.base_enum import BaseEnum
 
@@ -55,3 +55,13 @@ class QueryParams:  # pylint: disable=too-few-public-methods
     query_synonym_fields: dict[BaseEnum, str]
     full_query_boosts: list[dict[str, BaseEnum | str]]
     exclude_sub_types: list[str]
+    # extra filter queries added as is (i.e. precomputed index flags)
+    filters: list[str] = field(default_factory=list)
+    # cheap high precision query fields tried before the full query when the search is tiered
+    precise_query_fields: dict[BaseEnum, str] = field(default_factory=dict)
+    # always run the full query (i.e. exhaustive conflict checking)
+    exhaustive: bool = False
+    # the tier returned with the first page of a tiered search (later pages rerun it so the results don't shift)
+    tier: str | None = None
+    # solr paramset holding the static params of the search profile (fields, highlighting, etc.)
+    param_set: str | None = None
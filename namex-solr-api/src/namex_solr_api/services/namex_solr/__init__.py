@@ -32,27 +32,50 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """This module wraps the solr classes/fields for using namex solr."""
-from dataclasses import asdict
 
-from flask import Flask
+from concurrent.futures import ThreadPoolExecutor
+from heapq import merge
+from itertools import islice
 
+from flask import Flask, current_app
+
+from namex_solr_api.exceptions import SolrException
 from namex_solr_api.models import SolrSynonymList
 from namex_solr_api.services.base_solr import Solr
-from namex_solr_api.services.base_solr.utils import QueryBuilder, prep_query_str
+from namex_solr_api.services.base_solr.utils import FuzzyPolicy, QueryBuilder, prep_query_str
 
 from .doc_models.name import Name, NameField
-from .doc_models.possible_conflict import PCField, PossibleConflict
+from .doc_models.name_variants import get_base_name, get_dashless_name
+from .doc_models.possible_conflict import HISTORICAL_STATES, PCField, PossibleConflict
 
 
 class NamexSolr(Solr):
     """Extends the solr wrapper class for namex specific functionality."""
 
+    conflict_candidate_filter = False
+    indexed_name_variants = False
+    tiered_search = False
+    use_param_sets = False
+    local_highlighting = False
+
     def __init__(self, config_prefix: str, app: Flask = None) -> None:
+        # cores for the docs that can't be possible conflicts (None when every doc is in the one tier)
+        self.historical: Solr | None = None
+        # cores for the docs of the given types (types without their own cores stay in this tier)
+        self.type_tiers: dict[str, Solr] = {}
         super().__init__(config_prefix, app)
         self.query_builder = QueryBuilder(
             identifier_field_values=[],
             unique_parent_field=PCField.TYPE,
-            synonym_field_map={NameField.NAME_Q_SYN: SolrSynonymList.Type.ALL})
+            synonym_field_map={NameField.NAME_Q_SYN: SolrSynonymList.Type.ALL},
+            parent_field_map={
+                PCField.CORP_NUM_Q: NameField.PARENT_CORP_NUM_Q,
+                PCField.JURISDICTION: NameField.PARENT_JURISDICTION,
+                PCField.NR_NUM_Q: NameField.PARENT_NR_NUM_Q,
+                PCField.STATE: NameField.PARENT_STATE,
+                PCField.SUB_TYPE: NameField.PARENT_SUB_TYPE,
+                PCField.TYPE: NameField.PARENT_TYPE,
+            })
 
         # fields
         self.resp_fields = [
@@ -83,14 +106,148 @@ class NamexSolr(Solr):
             NameField.PARENT_SUB_TYPE.value,
             NameField.UNIQUE_KEY.value,
         ]
+        # paramsets (namex-solr conf/params.json) with the static params of each search profile
+        self.name_search_param_set = "namex_name_search"
+        self.nr_search_param_set = "namex_nr_search"
+        # ngram analyzed fields (a term already matches many grams on these so fuzzy expansion is mostly redundant)
+        self.ngram_fields = [NameField.NAME_Q_EXACT.value, NameField.NAME_Q_SINGLE.value]
+        self.terms_url = "{url}/{core}/terms"
+        # loads the stored fields / child docs and the type field caches before a rebuilt core is swapped in
+        self.warm_queries = [
+            {"query": "*:*", "limit": 0, "facet": {"types": {"type": "terms", "field": PCField.TYPE.value}}},
+            {"query": "*:*", "limit": 10, "fields": self.resp_fields},
+        ]
+
+    def init_app(self, app: Flask):
+        """Initialize the Solr environment."""
+        super().init_app(app)
+        # NOTE: requires the parent_* name fields to be indexed (schema change + reindex)
+        self.query_builder.flat_parent_filters = app.config.get(f"{self.config_prefix}_FLAT_PARENT_FILTERS", False)
+        # NOTE: requires the is_conflict_candidate name field to be indexed (schema change + reindex)
+        self.conflict_candidate_filter = app.config.get(f"{self.config_prefix}_CONFLICT_CANDIDATE_FILTER", False)
+        # NOTE: requires the name_q_dashless / name_q_base name fields to be indexed (schema change + reindex)
+        self.indexed_name_variants = app.config.get(f"{self.config_prefix}_INDEXED_NAME_VARIANTS", False)
+        self.tiered_search = app.config.get(f"{self.config_prefix}_TIERED_SEARCH", False)
+        # NOTE: requires the paramsets in the core's conf/params.json (namex-solr image)
+        self.use_param_sets = app.config.get(f"{self.config_prefix}_USE_PARAM_SETS", False)
+        self.local_highlighting = app.config.get(f"{self.config_prefix}_LOCAL_HIGHLIGHTING", False)
+        self.query_builder.fuzzy_policy = FuzzyPolicy(
+            max_clauses=app.config.get(f"{self.config_prefix}_FUZZY_MAX_CLAUSES", 0),
+            skip_fields=self.ngram_fields if app.config.get(f"{self.config_prefix}_FUZZY_SKIP_NGRAM_FIELDS") else (),
+            exact_terms_lookup=(
+                self.get_indexed_terms if app.config.get(f"{self.config_prefix}_FUZZY_SKIP_EXACT_TERMS") else None
+            ),
+        )
+        # NOTE: requires the historical cores created on the solr nodes (see namex-solr README) + reindex
+        self.historical = None
+        if app.config.get(f"{self.config_prefix}_HISTORICAL_LEADER_CORE"):
+            self.historical = Solr(f"{self.config_prefix}_HISTORICAL", app)
+            self.historical.warm_queries = self.warm_queries
+        # NOTE: requires the corp cores created on the solr nodes (see namex-solr README) + reindex
+        self.type_tiers = {}
+        if app.config.get(f"{self.config_prefix}_CORP_LEADER_CORE"):
+            self.type_tiers["CORP"] = Solr(f"{self.config_prefix}_CORP", app)
+            self.type_tiers["CORP"].warm_queries = self.warm_queries
+
+    @property
+    def tiers(self) -> list[Solr]:
+        """Return the solr tiers (this one first, then the type tiers and the historical tier)."""
+        return [self, *self.type_tiers.values(), *([self.historical] if self.historical else [])]
+
+    @staticmethod
+    def is_active_doc(doc: dict) -> bool:
+        """Return True if the doc belongs in the active tier (partial docs without a state stay in the active tier)."""
+        return doc.get(PCField.STATE.value) not in HISTORICAL_STATES
+
+    def get_active_tier(self, doc: dict) -> Solr:
+        """Return the active tier for the doc's type (partial docs without a type stay in this tier)."""
+        return self.type_tiers.get(doc.get(PCField.TYPE.value), self)
+
+    def get_doc_tier(self, doc: dict) -> Solr:
+        """Return the tier the doc belongs in."""
+        if self.historical and not self.is_active_doc(doc):
+            return self.historical
+        return self.get_active_tier(doc)
+
+    def get_tier_core(self, tier: Solr, core: str | None) -> str | None:
+        """Return the given tier's core matching this tier's core (i.e. its shadow core for a shadow import)."""
+        return tier.shadow_core if core and core == self.shadow_core else None
+
+    def get_search_tiers(self, active=True, historical=True, types: list[str] | None = None) -> list[Solr]:
+        """Return the tiers holding the docs for the search (historical docs are in the active tiers if unsplit)."""
+        types = [doc_type.upper() for doc_type in types or []]
+        tiers = []
+        if active or not self.historical:
+            if not types or any(doc_type not in self.type_tiers for doc_type in types):
+                tiers.append(self)
+            tiers += [tier for doc_type, tier in self.type_tiers.items() if not types or doc_type in types]
+        if historical and self.historical:
+            tiers.append(self.historical)
+        return tiers
+
+    def query_tiers(self,  # noqa: PLR0913
+                    tiers: list[Solr],
+                    payload: dict,
+                    start: int | None = None,
+                    rows: int | None = None,
+                    *,
+                    params: dict | None = None,
+                    fields: list[str] | None = None) -> dict:
+        """Return the solr response for the query across the tiers.
+
+        The tiers are queried in parallel for their first start + rows docs, which are merged by score and paged
+        here (the score field is added to the given fields for the merge). Only the responseHeader (the slowest
+        tier's QTime), response and highlighting sections are returned. Any other sections (i.e. facets, debug)
+        are per tier and dropped.
+        """
+        if len(tiers) == 1:
+            return tiers[0].query(payload, start, rows, params)
+
+        start = start or self.default_start
+        rows = rows or self.default_rows
+        score = PCField.SCORE.value
+        if fields:
+            payload = {**payload, "fields": [*fields, score]}
+        app = current_app._get_current_object()
 
-    def create_or_replace_docs(self,
+        def _query(tier: Solr) -> dict:
+            with app.app_context():
+                return tier.query({**payload}, self.default_start, start + rows, params)
+
+        with ThreadPoolExecutor(max_workers=len(tiers), thread_name_prefix="solr-query") as executor:
+            responses = list(executor.map(_query, tiers))
+
+        docs = list(islice(merge(*(resp["response"]["docs"] for resp in responses),
+                                 key=lambda doc: -doc.get(score, 0)),
+                           start,
+                           start + rows))
+        if fields:
+            for doc in docs:
+                doc.pop(score, None)
+        return {
+            "responseHeader": {**responses[0].get("responseHeader", {}),
+                               "QTime": max(resp.get("responseHeader", {}).get("QTime", 0) for resp in responses)},
+            "response": {"numFound": sum(resp["response"]["numFound"] for resp in responses),
+                         "start": start,
+                         "docs": docs},
+            "highlighting": {doc_id: highlights
+                             for resp in responses
+                             for doc_id, highlights in resp.get("highlighting", {}).items()},
+        }
+
+    def create_or_replace_docs(self,  # noqa: PLR0913
                                docs: list[PossibleConflict] | None = None,
                                raw_docs: list[dict] | None = None,
                                timeout=25,
-                               additive=True):
-        """Create or replace solr docs in the core."""
-        update_list = raw_docs if raw_docs else [asdict(doc) for doc in docs]
+                               additive=True,
+                               core: str | None = None,
+                               *,
+                               remove_moved=False):
+        """Create or replace solr docs in the core (in the core of their tier when the index is split).
+
+        remove_moved: also delete the docs from the tier they may have moved from (sync / resync updates only).
+        """
+        update_list = raw_docs if raw_docs else [doc.to_dict() for doc in docs]
 
         if not additive and not raw_docs:
             for pc_dict in update_list:
@@ -98,12 +255,75 @@ class NamexSolr(Solr):
                 if names := pc_dict.get(PCField.NAMES.value, None):
                     pc_dict[PCField.NAMES.value] = {"set": names}
 
-        url = self.update_url if len(update_list) < 1000 else self.bulk_update_url  # noqa: PLR2004
-        return self.call_solr("POST", url, json_data=update_list, timeout=timeout)
+        # NOTE: commits based on the size of the whole batch so a bulk load split between tiers isn't committed
+        bulk = len(update_list) >= 1000  # noqa: PLR2004
+        if len(self.tiers) == 1:
+            return self._update_tier(self, update_list, timeout, core, bulk)
+
+        doc_tiers = [(doc, self.get_doc_tier(doc)) for doc in update_list]
+        response = None
+        for tier in self.tiers:
+            if tier_docs := [doc for doc, doc_tier in doc_tiers if doc_tier is tier]:
+                response = self._update_tier(tier, tier_docs, timeout, self.get_tier_core(tier, core), bulk)
+        if remove_moved and self.historical and not core:
+            # a doc moving between its active tier and the historical tier (i.e. an approved NR expiring) is removed
+            # from the tier it was in
+            for tier in self.tiers:
+                self._delete_from_tier(tier,
+                                       [doc for doc, doc_tier in doc_tiers
+                                        if doc_tier is not tier and tier in (self.historical, self.get_active_tier(doc))],
+                                       timeout,
+                                       bulk)
+        return response
+
+    @staticmethod
+    def _update_tier(tier: Solr, docs: list[dict], timeout: int, core: str | None, bulk: bool):
+        """Post the docs to the tier (commits unless it's part of a bulk load)."""
+        url = tier.bulk_update_url if bulk else tier.update_url
+        return tier.call_solr("POST", url, json_data=docs, timeout=timeout, core=core)
 
     @staticmethod
-    def get_name_search_full_query_boost(query_value: str):
+    def _delete_from_tier(tier: Solr, docs: list[dict], timeout: int, bulk: bool):
+        """Delete the docs (and their nested name docs) from the tier by id."""
+        if docs:
+            url = tier.bulk_update_url if bulk else tier.update_url
+            payload = {"delete": [doc[PCField.UNIQUE_KEY.value] for doc in docs]}
+            tier.call_solr("POST", url, json_data=payload, timeout=timeout)
+
+    def delete_all_docs(self):
+        """Delete all docs in every tier."""
+        response = super().delete_all_docs()
+        for tier in self.tiers[1:]:
+            tier.delete_all_docs()
+        return response
+
+    def delete_docs_by_id(self, unique_keys: list[str], timeout=60, core: str | None = None):
+        """Delete solr docs (including their nested child docs) from every tier by id."""
+        response = super().delete_docs_by_id(unique_keys, timeout, core)
+        for tier in self.tiers[1:]:
+            tier.delete_docs_by_id(unique_keys, timeout, self.get_tier_core(tier, core))
+        return response
+
+    def get_indexed_terms(self, terms: list[str]) -> set[str]:
+        """Return the given terms that are indexed as is on the name docs."""
+        field = NameField.NAME_Q_XTRA.value
+        try:
+            resp = self.call_solr("GET",
+                                  self.terms_url,
+                                  params={"terms.fl": field,
+                                          "terms.list": ",".join(term.lower() for term in terms),
+                                          "json.nl": "map"},
+                                  leader=False)
+        except SolrException as err:
+            # NOTE: the query keeps all of its fuzzy clauses in this case
+            current_app.logger.debug(f"Indexed terms lookup failed: {err.error}")
+            return set()
+        return {term for term, count in resp.json().get("terms", {}).get(field, {}).items() if count}
+
+    def get_name_search_full_query_boost(self, query_value: str):
         """Return the list of full query boost information intended for business search."""
+        if self.indexed_name_variants:
+            return self.get_name_variant_query_boost(query_value)
         full_query_boosts = [
             {
                 "field": NameField.NAME_Q_EXACT,
@@ -157,3 +377,51 @@ class NamexSolr(Solr):
                 }
             ]
         return full_query_boosts
+
+    @staticmethod
+    def get_name_variant_query_boost(query_value: str):
+        """Return the full query boost information matched against the indexed name variants.
+
+        Plain phrase / term matches replace the sloppy phrase clauses and the query-time dash variants: the
+        dashless variant matches every dash spelling of the name and the base name matches the same name
+        with any (or no) designation.
+        """
+        def phrase(value: str) -> str:
+            return value.replace("\\", "\\\\").replace('"', '\\"')
+
+        full_query_boosts = [
+            {
+                "field": NameField.NAME_Q_EXACT,
+                "value": prep_query_str(query_value),
+                "boost": "3",
+            },
+            {
+                "field": NameField.NAME_Q_SINGLE,
+                "value": prep_query_str(query_value),
+                "boost": "2",
+            },
+            {
+                "field": NameField.NAME_Q,
+                "value": prep_query_str(query_value),
+                "boost": "5",
+            },
+            {
+                "field": NameField.NAME_Q_AGRO,
+                "value": prep_query_str(query_value),
+                "boost": "3",
+            },
+        ]
+        # default designations (not the DESIGNATIONS config) so the query matches the indexed name_q_base
+        if base_name := get_base_name(query_value or ""):
+            full_query_boosts.append({
+                "field": NameField.NAME_Q_BASE,
+                "value": phrase(base_name),
+                "boost": "5",
+            })
+        if "-" in (query_value or ""):
+            full_query_boosts.append({
+                "field": NameField.NAME_Q_DASHLESS,
+                "value": phrase(get_dashless_name(query_value)),
+                "boost": "7",
+            })
+        return full_query_boosts
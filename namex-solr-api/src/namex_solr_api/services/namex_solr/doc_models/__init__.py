@@ -33,5 +33,12 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """This module manages the solr doc models."""
 from .name import Name, NameField
-from .possible_conflict import PCField, PossibleConflict
+from .possible_conflict import (
+    CONFLICT_EXCLUDED_SUB_TYPES,
+    CONFLICT_NAME_STATES,
+    CONFLICT_STATES,
+    HISTORICAL_STATES,
+    PCField,
+    PossibleConflict,
+)
 
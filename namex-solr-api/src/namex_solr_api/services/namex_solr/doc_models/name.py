@@ -46,8 +46,11 @@ class NameField(BaseEnum):
     CHOICE = "choice"
     NAME = "name"
     NAME_STATE = "name_state"
+    IS_CONFLICT_CANDIDATE = "is_conflict_candidate"  # matches the default possible conflict filters (set by parent)
     SUBMIT_COUNT = "submit_count"
     PARENT_ID = "parent_id"
+    PARENT_CORP_NUM = "parent_corp_num"
+    PARENT_NR_NUM = "parent_nr_num"
     PARENT_JURISDICTION = "parent_jurisdiction"
     PARENT_START_DATE = "parent_start_date"
     PARENT_STATE = "parent_state"
@@ -62,12 +65,17 @@ class NameField(BaseEnum):
     NAME_Q_SYN = "name_q_synonym"  # synonym
     NAME_Q_XTRA = "name_q_xtra"  # classic tokenizer on query (others using whitespace - effects periods, dashes etc.)
     NAME_Q_PHON_EN = "name_q_phon_en"  # DoubleMetaphone phonetic
+    NAME_Q_DASHLESS = "name_q_dashless"  # minimal stem on the dashless name (set by parent, see name_variants)
+    NAME_Q_BASE = "name_q_base"  # exact dashless name without its designation (set by parent, see name_variants)
+    # denormalized parent query fields (filter name docs without a block join)
+    PARENT_CORP_NUM_Q = "parent_corp_num_q"
+    PARENT_NR_NUM_Q = "parent_nr_num_q"
 
     # common built in across docs
     SCORE = "score"
 
 
-@dataclass
+@dataclass(slots=True)
 class Name:
     """Class representation for a solr name doc."""
     name: str
@@ -78,8 +86,34 @@ class Name:
     id: str | None = None  # set by parent
     submit_count: int | None = None
     parent_id: str | None = None  # corp num or nr num
+    parent_corp_num: str | None = None
+    parent_nr_num: str | None = None
     parent_jurisdiction: str | None = None
     parent_start_date: str | None = None
     parent_state: str | None = None
     parent_type: str | None = None
     parent_sub_type: str  = '-'
+    is_conflict_candidate: bool = False
+    name_q_dashless: str | None = None
+    name_q_base: str | None = None
+
+    def to_dict(self) -> dict:
+        """Return the solr json shape of the name (same as dataclasses.asdict without the recursive copy)."""
+        return {
+            "name": self.name,
+            "name_state": self.name_state,
+            "choice": self.choice,
+            "id": self.id,
+            "submit_count": self.submit_count,
+            "parent_id": self.parent_id,
+            "parent_corp_num": self.parent_corp_num,
+            "parent_nr_num": self.parent_nr_num,
+            "parent_jurisdiction": self.parent_jurisdiction,
+            "parent_start_date": self.parent_start_date,
+            "parent_state": self.parent_state,
+            "parent_type": self.parent_type,
+            "parent_sub_type": self.parent_sub_type,
+            "is_conflict_candidate": self.is_conflict_candidate,
+            "name_q_dashless": self.name_q_dashless,
+            "name_q_base": self.name_q_base,
+        }
@@ -0,0 +1,73 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Manages the index-time name variants (dash / designation normalized forms of a name)."""
+import re
+from functools import cache
+
+from namex_solr_api.common.designations import DEFAULT_DESIGNATIONS
+
+# NOTE: the indexed name_q_base (and its query) always uses the default designations. The variants are built by
+# the importer / parse workers outside the api app config, so a DESIGNATIONS env override only reaches the query
+# parsing (prep_query_str_namex) and not this field.
+
+
+@cache
+def _by_length(designations: tuple[str, ...]) -> list[str]:
+    """Return the designations longest first.
+
+    i.e. 'societe ... a responsabilite limitee' is stripped instead of only 'limitee'.
+    """
+    return sorted(designations, key=len, reverse=True)
+
+
+def get_dashless_name(name: str) -> str:
+    """Return the lowercase name with its dashes (and any spaces around them) removed.
+
+    Matches every dash spelling of a name to each other (i.e. 'E-Z', 'E - Z' and 'EZ' are all 'ez').
+    """
+    name = re.sub(r"[()^{}|\\]", "", name.lower())
+    name = re.sub(r"[&+]+", " and ", name)
+    name = re.sub(r"\s*-\s*", "", name)
+    return " ".join(name.split())
+
+
+def get_base_name(name: str, designations: tuple[str, ...] = DEFAULT_DESIGNATIONS) -> str:
+    """Return the dashless name without its trailing designation."""
+    base_name = get_dashless_name(name)
+    for designation in _by_length(tuple(designations)):
+        if base_name == designation:
+            return base_name
+        if base_name.endswith(f" {designation}"):
+            return base_name[:-len(designation)].strip()
+    return base_name
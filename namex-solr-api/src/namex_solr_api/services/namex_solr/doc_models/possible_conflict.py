@@ -38,6 +38,14 @@ from datetime import datetime
 from namex_solr_api.common.base_enum import BaseEnum
 
 from .name import Name
+from .name_variants import get_base_name, get_dashless_name
+
+# the default possible conflict search filters (precomputed on each name doc as 'is_conflict_candidate')
+CONFLICT_STATES = frozenset(["ACTIVE", "APPROVED", "CONDITION", "ACT", "LIQ"])
+CONFLICT_NAME_STATES = frozenset(["A", "C", "CORP"])
+CONFLICT_EXCLUDED_SUB_TYPES = frozenset(["DBA", "FR", "GP", "LL", "LP"])
+# the states kept in the historical tier when the index is split (every other state is in the active tier)
+HISTORICAL_STATES = frozenset(["HISTORICAL", "EXPIRED", "REJECTED", "CONSUMED", "CANCELLED"])
 
 
 class PCField(BaseEnum):
@@ -68,7 +76,7 @@ class PCField(BaseEnum):
     SCORE = "score"
 
 
-@dataclass
+@dataclass(slots=True)
 class PossibleConflict:
     """Class representation for a solr possible conflict doc."""
     id: str  # The nr_num or corp_num depending on type
@@ -84,21 +92,51 @@ class PossibleConflict:
     def __post_init__(self):
         """Update child 'parent_' fields."""
         for index, name in enumerate(self.names or []):
-            # set parent_state, parent_type, parent_id
+            # set parent_state, parent_type, parent_id (denormalized so name searches can filter without a join)
             if isinstance(name, dict):
                 name['id'] = f'{self.id}-name-{index}'
                 name['parent_id'] = self.id
+                name['parent_corp_num'] = self.corp_num
+                name['parent_nr_num'] = self.nr_num
                 name['parent_jurisdiction'] = self.jurisdiction
                 name['parent_start_date'] = self.start_date
                 name['parent_state'] = self.state
                 name['parent_type'] = self.type
                 name['parent_sub_type'] = self.sub_type
+                name['is_conflict_candidate'] = self.is_conflict_candidate(name.get('name_state'))
+                name['name_q_dashless'] = get_dashless_name(name.get('name') or '')
+                name['name_q_base'] = get_base_name(name.get('name') or '')
 
             elif isinstance(name, Name):
                 name.id = f'{self.id}-name-{index}'
                 name.parent_id = self.id
+                name.parent_corp_num = self.corp_num
+                name.parent_nr_num = self.nr_num
                 name.parent_jurisdiction = self.jurisdiction
                 name.parent_start_date = self.start_date
                 name.parent_state = self.state
                 name.parent_type = self.type
                 name.parent_sub_type = self.sub_type
+                name.is_conflict_candidate = self.is_conflict_candidate(name.name_state)
+                name.name_q_dashless = get_dashless_name(name.name or '')
+                name.name_q_base = get_base_name(name.name or '')
+
+    def is_conflict_candidate(self, name_state: str | None) -> bool:
+        """Return True if a name with the given state matches the default possible conflict filters."""
+        return (self.state in CONFLICT_STATES
+                and name_state in CONFLICT_NAME_STATES
+                and self.sub_type not in CONFLICT_EXCLUDED_SUB_TYPES)
+
+    def to_dict(self) -> dict:
+        """Return the solr json shape of the doc (same as dataclasses.asdict without the recursive copy)."""
+        return {
+            "id": self.id,
+            "names": [name.to_dict() if isinstance(name, Name) else dict(name) for name in self.names or []],
+            "state": self.state,
+            "type": self.type,
+            "sub_type": self.sub_type,
+            "corp_num": self.corp_num,
+            "jurisdiction": self.jurisdiction,
+            "nr_num": self.nr_num,
+            "start_date": self.start_date,
+        }
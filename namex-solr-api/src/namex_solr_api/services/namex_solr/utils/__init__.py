@@ -33,5 +33,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """This module manages util methods for the NameX solr service."""
 from .formatting_helpers import normalize_nr_num, prep_query_str_namex
-from .namex_search_helper import namex_search
+from .highlight_classification import classify_highlights
+from .local_highlighting import get_local_highlights
+from .namex_search_helper import apply_conflict_candidate_filter, namex_search
 from .synonym_helpers import get_synonyms
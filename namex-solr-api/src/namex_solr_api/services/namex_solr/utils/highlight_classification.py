@@ -0,0 +1,78 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Classifies the solr highlights of a page of name search results."""
+import re
+
+from namex_solr_api.services.namex_solr.doc_models import NameField
+
+TAG_RGX = re.compile(r"<[^>]+>")
+
+
+def split_highlights(highlights: list[str]) -> list[str]:
+    """Return the uppercased single terms of the highlights (html tags removed)."""
+    return TAG_RGX.sub("", " ".join(highlights)).upper().split(" ") if highlights else []
+
+
+def classify_highlights(query_value: str,
+                        highlighting: list[dict[str, list[str]]]) -> list[dict[str, list[str]]]:
+    """Return the exact / stems / phonetic / synonyms highlights of each result's parsed solr highlighting.
+
+    Each class excludes the terms of the previous ones. The query terms are prepared once for the whole page.
+    """
+    query_terms = {term.upper() for term in query_value.split(" ")}
+    return [classify_result_highlights(query_terms, highlights) for highlights in highlighting]
+
+
+def classify_result_highlights(query_terms: set[str], highlights: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Return the highlight classes of a single result."""
+    exact = set()
+    if exact_words := [word for word in split_highlights(highlights.get(NameField.NAME_Q_SINGLE.value)) if word]:
+        # a query term highlights if it is part of a highlighted word (ngram field, terms have no spaces)
+        joined_words = " ".join(exact_words)
+        exact = {term for term in query_terms if term in joined_words}
+    stems = {
+        word for word in split_highlights(highlights.get(NameField.NAME_Q_STEM_HIGHLIGHT.value)) if word
+    } - exact
+    phonetic = {
+        word for word in split_highlights(highlights.get(NameField.NAME_Q_PHON_EN.value)) if word.strip()
+    } - exact - stems
+    synonyms = {
+        synonym.upper() for synonym in highlights.get(NameField.NAME_Q_SYN.value, [])
+    } - exact - stems - phonetic
+    return {
+        "exact": list(exact),
+        "stems": list(stems),
+        "phonetic": list(phonetic),
+        "synonyms": list(synonyms),
+    }
@@ -0,0 +1,137 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Local highlighting of the returned names (same highlight classes as the solr highlighted name fields)."""
+import re
+import unicodedata
+
+import snowballstemmer
+from metaphone import doublemetaphone
+
+from namex_solr_api.models import SolrSynonymList
+
+# char filters of the analyzed name fields
+REMOVED_CHARS_RGX = re.compile(r"[()^{}\\|]")
+AND_RGX = re.compile(r"[&+]+")
+# words of the standard tokenizer (phonetic field)
+STANDARD_WORD_RGX = re.compile(r"\w+")
+# max code length of solr's doubleMetaphone filter
+METAPHONE_CODE_LENGTH = 4
+
+
+def get_query_synonyms(terms: list[str]) -> dict[str, list[str]]:
+    """Return the synonym lists of the query's words / phrases (one db lookup)."""
+    phrases = {
+        " ".join(terms[start:end]).lower() for start in range(len(terms)) for end in range(start + 1, len(terms) + 1)
+    }
+    if not phrases:
+        return {}
+    return {
+        synonym.synonym: synonym.synonym_list
+        for synonym in SolrSynonymList.find_all_by_synonyms(list(phrases), SolrSynonymList.Type.ALL)
+    }
+
+
+def get_local_highlights(query_value: str,
+                         names: list[str],
+                         synonyms: dict[str, list[str]] | None = None) -> list[dict[str, list[str]]]:
+    """Return the exact / stems / phonetic / synonyms highlights of each name for the (prepped) query value."""
+    terms = query_value.replace("\\", "").split()
+    if synonyms is None:
+        synonyms = get_query_synonyms(terms)
+    highlighter = LocalHighlighter(terms, synonyms)
+    return [highlighter.highlight(name or "") for name in names]
+
+
+class LocalHighlighter:
+    """Highlights a page of names for the query terms.
+
+    The query is analyzed once and the word analysis (stems / phonetic codes) is kept for the whole page
+    since the returned names share most of their words.
+    """
+
+    def __init__(self, terms: list[str], synonyms: dict[str, list[str]]):
+        """Initialize the highlighter."""
+        self.stemmer = snowballstemmer.stemmer("porter")
+        self.stems: dict[str, str] = {}
+        self.codes: dict[str, set[str]] = {}
+        self.terms = [term.upper() for term in terms]
+        self.term_stems = {self.get_stem(term) for term in terms}
+        self.term_codes = set().union(*(self.get_codes(term) for term in terms))
+        self.synonym_phrases = {term.lower() for term in terms}
+        for synonym, synonym_list in synonyms.items():
+            self.synonym_phrases.update(phrase.lower() for phrase in [synonym, *synonym_list])
+        self.synonym_length = max((len(phrase.split()) for phrase in self.synonym_phrases), default=1)
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        """Return the word lowercased and ascii folded."""
+        word = unicodedata.normalize("NFKD", word.lower())
+        return "".join(char for char in word if not unicodedata.combining(char))
+
+    def get_stem(self, word: str) -> str:
+        """Return the porter stem of the word (englishPossessive + porterStem filters)."""
+        if (stem := self.stems.get(word)) is None:
+            normalized = self.normalize(word)
+            if normalized.endswith(("'s", "\u2019s")):
+                normalized = normalized[:-2]
+            stem = self.stems[word] = self.stemmer.stemWord(normalized)
+        return stem
+
+    def get_codes(self, word: str) -> set[str]:
+        """Return the double metaphone codes of the word."""
+        if (codes := self.codes.get(word)) is None:
+            codes = self.codes[word] = {code[:METAPHONE_CODE_LENGTH] for code in doublemetaphone(word) if code}
+        return codes
+
+    def highlight(self, name: str) -> dict[str, list[str]]:
+        """Return the highlights of the name."""
+        words = AND_RGX.sub(" and ", REMOVED_CHARS_RGX.sub("", name)).upper().split()
+        exact = {term for term in self.terms if any(term in word for word in words)}
+        stems = {word for word in words if self.get_stem(word) in self.term_stems} - exact
+        phonetic = {
+            word for word in STANDARD_WORD_RGX.findall(name.upper()) if self.get_codes(word) & self.term_codes
+        } - exact - stems
+        synonym_words = REMOVED_CHARS_RGX.sub("", name).upper().split()
+        synonyms = {
+            phrase
+            for length in range(1, self.synonym_length + 1)
+            for start in range(len(synonym_words) - length + 1)
+            if (phrase := " ".join(synonym_words[start:start + length])).lower() in self.synonym_phrases
+        } - exact - stems - phonetic
+        return {
+            "exact": list(exact),
+            "stems": list(stems),
+            "phonetic": list(phonetic),
+            "synonyms": list(synonyms),
+        }
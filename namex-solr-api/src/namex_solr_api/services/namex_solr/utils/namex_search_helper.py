@@ -33,16 +33,57 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """NameX solr search functions."""
 import re
+from dataclasses import replace
 
 from namex_solr_api.services.base_solr.utils import QueryParams
 from namex_solr_api.services.namex_solr import NamexSolr
-from namex_solr_api.services.namex_solr.doc_models import NameField, PCField
+from namex_solr_api.services.namex_solr.doc_models import (
+    CONFLICT_EXCLUDED_SUB_TYPES,
+    CONFLICT_NAME_STATES,
+    CONFLICT_STATES,
+    HISTORICAL_STATES,
+    NameField,
+    PCField,
+)
 
 from .add_category_filters import add_category_filters
 
+PRECISE_TIER = "precise"
+FULL_TIER = "full"
+
 
 def namex_search(params: QueryParams, solr: NamexSolr, is_name_search: bool):
-    """Return the list of possible conflicts from Solr that match the query."""
+    """Return the list of possible conflicts from Solr that match the query.
+
+    When the search is tiered, the first page runs the precise query first and the full query only runs if it
+    doesn't fill the page. The tier that answered is set on the response. Later pages rerun the tier passed back
+    from the first page (the full query if none is given) so the results don't shift between tiers while paging.
+    """
+    is_tiered = solr.tiered_search and params.precise_query_fields and not params.exhaustive
+    if is_tiered and (params.tier == PRECISE_TIER or (not params.tier and not params.start)):
+        resp = namex_search_query(get_precise_params(params), solr, is_name_search)
+        rows = params.rows or solr.default_rows
+        if params.tier == PRECISE_TIER or resp.get("response", {}).get("numFound", 0) >= rows:
+            resp["tier"] = PRECISE_TIER
+            return resp
+    resp = namex_search_query(params, solr, is_name_search)
+    resp["tier"] = FULL_TIER
+    return resp
+
+
+def get_precise_params(params: QueryParams) -> QueryParams:
+    """Return the params for the precise query (exact term matches only, no fuzzy / synonym / sloppy clauses)."""
+    return replace(
+        params,
+        query_fields=params.precise_query_fields,
+        query_fuzzy_fields={},
+        query_synonym_fields={},
+        full_query_boosts=[boost for boost in params.full_query_boosts if not boost.get("fuzzy")],
+    )
+
+
+def namex_search_query(params: QueryParams, solr: NamexSolr, is_name_search: bool):
+    """Return the solr response for the query params."""
     # initialize payload with base doc query (init query / filter)
     initial_queries = solr.query_builder.build_base_query(
         query=params.query,
@@ -61,19 +102,22 @@ def namex_search(params: QueryParams, solr: NamexSolr, is_name_search: bool):
             initial_queries["query"] += f'^{info["boost"]})'
 
     # add defaults
-    parent_field = NameField.PARENT_TYPE.value if is_name_search else PCField.TYPE.value
     solr_payload = {
         **initial_queries,
         "queries": {
-            "parents": f"{parent_field}:*",
             "parentFilters": " AND ".join(initial_queries["filter"]),
         },
-        "fields": params.fields
     }
-    if params.highlighted_fields:
+    request_params = None
+    if solr.use_param_sets and params.param_set:
+        # the fields, highlighting and parents query are in the paramset (namex-solr conf/params.json)
+        request_params = namex_search_param_set_params(params)
+    else:
+        static_params = namex_search_static_params(params, is_name_search)
         solr_payload = {
             **solr_payload,
-            **namex_search_highlighting(params)
+            **static_params,
+            "queries": {**static_params["queries"], **solr_payload["queries"]},
         }
     # base doc faceted filters
     add_category_filters(solr_payload=solr_payload,
@@ -91,6 +135,8 @@ def namex_search(params: QueryParams, solr: NamexSolr, is_name_search: bool):
         solr_payload["filter"].append(f"-sub_type:({exclude_sub_types})")
         solr_payload["filter"].append(f"-parent_sub_type:({exclude_sub_types})")
 
+    solr_payload["filter"].extend(params.filters)
+
     # child doc faceted filter queries
     add_category_filters(solr_payload=solr_payload,
                          categories=params.child_categories,
@@ -98,7 +144,14 @@ def namex_search(params: QueryParams, solr: NamexSolr, is_name_search: bool):
                          is_child_search=is_name_search,
                          solr=solr)
 
-    resp: dict[str, dict[str, dict[str, list[str]]]] = solr.query(solr_payload, params.start, params.rows)
+    # only the tiers holding the requested states / types are searched (in parallel when there are several)
+    tiers = solr.get_search_tiers(*get_state_tiers(params), types=params.categories.get(PCField.TYPE))
+    resp: dict[str, dict[str, dict[str, list[str]]]] = solr.query_tiers(tiers,
+                                                                        solr_payload,
+                                                                        params.start,
+                                                                        params.rows,
+                                                                        params=request_params,
+                                                                        fields=params.fields)
     parsed_highlighting = {}
     if solr_highlighting := resp.get('highlighting'):
         for result_id, result in solr_highlighting.items():
@@ -112,6 +165,58 @@ def namex_search(params: QueryParams, solr: NamexSolr, is_name_search: bool):
     return resp
 
 
+def get_state_tiers(params: QueryParams) -> tuple[bool, bool]:
+    """Return whether the active / historical tiers hold any of the docs for the requested states."""
+    if not (states := params.categories.get(PCField.STATE)):
+        # the is_conflict_candidate flag is only set on active docs
+        return True, f"{NameField.IS_CONFLICT_CANDIDATE.value}:true" not in params.filters
+    return (any(state.upper() not in HISTORICAL_STATES for state in states),
+            any(state.upper() in HISTORICAL_STATES for state in states))
+
+
+def apply_conflict_candidate_filter(params: QueryParams, solr: NamexSolr):
+    """Replace the default possible conflict filters with the name docs' precomputed is_conflict_candidate flag.
+
+    Only applies when the state, name state and excluded sub type filters are exactly the defaults (custom
+    category filters keep the explicit filters).
+    """
+    if not (
+        solr.conflict_candidate_filter
+        and set(params.categories.get(PCField.STATE) or []) == CONFLICT_STATES
+        and set(params.child_categories.get(NameField.NAME_STATE) or []) == CONFLICT_NAME_STATES
+        and set(params.exclude_sub_types) == CONFLICT_EXCLUDED_SUB_TYPES
+    ):
+        return
+    params.categories = {**params.categories, PCField.STATE: None}
+    params.child_categories = {**params.child_categories, NameField.NAME_STATE: None}
+    params.exclude_sub_types = []
+    params.filters = [*params.filters, f"{NameField.IS_CONFLICT_CANDIDATE.value}:true"]
+
+
+def namex_search_static_params(params: QueryParams, is_name_search: bool) -> dict:
+    """Return the payload params that are the same for every search of the profile (the paramset contents)."""
+    parent_field = NameField.PARENT_TYPE.value if is_name_search else PCField.TYPE.value
+    static_params = {
+        "queries": {"parents": f"{parent_field}:*"},
+        "fields": params.fields,
+    }
+    if params.highlighted_fields:
+        static_params = {
+            **static_params,
+            **namex_search_highlighting(params)
+        }
+    return static_params
+
+
+def namex_search_param_set_params(params: QueryParams) -> dict:
+    """Return the url params that apply the search profile's paramset."""
+    request_params = {"useParams": params.param_set}
+    if not params.highlighted_fields:
+        # highlighting is on in the name search paramset
+        request_params["hl"] = "false"
+    return request_params
+
+
 def namex_search_highlighting(params: QueryParams):
     """Return the the highlighting params for the query."""
     return {
@@ -0,0 +1,291 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Background reindex jobs (the steps are run in a thread so the api workers aren't tied up)."""
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from threading import Thread
+from time import monotonic, sleep
+
+from flask import Flask, current_app
+
+from namex_solr_api.exceptions import SolrException
+from namex_solr_api.models import ReindexJob
+from namex_solr_api.services import solr
+from namex_solr_api.services.base_solr import Solr
+
+
+def wait_for(check: Callable[[], bool],  # noqa: PLR0913
+             description: str,
+             *,
+             timeout: float = 1800,
+             interval: float = 2,
+             max_interval: float = 60,
+             on_poll: Callable[[], None] | None = None):
+    """Poll the check with exponential backoff until it passes (SolrException if it times out).
+
+    The on_poll callback is called before each wait (i.e. to heartbeat the job while waiting on solr).
+    """
+    deadline = monotonic() + timeout
+    attempt = 1
+    while not check():
+        if monotonic() + interval > deadline:
+            raise SolrException(error=f"Timed out waiting for {description}.",
+                                status_code=HTTPStatus.GATEWAY_TIMEOUT)
+        if on_poll:
+            on_poll()
+        current_app.logger.debug(f"Waiting {interval}s for {description} (attempt {attempt})...")
+        sleep(interval)
+        interval = min(interval * 2, max_interval)
+        attempt += 1
+
+
+def get_replication_detail(field: str, leader: bool, tier: Solr = solr):
+    """Return the replication detail for the core, safely handling optional follower."""
+    details: dict = tier.replication("details", leader).json().get("details", {})
+
+    # Remove unwanted data
+    if field != "commits" and "commits" in details:
+        del details["commits"]
+
+    follower_details = details.get("follower", {})  # safe fallback
+    if not leader and field != "leaderDetails" and "leaderDetails" in follower_details:
+        del follower_details["leaderDetails"]
+
+    current_app.logger.debug("Full replication details: %s", details)
+
+    if leader:
+        return details.get(field)
+    return follower_details.get(field)
+
+
+def _has_follower() -> bool:
+    """Return True if there is a follower replicating from the leader."""
+    return current_app.config.get("HAS_FOLLOWER", True)
+
+
+def _is_true(value) -> bool:
+    """Return True for the boolean/string 'true' values returned by the replication handler."""
+    return str(value).lower() == "true"
+
+
+def _heartbeat(context: dict):
+    """Record that the job running the step is still alive (if run as a job)."""
+    if heartbeat := context.get("heartbeat"):
+        heartbeat()
+
+
+def _each_tier(context: dict) -> Iterator[Solr]:
+    """Yield the solr tiers, recording a job heartbeat before each one."""
+    for tier in solr.tiers:
+        _heartbeat(context)
+        yield tier
+
+
+# -----------------------------
+# Steps (each step is run for every solr tier)
+# -----------------------------
+def backup_leader(context: dict):
+    """Trigger a backup of the leader index."""
+    context["backup_triggered"] = datetime.now(UTC)
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.replication("backup", True).json())
+
+
+def disable_polling(context: dict):
+    """Stop the follower polling the leader for index changes."""
+    if not _has_follower():
+        return
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.replication("disablepoll", False).json())
+        wait_for(lambda tier=tier: get_replication_detail("isPollingDisabled", False, tier) in (None, True, "true"),
+                 "the follower to disable polling", timeout=300, on_poll=context.get("heartbeat"))
+
+
+def verify_backup(context: dict):
+    """Wait for the leader backup triggered by this job to succeed."""
+    def _backup_succeeded(tier: Solr) -> bool:
+        backup_detail = get_replication_detail("backup", True, tier) or {}
+        if backup_detail.get("status") == "failed":
+            raise SolrException(error="Failed to backup leader index", status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+        start_time = backup_detail.get("startTime")
+        return (backup_detail.get("status") == "success"
+                and bool(start_time)
+                and datetime.fromisoformat(start_time) > context["backup_triggered"])
+
+    for tier in _each_tier(context):
+        wait_for(lambda tier=tier: _backup_succeeded(tier), "the leader backup", on_poll=context.get("heartbeat"))
+
+
+def disable_replication(context: dict):
+    """Stop the leader serving index changes to the follower."""
+    if _has_follower():
+        for tier in _each_tier(context):
+            current_app.logger.debug(tier.replication("disablereplication", True).json())
+
+
+def delete_all_docs(context: dict):
+    """Delete all the docs in the leader core."""
+    solr.delete_all_docs()
+
+
+def enable_replication(context: dict):
+    """Start the leader serving index changes to the follower again."""
+    if not _has_follower():
+        return
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.replication("enablereplication", True).json())
+        wait_for(lambda tier=tier: _is_true(
+                     (get_replication_detail("leader", True, tier) or {}).get("replicationEnabled", True)),
+                 "the leader to enable replication", timeout=300, on_poll=context.get("heartbeat"))
+
+
+def fetch_index(context: dict):
+    """Have the follower fetch the leader index and wait until it has it."""
+    if not _has_follower():
+        return
+
+    def _is_in_sync(tier: Solr) -> bool:
+        leader_version = tier.replication("indexversion", True).json().get("indexversion")
+        return tier.replication("indexversion", False).json().get("indexversion") == leader_version
+
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.replication("fetchindex", False).json())
+        wait_for(lambda tier=tier: _is_in_sync(tier), "the follower to fetch the leader index",
+                 on_poll=context.get("heartbeat"))
+
+
+def enable_polling(context: dict):
+    """Start the follower polling the leader for index changes again."""
+    if _has_follower():
+        for tier in _each_tier(context):
+            current_app.logger.debug(tier.replication("enablepoll", False).json())
+
+
+def restore_leader(context: dict):
+    """Restore the leader index from the last backup."""
+    def _restored(tier: Solr) -> bool:
+        status_json = tier.replication("restorestatus", True).json()
+        current_app.logger.debug(status_json)
+        if status_json.get("status") == "failed" or status_json.get("restorestatus", {}).get("status") == "failed":
+            raise SolrException(error="Failed to restore leader index. Manual intervention required.",
+                                status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+        return status_json.get("restorestatus", {}).get("status") == "success"
+
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.replication("restore", True).json())
+        wait_for(lambda tier=tier: _restored(tier), "the leader restore", timeout=3600,
+                 on_poll=context.get("heartbeat"))
+
+
+def create_shadow_core(context: dict):
+    """Create an empty shadow core to rebuild the index into (the leader core keeps serving as is)."""
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.create_shadow_core())
+
+
+def warm_shadow_core(context: dict):
+    """Warm the rebuilt shadow core and check it has (close to) as many docs as the live core."""
+    for tier in _each_tier(context):
+        tier.warm_core(tier.shadow_core)
+        shadow_count = tier.get_doc_count(tier.shadow_core)
+        live_count = tier.get_doc_count()
+        current_app.logger.debug(f"{tier.shadow_core} docs: {shadow_count}, live core docs: {live_count}")
+        if shadow_count == 0 or shadow_count < live_count * current_app.config["REINDEX_SWAP_MIN_DOC_RATIO"]:
+            raise SolrException(
+                error=f"Rebuilt core has {shadow_count} docs (live core has {live_count}). Not swapping.",
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+
+
+def swap_shadow_core(context: dict):
+    """Atomically swap the shadow core with the leader core (the previous index is kept as the shadow)."""
+    for tier in _each_tier(context):
+        if not tier.core_exists(tier.shadow_core):
+            raise SolrException(error=f"Shadow core {tier.shadow_core} does not exist.",
+                                status_code=HTTPStatus.NOT_FOUND)
+    for tier in _each_tier(context):
+        current_app.logger.debug(tier.swap_shadow_core())
+
+
+JOB_STEPS: dict[ReindexJob.Type, list[Callable[[dict], None]]] = {
+    ReindexJob.Type.PREP: [backup_leader, disable_polling, verify_backup, disable_replication, delete_all_docs],
+    ReindexJob.Type.POST: [enable_replication, fetch_index, enable_polling],
+    ReindexJob.Type.RECOVERY: [restore_leader, enable_replication, enable_polling],
+    ReindexJob.Type.SWAP_PREP: [create_shadow_core],
+    # NOTE: follower polling is never disabled for a swap so it only needs to fetch the swapped in index
+    ReindexJob.Type.SWAP_POST: [warm_shadow_core, swap_shadow_core, fetch_index],
+    ReindexJob.Type.SWAP_ROLLBACK: [swap_shadow_core, fetch_index],
+}
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+def run_steps(job: ReindexJob, steps: list[Callable[[dict], None]]):
+    """Run the steps in order, recording the progress (and a heartbeat while waiting on solr) on the job."""
+    context = {"heartbeat": job.heartbeat}
+    try:
+        for step in steps:
+            job.start_step(step.__name__)
+            step(context)
+            job.finish_step()
+        job.finish()
+    except Exception as err:
+        current_app.logger.exception(f"Reindex job {job.id} failed at step {job.current_step}.")
+        job.finish(getattr(err, "error", None) or str(err) or repr(err))
+
+
+def run_job(app: Flask, job_id: int):
+    """Run the reindex job (thread target)."""
+    with app.app_context():
+        job = ReindexJob.find_by_id(job_id)
+        current_app.logger.info(f"Running reindex job {job.id}: {job.job_type.value}")
+        run_steps(job, JOB_STEPS[job.job_type])
+        current_app.logger.info(f"Reindex job {job.id} finished: {job.job_status.value}")
+
+
+def start_reindex_job(job_type: ReindexJob.Type) -> tuple[ReindexJob, bool]:
+    """Start the reindex job in the background (returns the job already in progress instead if there is one)."""
+    stale_after = timedelta(seconds=current_app.config.get("REINDEX_JOB_STALE_SECONDS", 3600))
+    # NOTE: held until the new job is committed so concurrent requests can't both start a job
+    ReindexJob.lock_jobs()
+    if active_job := ReindexJob.find_active(datetime.now(UTC) - stale_after):
+        ReindexJob.rollback()
+        return active_job, False
+
+    job = ReindexJob(job_type=job_type, steps=[]).save()
+    # NOTE: the thread gets its own app context (and db session)
+    Thread(target=run_job, args=(current_app._get_current_object(), job.id), daemon=True).start()
+    return job, True
@@ -0,0 +1,87 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure compressed request bodies are handled as expected."""
+from http import HTTPStatus
+
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Request, Response
+
+from namex_solr_api.common.compression import DecompressRequestMiddleware, compress, decompress
+
+
+@Request.application
+def _echo_app(request: Request):
+    """Return the request body and the recorded wire size."""
+    wire_bytes = request.environ.get(DecompressRequestMiddleware.WIRE_BYTES_KEY)
+    return Response(request.get_data(), headers={"X-Wire-Bytes": str(wire_bytes)})
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_compression_round_trip(encoding):
+    """Assert the compressed data decompresses to the original and the max size is enforced."""
+    data = b'[{"id": "NR1234567", "names": [{"name": "TEST NAME INC."}]}]' * 100
+    compressed = compress(data, encoding)
+    assert len(compressed) < len(data)
+    assert decompress(compressed, encoding, max_size=len(data)) == data
+    with pytest.raises(ValueError):
+        decompress(compressed, encoding, max_size=len(data) - 1)
+    with pytest.raises(ValueError):
+        decompress(b"not compressed", encoding, max_size=len(data))
+
+
+@pytest.mark.parametrize("encoding,body,expected_status", [
+    ("gzip", compress(b'[{"id": "A"}]', "gzip"), HTTPStatus.OK),
+    ("zstd", compress(b'[{"id": "A"}]', "zstd"), HTTPStatus.OK),
+    ("gzip", b'[{"id": "A"}]', HTTPStatus.BAD_REQUEST),
+    ("br", b'[{"id": "A"}]', HTTPStatus.UNSUPPORTED_MEDIA_TYPE),
+])
+def test_decompress_request_middleware(encoding, body, expected_status):
+    """Assert the middleware passes on the decompressed body."""
+    client = Client(DecompressRequestMiddleware(_echo_app, max_size=1024))
+    resp = client.put("/", data=body, headers={"Content-Encoding": encoding})
+    assert resp.status_code == expected_status
+    if expected_status == HTTPStatus.OK:
+        assert resp.get_data() == b'[{"id": "A"}]'
+        assert resp.headers["X-Wire-Bytes"] == str(len(body))
+
+
+def test_decompress_request_middleware_path():
+    """Assert compressed bodies are only decompressed under the path prefix."""
+    client = Client(DecompressRequestMiddleware(_echo_app, max_size=1024, path_prefix="/internal/solr/import"))
+    body = compress(b'[{"id": "A"}]', "gzip")
+    assert client.put("/internal/solr/import", data=body, headers={"Content-Encoding": "gzip"}).status_code == \
+        HTTPStatus.OK
+    assert client.post("/api/v1/search", data=body, headers={"Content-Encoding": "gzip"}).status_code == \
+        HTTPStatus.UNSUPPORTED_MEDIA_TYPE
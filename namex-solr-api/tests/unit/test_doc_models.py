@@ -0,0 +1,105 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the solr doc models are encoded as expected."""
+import os
+from dataclasses import asdict
+
+import pytest
+
+from namex_solr_api.common.designations import DEFAULT_DESIGNATIONS
+from namex_solr_api.config import Config
+from namex_solr_api.services.namex_solr.doc_models import Name, PossibleConflict
+from namex_solr_api.services.namex_solr.doc_models.name_variants import get_base_name
+
+
+@pytest.mark.parametrize("names", [
+    [Name(name="TEST INC.", name_state="CORP")],
+    [{"name": "TEST 1", "name_state": "A", "choice": 1, "submit_count": 1},
+     {"name": "TEST 2", "name_state": "NE", "choice": 2, "submit_count": 1}],
+])
+def test_to_dict(names):
+    """Assert the direct encoder returns the same shape as dataclasses.asdict."""
+    doc = PossibleConflict(id="BC0000001",
+                           names=names,
+                           state="ACTIVE",
+                           type="CORP",
+                           sub_type="BC",
+                           corp_num="BC0000001",
+                           jurisdiction="BC",
+                           start_date="2025-01-01T00:00:00")
+    assert doc.to_dict() == asdict(doc)
+    assert doc.to_dict()["names"][0]["parent_id"] == "BC0000001"
+
+
+@pytest.mark.parametrize("state, name_state, sub_type, expected", [
+    ("ACTIVE", "CORP", "BC", True),
+    ("APPROVED", "A", "CR", True),
+    ("HISTORICAL", "CORP", "BC", False),
+    ("APPROVED", "R", "CR", False),
+    ("ACTIVE", "CORP", "FR", False),
+])
+def test_is_conflict_candidate(state, name_state, sub_type, expected):
+    """Assert the names are flagged when they match the default possible conflict filters."""
+    doc = PossibleConflict(id="BC0000001",
+                           names=[Name(name="TEST INC.", name_state=name_state),
+                                  {"name": "TEST", "name_state": name_state}],
+                           state=state,
+                           type="CORP",
+                           sub_type=sub_type)
+    assert [name["is_conflict_candidate"] for name in doc.to_dict()["names"]] == [expected, expected]
+
+
+@pytest.mark.parametrize("name, dashless, base", [
+    ("E-Z HOLDINGS LTD.", "ez holdings ltd.", "ez holdings"),
+    ("E - Z Holdings Ltd.", "ez holdings ltd.", "ez holdings"),
+    ("A & B (CANADA) LIMITED LIABILITY COMPANY", "a and b canada limited liability company", "a and b canada"),
+    ("LIMITED", "limited", "limited"),
+    ("PRE-LIMITED CONSULTING", "prelimited consulting", "prelimited consulting"),
+])
+def test_name_variants(name, dashless, base):
+    """Assert the dash / designation variants are indexed on each name."""
+    doc = PossibleConflict(id="BC0000001", names=[Name(name=name, name_state="CORP")],
+                           state="ACTIVE", type="CORP", sub_type="BC")
+    doc_name = doc.to_dict()["names"][0]
+    assert doc_name["name_q_dashless"] == dashless
+    assert doc_name["name_q_base"] == base
+
+
+def test_base_name_designations():
+    """Assert the base name uses the shared default designations unless others are given."""
+    assert get_base_name("ACME LIMITED LIABILITY PARTNERSHIP") == "acme"
+    assert get_base_name("ACME HOLDINGS", designations=("holdings",)) == "acme"
+    assert get_base_name("ACME LTD.", designations=("holdings",)) == "acme ltd."
+    if not os.getenv("DESIGNATIONS"):
+        assert list(DEFAULT_DESIGNATIONS) == Config.DESIGNATIONS
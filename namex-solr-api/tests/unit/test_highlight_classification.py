@@ -0,0 +1,58 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the solr highlights of a result page are classified."""
+from namex_solr_api.services.namex_solr.doc_models import NameField
+from namex_solr_api.services.namex_solr.utils import classify_highlights
+
+
+def test_classify_highlights():
+    """Assert each class excludes the terms of the previous classes."""
+    highlighting = [
+        {
+            NameField.NAME_Q_SINGLE.value: ["PACIFIC", "<em>HOLDINGS</em>"],
+            NameField.NAME_Q_STEM_HIGHLIGHT.value: ["PACIFIC HOLDINGS"],
+            NameField.NAME_Q_PHON_EN.value: ["pacific", "pasific"],
+            NameField.NAME_Q_SYN.value: ["holdings", "hldgs"],
+        },
+        {NameField.NAME_Q_PHON_EN.value: ["PASSIFIC"]},
+        {},
+    ]
+
+    page = classify_highlights("pacific hold", highlighting)
+
+    assert [{key: sorted(value) for key, value in result.items()} for result in page] == [
+        {"exact": ["HOLD", "PACIFIC"], "stems": ["HOLDINGS"], "phonetic": ["PASIFIC"], "synonyms": ["HLDGS"]},
+        {"exact": [], "stems": [], "phonetic": ["PASSIFIC"], "synonyms": []},
+        {"exact": [], "stems": [], "phonetic": [], "synonyms": []},
+    ]
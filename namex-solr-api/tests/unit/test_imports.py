@@ -0,0 +1,67 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the import envelope is validated as expected."""
+import pytest
+
+from namex_solr_api.resources.internal.solr.imports import get_delete_errors, get_pass_through_errors
+
+
+@pytest.mark.parametrize("args,body,expected_errors", [
+    ({"type": "full", "timeout": "60", "count": "1"}, b'[{"id": "NR1234567"}]', 0),
+    ({"type": "partial", "count": "2"}, b' \n[{"id": "A"}, {"id": "B"}]\n', 0),
+    ({"type": "full", "count": "1", "core": "shadow"}, b'[{"id": "A"}]', 0),
+    ({"type": "full", "count": "1", "core": "other"}, b'[{"id": "A"}]', 1),
+    ({"type": "other", "timeout": "60", "count": "1"}, b'[{"id": "A"}]', 1),
+    ({"type": "full", "timeout": "201", "count": "1"}, b'[{"id": "A"}]', 1),
+    ({"type": "full", "timeout": "60"}, b'[{"id": "A"}]', 1),
+    ({"type": "full", "timeout": "60", "count": "1"}, b'[{"id": "A"}', 1),
+    ({}, b"[", 3),
+])
+def test_pass_through_envelope(args, body, expected_errors):
+    """Assert only the envelope of a pass through import is validated."""
+    assert len(get_pass_through_errors(args, body)) == expected_errors
+
+
+@pytest.mark.parametrize("request_json,expected_errors", [
+    ({"ids": ["NR 1234567", "A1234567"]}, 0),
+    ({}, 1),
+    ({"ids": []}, 1),
+    ({"ids": "NR 1234567"}, 1),
+    ({"ids": ["NR 1234567", 1234567]}, 1),
+    ({"ids": [None]}, 1),
+    (["NR 1234567"], 1),
+])
+def test_delete_payload(request_json, expected_errors):
+    """Assert the delete ids must be a list of strings."""
+    assert len(get_delete_errors(request_json)) == expected_errors
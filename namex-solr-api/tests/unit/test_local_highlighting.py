@@ -0,0 +1,63 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the returned names are highlighted locally like the solr highlighted fields."""
+import pytest
+
+from namex_solr_api.services.namex_solr.utils import get_local_highlights
+
+
+@pytest.mark.parametrize("query, name, expected", [
+    ("pacific", "PACIFIC HOLDINGS LTD.", {"exact": ["PACIFIC"], "stems": [], "phonetic": [], "synonyms": []}),
+    ("pac", "PACIFIC HOLDINGS LTD.", {"exact": ["PAC"], "stems": [], "phonetic": [], "synonyms": []}),
+    ("holding", "PACIFIC HOLDINGS LTD.", {"exact": ["HOLDING"], "stems": ["HOLDINGS"], "phonetic": [], "synonyms": []}),
+    ("consulted", "ACME CONSULTING INC.", {"exact": [], "stems": ["CONSULTING"], "phonetic": [], "synonyms": []}),
+    ("smyth", "SMITH & SONS LTD.", {"exact": [], "stems": [], "phonetic": ["SMITH"], "synonyms": []}),
+    ("mountain", "MTN VIEW CAFE", {"exact": [], "stems": [], "phonetic": [], "synonyms": ["MTN"]}),
+    ("british columbia", "BC WIDGETS", {"exact": [], "stems": [], "phonetic": [], "synonyms": ["BC"]}),
+    ("bc", "BRITISH COLUMBIA WIDGETS", {"exact": [], "stems": [], "phonetic": [], "synonyms": ["BRITISH COLUMBIA"]}),
+])
+def test_local_highlights(query, name, expected):
+    """Assert each highlight class matches the solr analysis of its field."""
+    synonyms = {"mountain": ["mtn"], "british columbia": ["bc"], "bc": ["british columbia"]}
+
+    assert get_local_highlights(query, [name], synonyms) == [expected]
+
+
+def test_local_highlights_page():
+    """Assert a page of names is highlighted in order."""
+    highlights = get_local_highlights("cedar", ["CEDAR BAY LTD.", "SEDAR INC.", "OAK LTD."], {})
+
+    assert [highlight["exact"] for highlight in highlights] == [["CEDAR"], [], []]
+    assert highlights[1]["phonetic"] == ["SEDAR"]
+    assert highlights[2] == {"exact": [], "stems": [], "phonetic": [], "synonyms": []}
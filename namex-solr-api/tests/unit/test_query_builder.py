@@ -0,0 +1,224 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the name search filters are built for the configured mode."""
+import json
+from pathlib import Path
+
+import pytest
+
+from namex_solr_api.services.base_solr.utils import FuzzyPolicy, QueryParams
+from namex_solr_api.services.namex_solr import NamexSolr
+from namex_solr_api.services.namex_solr.doc_models import NameField, PCField
+from namex_solr_api.services.namex_solr.utils import apply_conflict_candidate_filter, namex_search
+
+PARAM_SETS_PATH = Path(__file__).parents[3] / "namex-solr" / "solr" / "name_request" / "conf" / "params.json"
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_parent_filters_for_child_search(flat):
+    """Assert parent filters are block joins unless flat, where they use the denormalized name fields."""
+    builder = NamexSolr("SOLR_SVC_NAMEX").query_builder
+    builder.flat_parent_filters = flat
+
+    state_filter = builder.build_facet_query(PCField.STATE, ["ACTIVE", "APPROVED"], False, True)
+    id_filters = builder.build_filter_clause({"value": "test", PCField.CORP_NUM_Q.value: "BC123"}, True)
+    # child level filters / parent searches are unchanged
+    assert builder.build_facet_query(NameField.NAME_STATE, ["A"], True, True) == 'name_state:("A")'
+    assert builder.build_facet_query(PCField.STATE, ["ACTIVE"], False, False) == 'state:("ACTIVE")'
+    assert builder.create_clause(NameField.NAME_Q.value, "test", True, False) == (
+        '{!parent which="type:*"}name_q:test'
+    )
+
+    if flat:
+        assert state_filter == 'parent_state:("ACTIVE" OR "APPROVED")'
+        assert id_filters == ["parent_corp_num_q:BC123"]
+    else:
+        assert state_filter == '{!child of="type:*"}state:("ACTIVE" OR "APPROVED")'
+        assert id_filters == ['{!child of="type:*"}corp_num_q:BC123']
+
+
+def test_parent_filter_without_child_field():
+    """Assert a parent field without a denormalized name field is still block joined."""
+    builder = NamexSolr("SOLR_SVC_NAMEX").query_builder
+    builder.flat_parent_filters = True
+
+    assert builder.create_clause(PCField.START_DATE.value, "2020", False, True) == (
+        '{!child of="type:*"}start_date:2020'
+    )
+
+
+@pytest.mark.parametrize("enabled, states, expected", [
+    (True, ["ACTIVE", "APPROVED", "CONDITION", "ACT", "LIQ"], True),
+    (True, ["ACTIVE"], False),
+    (False, ["ACTIVE", "APPROVED", "CONDITION", "ACT", "LIQ"], False),
+])
+def test_apply_conflict_candidate_filter(enabled, states, expected):
+    """Assert the default conflict filters are replaced by the precomputed flag (custom filters are kept)."""
+    solr = NamexSolr("SOLR_SVC_NAMEX")
+    solr.conflict_candidate_filter = enabled
+    params = QueryParams(query={"value": "test"}, rows=10, start=0,
+                         categories={PCField.JURISDICTION: None, PCField.STATE: states},
+                         child_query={},
+                         child_categories={NameField.NAME_STATE: ["A", "C", "CORP"]},
+                         fields=[], highlighted_fields=[], query_fields={}, query_boost_fields={},
+                         query_fuzzy_fields={}, query_synonym_fields={}, full_query_boosts=[],
+                         exclude_sub_types=["DBA", "FR", "GP", "LL", "LP"])
+
+    apply_conflict_candidate_filter(params, solr)
+
+    if expected:
+        assert params.filters == ["is_conflict_candidate:true"]
+        assert params.categories[PCField.STATE] is None
+        assert params.child_categories[NameField.NAME_STATE] is None
+        assert params.exclude_sub_types == []
+    else:
+        assert params.filters == []
+        assert params.categories[PCField.STATE] == states
+        assert params.exclude_sub_types
+
+
+def test_name_variant_query_boosts():
+    """Assert the indexed name variant boosts are plain phrases (no slop) on the variant fields."""
+    solr = NamexSolr("SOLR_SVC_NAMEX")
+    solr.indexed_name_variants = True
+
+    boosts = solr.get_name_search_full_query_boost("E - Z Holdings Inc.")
+
+    assert not any(boost.get("fuzzy") for boost in boosts)
+    variants = {boost["field"]: boost["value"] for boost in boosts}
+    assert variants[NameField.NAME_Q_BASE] == "ez holdings"
+    assert variants[NameField.NAME_Q_DASHLESS] == "ez holdings inc."
+    assert NameField.NAME_Q_DASHLESS not in {
+        boost["field"] for boost in solr.get_name_search_full_query_boost("EZ Holdings Inc.")
+    }
+
+
+FUZZY_FIELDS = {
+    NameField.NAME_Q: {"short": 1, "long": 2},
+    NameField.NAME_Q_SINGLE: {"short": 0, "long": 2},
+}
+
+
+def get_fuzzy_clauses(policy: FuzzyPolicy, terms: list[str]) -> list[str]:
+    """Return the fuzzy clauses of the term clauses built under the policy."""
+    builder = NamexSolr("SOLR_SVC_NAMEX").query_builder
+    plan = policy.plan(terms)
+    clauses = []
+    for term in terms:
+        term_clause = builder.build_term_clause(term,
+                                                dict.fromkeys(FUZZY_FIELDS, "child"),
+                                                {},
+                                                FUZZY_FIELDS,
+                                                True,
+                                                fuzzy_plan=plan)
+        clauses += [clause for clause in term_clause.split(" OR ") if "~" in clause]
+    return clauses
+
+
+@pytest.mark.parametrize("policy, expected", [
+    (FuzzyPolicy(), ["name_q:cedar~1", "name_q_single_term:cedar~0",
+                     "name_q:HOLDINGS~2", "name_q_single_term:HOLDINGS~2"]),
+    (FuzzyPolicy(max_clauses=3), ["name_q:cedar~1", "name_q_single_term:cedar~0", "name_q:HOLDINGS~2"]),
+    (FuzzyPolicy(skip_fields=[NameField.NAME_Q_SINGLE.value]), ["name_q:cedar~1", "name_q:HOLDINGS~2"]),
+    (FuzzyPolicy(exact_terms_lookup=lambda terms: {"holdings"}), ["name_q:cedar~1", "name_q_single_term:cedar~0"]),
+])
+def test_fuzzy_policy(policy, expected):
+    """Assert the fuzzy policy caps / skips the fuzzy clauses (the default keeps all of them)."""
+    assert get_fuzzy_clauses(policy, ["cedar", "ltd", "HOLDINGS"]) == expected
+
+
+@pytest.mark.parametrize("tiered, exhaustive, precise_found, start, tier, expected_tier, expected_queries", [
+    (False, False, 10, 0, None, "full", 1),
+    (True, False, 10, 0, None, "precise", 1),
+    (True, False, 3, 0, None, "full", 2),
+    (True, True, 10, 0, None, "full", 1),
+    # later pages rerun the tier of the first page
+    (True, False, 3, 10, "precise", "precise", 1),
+    (True, False, 30, 10, "full", "full", 1),
+    (True, False, 30, 10, None, "full", 1),
+])
+def test_tiered_search(tiered, exhaustive, precise_found, start, tier, expected_tier, expected_queries):  # noqa: PLR0913
+    """Assert the full query only runs when the precise query doesn't fill the first page (or is exhaustive)."""
+    solr = NamexSolr("SOLR_SVC_NAMEX")
+    solr.tiered_search = tiered
+    queries = []
+
+    def query(payload, start, rows, params):
+        queries.append(payload["query"])
+        return {"response": {"numFound": precise_found if len(queries) == 1 else 50, "docs": []}}
+
+    solr.query = query
+    params = QueryParams(query={"value": "cedar holdings"}, rows=10, start=start, categories={}, child_query={},
+                         child_categories={}, fields=[], highlighted_fields=[],
+                         query_fields={NameField.NAME_Q: "child", NameField.NAME_Q_PHON_EN: "child"},
+                         query_boost_fields={}, query_fuzzy_fields={NameField.NAME_Q: {"short": 1, "long": 2}},
+                         query_synonym_fields={}, full_query_boosts=[], exclude_sub_types=[],
+                         precise_query_fields={NameField.NAME_Q: "child"}, exhaustive=exhaustive, tier=tier)
+
+    assert namex_search(params, solr, True)["tier"] == expected_tier
+    assert len(queries) == expected_queries
+    if expected_tier == "precise":
+        assert "~" not in queries[0]
+        assert NameField.NAME_Q_PHON_EN.value not in queries[0]
+
+
+def test_param_sets(monkeypatch):
+    """Assert the paramsets hold the static search params so only useParams is sent with the query."""
+    solr = NamexSolr("SOLR_SVC_NAMEX")
+    param_sets = json.loads(PARAM_SETS_PATH.read_text())["params"]
+    name_search = param_sets[solr.name_search_param_set]
+    assert name_search["fl"].split(",") == solr.resp_fields_nested
+    assert name_search["parents"] == f"{NameField.PARENT_TYPE.value}:*"
+    assert param_sets[solr.nr_search_param_set]["fl"].split(",") == solr.resp_fields
+    assert param_sets[solr.nr_search_param_set]["parents"] == f"{PCField.TYPE.value}:*"
+
+    requests = []
+    monkeypatch.setattr(solr, "query", lambda payload, start, rows, params: requests.append((payload, params)) or {})
+    params = QueryParams(query={"value": "cedar"}, rows=10, start=0, categories={}, child_query={},
+                         child_categories={}, fields=solr.resp_fields_nested,
+                         highlighted_fields=[NameField.NAME_Q_SINGLE], query_fields={NameField.NAME_Q: "child"},
+                         query_boost_fields={}, query_fuzzy_fields={}, query_synonym_fields={}, full_query_boosts=[],
+                         exclude_sub_types=[], param_set=solr.name_search_param_set)
+    for use_param_sets in (False, True):
+        solr.use_param_sets = use_param_sets
+        namex_search(params, solr, True)
+
+    (payload, request_params), (set_payload, set_request_params) = requests
+    assert request_params is None
+    assert payload["queries"]["parents"] == name_search["parents"]
+    assert payload["params"]["hl.tag.pre"] == name_search["hl.tag.pre"]
+    assert set_request_params == {"useParams": solr.name_search_param_set}
+    assert "fields" not in set_payload
+    assert "params" not in set_payload
+    assert set(set_payload["queries"]) == {"parentFilters"}
@@ -0,0 +1,138 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the background reindex jobs run as expected."""
+from unittest.mock import Mock
+
+import pytest
+from flask import url_for
+
+from namex_solr_api.exceptions import SolrException
+from namex_solr_api.services import reindex_jobs
+
+
+class _Job:
+    """Stand in for the ReindexJob model (records the progress without a db)."""
+
+    def __init__(self):
+        self.id = 1
+        self.current_step = None
+        self.progress = []
+        self.error = None
+        self.heartbeats = 0
+
+    def heartbeat(self):
+        self.heartbeats += 1
+
+    def start_step(self, name):
+        self.current_step = name
+        self.progress.append((name, "RUNNING"))
+
+    def finish_step(self, status="COMPLETE"):
+        self.progress.append((self.current_step, status))
+
+    def finish(self, error=None):
+        self.error = error
+
+
+def test_wait_for_backoff(app, monkeypatch):
+    """Assert the check is polled with exponential backoff up to the max interval."""
+    sleeps = []
+    monkeypatch.setattr(reindex_jobs, "sleep", sleeps.append)
+    results = iter([False, False, False, False, True])
+
+    reindex_jobs.wait_for(lambda: next(results), "test", interval=2, max_interval=5)
+    assert sleeps == [2, 4, 5, 5]
+
+
+def test_wait_for_heartbeat(app, monkeypatch):
+    """Assert the on poll callback is called before each wait."""
+    polls = []
+    monkeypatch.setattr(reindex_jobs, "sleep", lambda _: None)
+    results = iter([False, False, True])
+
+    reindex_jobs.wait_for(lambda: next(results), "test", on_poll=lambda: polls.append(True))
+    assert polls == [True, True]
+
+
+def test_wait_for_timeout(app, monkeypatch):
+    """Assert a SolrException is raised when the check doesn't pass in time."""
+    monkeypatch.setattr(reindex_jobs, "sleep", lambda _: None)
+    with pytest.raises(SolrException):
+        reindex_jobs.wait_for(lambda: False, "test", timeout=0)
+
+
+def test_run_steps(app):
+    """Assert the step progress is recorded and the job stops at the failed step."""
+    def _fail(context):
+        raise SolrException(error="backup failed")
+
+    first_step = Mock(__name__="first_step")
+    last_step = Mock(__name__="last_step")
+    job = _Job()
+    reindex_jobs.run_steps(job, [first_step, _fail, last_step])
+
+    assert job.progress == [
+        ("first_step", "RUNNING"),
+        ("first_step", "COMPLETE"),
+        ("_fail", "RUNNING"),
+    ]
+    assert job.error.startswith("backup failed")
+    last_step.assert_not_called()
+
+
+def test_run_steps_heartbeat(app, monkeypatch):
+    """Assert the job heartbeats for each solr tier the step runs against."""
+    monkeypatch.setattr(reindex_jobs.solr, "create_shadow_core", Mock())
+    monkeypatch.setattr(reindex_jobs.solr, "type_tiers", {"CORP": Mock()})
+    job = _Job()
+    reindex_jobs.run_steps(job, [reindex_jobs.create_shadow_core])
+    assert job.heartbeats == len(reindex_jobs.solr.tiers)
+
+
+def test_start_reindex_job_active(app, monkeypatch):
+    """Assert the job start is serialized and the active job is returned instead of starting a new one."""
+    calls = []
+    active_job = _Job()
+    monkeypatch.setattr(reindex_jobs.ReindexJob, "lock_jobs", lambda: calls.append("lock"))
+    monkeypatch.setattr(reindex_jobs.ReindexJob, "find_active", lambda _: calls.append("find") or active_job)
+    monkeypatch.setattr(reindex_jobs.ReindexJob, "rollback", lambda: calls.append("rollback"))
+
+    assert reindex_jobs.start_reindex_job(reindex_jobs.ReindexJob.Type.PREP) == (active_job, False)
+    assert calls == ["lock", "find", "rollback"]
+
+
+def test_job_status_url(app):
+    """Assert the job status endpoint is registered."""
+    with app.test_request_context():
+        assert url_for("INTERNAL.SOLR.REINDEX.get_reindex_job", job_id=1) == "/internal/solr/reindex/jobs/1"
@@ -34,7 +34,12 @@
 """Unit tests for search endpoints."""
 import pytest
 from unittest.mock import Mock, patch
-from namex_solr_api.services.namex_solr.doc_models import PCField
+from namex_solr_api.services.namex_solr.doc_models import (
+    CONFLICT_EXCLUDED_SUB_TYPES,
+    CONFLICT_NAME_STATES,
+    CONFLICT_STATES,
+    PCField,
+)
 
 
 class TestSearchConfiguration:
@@ -46,10 +51,8 @@ class TestSearchConfiguration:
         import inspect
 
         source = inspect.getsource(search.possible_conflict_names)
-        assert '"ACT"' in source or "'ACT'" in source
-        assert '"LIQ"' in source or "'LIQ'" in source
-        assert 'APPROVED' in source
-        assert 'CONDITION' in source
+        assert 'CONFLICT_STATES' in source
+        assert {'ACT', 'LIQ', 'APPROVED', 'CONDITION'} <= CONFLICT_STATES
 
     def test_conflict_states_list_complete(self, app):
         """Test that full conflict states list is configured correctly."""
@@ -58,7 +61,9 @@ class TestSearchConfiguration:
         with app.app_context():
             source = inspect.getsource(search.possible_conflict_names)
             assert 'conflict_states' in source
-            assert 'ACTIVE' in source or "'ACTIVE'" in source or '"ACTIVE"' in source
+            assert 'CONFLICT_NAME_STATES' in source
+            assert 'ACTIVE' in CONFLICT_STATES
+            assert CONFLICT_NAME_STATES == {'A', 'C', 'CORP'}
 
     def test_search_module_exports_endpoints(self, app):
         """Test that search module exports both endpoints."""
@@ -75,10 +80,8 @@ class TestSearchConfiguration:
         import inspect
 
         source = inspect.getsource(search.possible_conflict_names)
-        assert 'exclude_sub_types' in source
-        assert 'DBA' in source
-        assert 'FR' in source or 'fr' in source.lower()
-        assert 'GP' in source or 'gp' in source.lower()
+        assert 'exclude_sub_types=sorted(CONFLICT_EXCLUDED_SUB_TYPES)' in source
+        assert {'DBA', 'FR', 'GP'} <= CONFLICT_EXCLUDED_SUB_TYPES
 
 
 class TestSearchInitialization:
@@ -109,20 +112,22 @@ class TestConflictStatesConfiguration:
         """Verify ACT state is in conflict filter."""
         from namex_solr_api.resources.v1 import search
         source = inspect.getsource(search.possible_conflict_names)
-        assert 'ACT' in source
+        assert 'CONFLICT_STATES' in source
+        assert 'ACT' in CONFLICT_STATES
 
     def test_liq_state_included(self, app):
         """Verify LIQ state is in conflict filter."""
         from namex_solr_api.resources.v1 import search
         source = inspect.getsource(search.possible_conflict_names)
-        assert 'LIQ' in source
+        assert 'CONFLICT_STATES' in source
+        assert 'LIQ' in CONFLICT_STATES
 
     def test_approved_condition_states_included(self, app):
         """Verify APPROVED and CONDITION states are included."""
         from namex_solr_api.resources.v1 import search
         source = inspect.getsource(search.possible_conflict_names)
-        assert 'APPROVED' in source
-        assert 'CONDITION' in source
+        assert 'CONFLICT_STATES' in source
+        assert {'APPROVED', 'CONDITION'} <= CONFLICT_STATES
 
 
 import inspect
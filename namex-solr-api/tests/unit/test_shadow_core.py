@@ -0,0 +1,71 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the blue/green reindex core admin calls are made as expected."""
+from unittest.mock import Mock
+
+from namex_solr_api.services import solr
+
+
+def test_create_shadow_core(app, monkeypatch):
+    """Assert the shadow core kept from the previous swap is replaced by an empty one."""
+    call_solr = Mock()
+    call_solr.return_value.json.return_value = {"status": {solr.shadow_core: {"name": solr.shadow_core}}}
+    monkeypatch.setattr(solr, "call_solr", call_solr)
+
+    solr.create_shadow_core()
+    actions = [call.kwargs["params"] for call in call_solr.call_args_list]
+    assert actions == [
+        {"action": "STATUS", "core": solr.shadow_core},
+        {"action": "UNLOAD", "core": solr.shadow_core, "deleteIndex": "true", "deleteDataDir": "true"},
+        {
+            "action": "CREATE",
+            "name": solr.shadow_core,
+            "instanceDir": solr.shadow_core,
+            "configSet": solr.shadow_config_set,
+        },
+    ]
+
+
+def test_swap_shadow_core(app, monkeypatch):
+    """Assert the shadow core is swapped with the leader core."""
+    call_solr = Mock()
+    monkeypatch.setattr(solr, "call_solr", call_solr)
+
+    solr.swap_shadow_core()
+    assert call_solr.call_args.args == ("GET", solr.core_admin_url)
+    assert call_solr.call_args.kwargs["params"] == {
+        "action": "SWAP",
+        "core": solr.leader_core,
+        "other": solr.shadow_core,
+    }
@@ -0,0 +1,164 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the docs / searches are split between the solr tiers (type / historical cores) as expected."""
+from unittest.mock import Mock
+
+import pytest
+
+from namex_solr_api.services.base_solr.utils import QueryParams
+from namex_solr_api.services.namex_solr import NamexSolr
+from namex_solr_api.services.namex_solr.doc_models import NameField, PCField
+from namex_solr_api.services.namex_solr.utils import namex_search_helper
+
+
+def _payloads(tier):
+    return [call.kwargs["json_data"] for call in tier.call_solr.call_args_list]
+
+
+@pytest.fixture
+def tiered_solr(app, monkeypatch):
+    """Return a namex solr instance with corp and historical tiers (solr calls mocked)."""
+    monkeypatch.setitem(app.config, "SOLR_SVC_NAMEX_CORP_LEADER_CORE", "name_request_corp")
+    monkeypatch.setitem(app.config, "SOLR_SVC_NAMEX_CORP_FOLLOWER_CORE", "name_request_corp_follower")
+    monkeypatch.setitem(app.config, "SOLR_SVC_NAMEX_HISTORICAL_LEADER_CORE", "name_request_historical")
+    monkeypatch.setitem(app.config, "SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_CORE", "name_request_historical_follower")
+    tiered = NamexSolr("SOLR_SVC_NAMEX")
+    tiered.init_app(app)
+    for tier in tiered.tiers:
+        tier.call_solr = Mock()
+    return tiered
+
+
+def test_single_tier(app):
+    """Assert every doc / search stays in the one tier when there are no type / historical cores."""
+    single = NamexSolr("SOLR_SVC_NAMEX")
+    single.init_app(app)
+    assert single.tiers == [single]
+    assert single.get_doc_tier({"id": "A1", "type": "CORP", "state": "HISTORICAL"}) is single
+    assert single.get_search_tiers(active=False, historical=True, types=["CORP"]) == [single]
+
+
+def test_docs_routed_by_tier(tiered_solr):
+    """Assert the docs are written to the tier for their type / state and removed from the tier they moved from."""
+    corp_tier = tiered_solr.type_tiers["CORP"]
+    docs = [
+        {"id": "NR 1", "type": "NR", "state": "APPROVED"},
+        {"id": "NR 2", "type": "NR", "state": "EXPIRED"},
+        {"id": "A1", "type": "CORP", "state": "ACTIVE"},
+        {"id": "A2", "type": "CORP", "state": "HISTORICAL"},
+        {"id": "NR 3"},
+    ]
+    tiered_solr.create_or_replace_docs(raw_docs=docs, remove_moved=True)
+
+    assert _payloads(tiered_solr) == [[docs[0], docs[4]], {"delete": ["NR 2"]}]
+    assert _payloads(corp_tier) == [[docs[2]], {"delete": ["A2"]}]
+    assert _payloads(tiered_solr.historical) == [[docs[1], docs[3]], {"delete": ["NR 1", "A1", "NR 3"]}]
+
+
+def test_bulk_docs_routed_by_tier(tiered_solr):
+    """Assert an import batch split between the tiers is neither committed nor removed from the other tiers."""
+    docs = [{"id": f"A{i}", "type": "CORP", "state": "ACTIVE" if i % 4 else "HISTORICAL"} for i in range(1000)]
+    tiered_solr.create_or_replace_docs(raw_docs=docs)
+
+    for tier in tiered_solr.tiers:
+        for call in tier.call_solr.call_args_list:
+            assert call.args[1] == tier.bulk_update_url
+    assert _payloads(tiered_solr) == []
+    assert [len(payload) for payload in _payloads(tiered_solr.type_tiers["CORP"])] == [750]
+    assert [len(payload) for payload in _payloads(tiered_solr.historical)] == [250]
+
+
+def test_shadow_docs_routed_by_tier(tiered_solr):
+    """Assert a shadow import goes to each tier's shadow core (nothing to remove from the empty cores)."""
+    docs = [{"id": "A1", "type": "CORP", "state": "ACTIVE"}, {"id": "A2", "type": "CORP", "state": "HISTORICAL"}]
+    tiered_solr.create_or_replace_docs(raw_docs=docs, core=tiered_solr.shadow_core)
+
+    assert tiered_solr.call_solr.call_count == 0
+    for tier in tiered_solr.tiers[1:]:
+        assert tier.call_solr.call_count == 1
+        assert tier.call_solr.call_args.kwargs["core"] == tier.shadow_core
+
+
+@pytest.mark.parametrize("states,filters,expected", [
+    (["ACTIVE", "APPROVED", "CONDITION", "ACT", "LIQ"], [], (True, False)),
+    (["EXPIRED", "consumed"], [], (False, True)),
+    (["APPROVED", "EXPIRED"], [], (True, True)),
+    (None, [], (True, True)),
+    (None, [f"{NameField.IS_CONFLICT_CANDIDATE.value}:true"], (True, False)),
+])
+def test_search_states(states, filters, expected):
+    """Assert only the active / historical tiers holding the requested states are searched."""
+    params = QueryParams(query={"value": "test"}, rows=10, start=0, categories={PCField.STATE: states},
+                         child_query={}, child_categories={}, fields=[], highlighted_fields=[], query_fields={},
+                         query_boost_fields={}, query_fuzzy_fields={}, query_synonym_fields={}, full_query_boosts=[],
+                         exclude_sub_types=[], filters=filters)
+    assert namex_search_helper.get_state_tiers(params) == expected
+
+
+@pytest.mark.parametrize("active,historical,types,expected", [
+    (True, False, None, [0, 1]),
+    (True, False, ["NR"], [0]),
+    (True, False, ["corp"], [1]),
+    (False, True, ["NR"], [2]),
+    (True, True, None, [0, 1, 2]),
+])
+def test_search_tiers(tiered_solr, active, historical, types, expected):
+    """Assert only the tiers holding the requested types / states are searched."""
+    tiers = tiered_solr.get_search_tiers(active, historical, types)
+    assert tiers == [tiered_solr.tiers[index] for index in expected]
+
+
+def test_query_tiers(tiered_solr):
+    """Assert the tiers' results are merged by score and paged."""
+    corp_tier = tiered_solr.type_tiers["CORP"]
+    tiered_solr.query = Mock(return_value={
+        "responseHeader": {"status": 0, "QTime": 12},
+        "response": {"numFound": 30, "docs": [{"id": "NR 1", "score": 9}, {"id": "NR 2", "score": 5},
+                                              {"id": "NR 3", "score": 1}]},
+        "highlighting": {"NR 1": {}},
+    })
+    corp_tier.query = Mock(return_value={
+        "responseHeader": {"status": 0, "QTime": 20},
+        "response": {"numFound": 2, "docs": [{"id": "A1", "score": 7}, {"id": "A2", "score": 6}]},
+        "highlighting": {"A1": {}},
+        "facets": {"count": 2},
+    })
+
+    resp = tiered_solr.query_tiers([tiered_solr, corp_tier], {"query": "*:*"}, 1, 3, fields=["id"])
+    assert resp["responseHeader"] == {"status": 0, "QTime": 20}
+    assert "facets" not in resp
+    assert resp["response"] == {"numFound": 32, "start": 1, "docs": [{"id": "A1"}, {"id": "A2"}, {"id": "NR 2"}]}
+    assert resp["highlighting"] == {"NR 1": {}, "A1": {}}
+    for tier in (tiered_solr, corp_tier):
+        assert tier.query.call_args.args == ({"query": "*:*", "fields": ["id", "score"]}, 0, 4, None)
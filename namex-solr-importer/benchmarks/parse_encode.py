@@ -0,0 +1,108 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Micro-benchmark of the importer parse + encode stage (docs/sec).
+
+Compares the dataclasses.asdict encoding with the direct PossibleConflict.to_dict encoding on
+synthetic COLIN/NameX rows (no database or solr needed).
+
+    python benchmarks/parse_encode.py --rows 1000000
+"""
+
+import argparse
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from namex_solr_importer.utils.data_parsing import parse_conflict
+
+
+def get_rows(count: int, conflict_type: str) -> list[dict]:
+    """Return synthetic extraction rows."""
+    if conflict_type == "CORP":
+        return [
+            {
+                "corp_num": f"BC{num:07d}",
+                "name": f"SYNTHETIC HOLDINGS {num} LTD.",
+                "state": "ACTIVE",
+                "sub_type": "BC",
+                "jurisdiction": None,
+                "start_date": datetime(2000 + num % 25, 1 + num % 12, 1 + num % 28),
+            }
+            for num in range(count)
+        ]
+    return [
+        {
+            "nr_num": f"NR {num:07d}",
+            "names": [
+                {"name": f"SYNTHETIC NAME {num} {choice} INC.", "name_state": "NE", "submit_count": 1, "choice": choice}
+                for choice in (1, 2, 3)
+            ],
+            "state": "DRAFT",
+            "sub_type": "CR",
+            "jurisdiction": "BC",
+            "start_date": datetime(2024, 1 + num % 12, 1 + num % 28),
+        }
+        for num in range(count)
+    ]
+
+
+def run(rows: list[dict], conflict_type: str, encoder: str, batch_size: int) -> float:
+    """Return the docs/sec for parsing, encoding and serializing the rows in batches."""
+    started_at = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        if encoder == "asdict":
+            docs = [asdict(parse_conflict(row, conflict_type)) for row in rows[offset:offset + batch_size]]
+        else:
+            docs = [parse_conflict(row, conflict_type).to_dict() for row in rows[offset:offset + batch_size]]
+        json.dumps(docs).encode()
+    return len(rows) / (time.perf_counter() - started_at)
+
+
+def main():
+    """Run the benchmark for each conflict type and encoder."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    for conflict_type in ("CORP", "NR"):
+        rows = get_rows(args.rows, conflict_type)
+        for encoder in ("asdict", "to_dict"):
+            docs_per_sec = run(rows, conflict_type, encoder, args.batch_size)
+            print(f"{conflict_type:<5} {encoder:<8} {docs_per_sec:>12,.0f} docs/sec")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -33,234 +33,591 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """The Search solr data import service."""
 
+import json
 import os
 import sys
-from dataclasses import asdict
+from collections.abc import Callable, Iterable, Iterator
 from datetime import UTC, datetime
+from functools import partial
 
 from flask import current_app
-from sqlalchemy import CursorResult
 
 from namex_solr_api.exceptions import SolrException
-from namex_solr_importer import create_app
+from namex_solr_importer import create_app, lear_db, oracle_db
 from namex_solr_importer.utils import (
+    ImportCheckpoint,
+    KeyRange,
+    MemoryGuard,
+    ReplayCacheWriter,
+    SnapshotDiff,
+    UploadPool,
+    api_client,
     collect_colin_data,
+    collect_colin_data_frames,
     collect_lear_data,
     collect_namex_data,
     collect_synonyms_data,
+    delete_conflicts,
+    encode_batches,
+    fetch_row_dicts,
+    get_colin_key_ranges,
+    get_lear_key_ranges,
+    get_lear_watermark,
+    get_namex_watermark,
+    get_replay_manifest,
+    get_state_path,
+    get_watermark,
     import_conflicts,
+    import_encoded_batch,
+    import_metrics,
+    is_swap_reindex,
+    join_encoded_docs,
     parse_conflict,
+    parse_conflict_frames,
     parse_synonyms,
+    read_replay_batches,
     reindex_post,
     reindex_prep,
     reindex_recovery,
     resync,
+    set_watermark,
+    stream_partitioned_rows,
     update_synonyms,
 )
 
+COLIN_SNAPSHOT_FILE = "colin_snapshot.sqlite"
+# the sources extracted since their last watermark in a delta import
+DELTA_SOURCES = ("namex", "lear")
 
-def _load_synonyms():
-    """Update namex search with the synonyms from the solr admin app."""
+
+def _load_synonyms(cache: ReplayCacheWriter | None = None):
+    """Update namex search with the synonyms from the solr admin app (no possible conflicts are imported)."""
     current_app.logger.debug("---------- Collecting/Updating Synonyms ----------")
     syn_data_cur = collect_synonyms_data()
     syn_data = syn_data_cur.fetchall()
     synonym_payload = parse_synonyms(syn_data)
+    if cache:
+        cache.write([synonym_payload])
     update_synonyms(synonym_payload)
     current_app.logger.debug("---------- Synonym update completed ----------.")
-
-
-def _load_conflicts(data_cur: CursorResult, data_name: str, conflict_type: str):
-    """Update namex search with the given conflicts."""
-    # NOTE: for the colin connection the data_cur is not a 'CursorResult' type
-    if isinstance(data_cur, CursorResult):
-        namex_descs = data_cur.keys()
-    else:
-        namex_descs = [desc[0].lower() for desc in data_cur.description]
-
-    batch_size = current_app.config["BATCH_SIZE"]
-    count = 0
+    return 0, None
+
+
+def _import_batch(  # noqa: PLR0913
+    uploads: UploadPool,
+    upload: Callable,
+    args: tuple,
+    keys: list[str],
+    *,
+    data_name: str,
+    checkpoint: ImportCheckpoint | None,
+) -> int:
+    """Submit the batch upload (recording its keys in the checkpoint once acknowledged) and return the docs done."""
+    on_done = (lambda count: checkpoint.record_batch(keys, count)) if checkpoint else None
+    count = uploads.submit(upload, *args, data_name, on_done=on_done)
+    if count:
+        current_app.logger.debug(f"{data_name} batch upload(s) acknowledged: {count} docs")
+    return count
+
+
+def _group_nr_rows(row_batches: Iterable[list[dict]], batch_size: int) -> Iterator[list[dict]]:
+    """Yield batches of NR data dicts (the name rows of each NR grouped into its 'names')."""
     batch = []
-    last_record = None
-
-    current_app.logger.debug("Streaming data...")
-
-    if conflict_type == "CORP":
-        while True:
-            rows = data_cur.fetchmany(batch_size)
-            if not rows:
-                break
-            for item in rows:
-                item_dict = dict(zip(namex_descs, item, strict=False))
-                doc = asdict(parse_conflict(item_dict, conflict_type))
-                batch.append(doc)
-                last_record = doc
-            if len(batch) >= batch_size:
-                count += import_conflicts(batch, data_name)
-                batch = []
-
-    elif conflict_type == "NR":
-        current_nr_num = None
-        names = []
-        nr_data = None
-
-        while True:
-            rows = data_cur.fetchmany(batch_size)
-            if not rows:
-                break
-            for item in rows:
-                item_dict = dict(zip(namex_descs, item, strict=False))
-                nr_num = item_dict["nr_num"]
-
-                if nr_num != current_nr_num:
-                    # process previous NR
-                    if current_nr_num is not None:
-                        nr_data["names"] = names
-                        doc = asdict(parse_conflict(nr_data, conflict_type))
-                        batch.append(doc)
-                        last_record = doc
-                        if len(batch) >= batch_size:
-                            count += import_conflicts(batch, data_name)
-                            batch = []
-                    # start new NR
-                    current_nr_num = nr_num
-                    names = []
-                    nr_data = item_dict
-
-                name_dict = {
+    nr_data = None
+    for rows in row_batches:
+        for item_dict in rows:
+            if nr_data is None or item_dict["nr_num"] != nr_data["nr_num"]:
+                # start new NR
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                nr_data = {**item_dict, "names": []}
+                batch.append(nr_data)
+            nr_data["names"].append(
+                {
                     "name": item_dict["name"],
                     "name_state": item_dict["name_state"],
                     "submit_count": item_dict["submit_count"],
                     "choice": item_dict["choice"],
                 }
-                names.append(name_dict)
-
-        # process last NR
-        if current_nr_num is not None:
-            nr_data["names"] = names
-            doc = asdict(parse_conflict(nr_data, conflict_type))
-            batch.append(doc)
-            last_record = doc
-
-    current_app.logger.debug("Importing remaining data...")
+            )
     if batch:
-        count += import_conflicts(batch, data_name)
+        yield batch
+
+
+def _limit_batch_size(row_batches: Iterable[list[dict]], batch_size: int) -> Iterator[list[dict]]:
+    """Yield the row batches split into batches of at most batch_size rows."""
+    for rows in row_batches:
+        for offset in range(0, len(rows), batch_size):
+            yield rows[offset:offset + batch_size]
+
+
+def _get_filled_count(sizes: list[int], batch_size: int, max_bytes: int) -> int:
+    """Return the number of docs that fill the next upload batch (0 if there aren't enough docs to fill it yet)."""
+    if max_bytes:
+        total = 0
+        for index, size in enumerate(sizes[:batch_size]):
+            total += size
+            if total >= max_bytes:
+                # a single doc over the limit is still sent on its own
+                return max(index, 1)
+    return batch_size if len(sizes) >= batch_size else 0
+
+
+def _use_parse_pool(snapshot: SnapshotDiff | None, cache: ReplayCacheWriter | None) -> bool:
+    """Return True if the rows should be parsed/encoded in the process pool."""
+    if current_app.config["PARSE_WORKERS"] <= 1:
+        return False
+    if snapshot or cache:
+        # NOTE: the snapshot diff / replay cache need the parsed docs in this process
+        current_app.logger.debug("Snapshot diff / replay cache enabled. Parsing in process.")
+        return False
+    return True
+
+
+def _load_encoded_conflicts(
+    row_batches: Iterable[list[dict]],
+    data_name: str,
+    conflict_type: str,
+    checkpoint: ImportCheckpoint | None,
+    core: str = "live",
+):
+    """Update namex search with the given conflicts parsed/encoded in the process pool."""
+    # NOTE: the checkpoint keys are only valid if the batches are acknowledged in extraction order
+    ordered = current_app.config["PARSE_ORDERED"] or bool(checkpoint and checkpoint.enabled)
+    count = 0
+    last_record = None
+    memory_guard = MemoryGuard()
+    encoded_batches = encode_batches(
+        _limit_batch_size(row_batches, current_app.config["BATCH_SIZE"]),
+        conflict_type,
+        current_app.config["PARSE_WORKERS"],
+        ordered,
+        current_app.config["IMPORT_BATCH_MAX_BYTES"],
+    )
+    upload = partial(import_encoded_batch, core=core)
+    with UploadPool(current_app.config["IMPORT_UPLOAD_WORKERS"]) as uploads:
+        for encoded in encoded_batches:
+            if memory_guard.is_over():
+                count += memory_guard.throttle(uploads.drain)
+            if not encoded.count:
+                continue
+            count += _import_batch(
+                uploads, upload, (encoded.body, encoded.count), encoded.keys, data_name=data_name, checkpoint=checkpoint
+            )
+            last_record = encoded.last_doc
+        count += uploads.drain()
+    return count, ([last_record], data_name)
+
+
+def _load_conflicts(  # noqa: PLR0913
+    row_batches: Iterable[list[dict]],
+    data_name: str,
+    conflict_type: str,
+    *,
+    snapshot: SnapshotDiff | None = None,
+    checkpoint: ImportCheckpoint | None = None,
+    cache: ReplayCacheWriter | None = None,
+    core: str = "live",
+):
+    """Update namex search with the given conflicts (only the new/changed CORP docs if given a snapshot)."""
+    batch_size = current_app.config["BATCH_SIZE"]
+    max_bytes = current_app.config["IMPORT_BATCH_MAX_BYTES"]
+    count = 0
+    # the json encoded batch docs (encoded once, the upload body is joined from them)
+    batch = []
+    # the encoded size of each batch doc (including its separator)
+    batch_sizes = []
+    # the extraction keys of the batch docs (for checkpointing)
+    batch_keys = []
+    last_record = None
+
+    current_app.logger.debug("Streaming data...")
+    if conflict_type == "NR":
+        row_batches = _group_nr_rows(row_batches, batch_size)
+
+    if _use_parse_pool(snapshot, cache):
+        return _load_encoded_conflicts(row_batches, data_name, conflict_type, checkpoint, core)
+
+    upload = partial(import_encoded_batch, core=core)
+    memory_guard = MemoryGuard()
+    with UploadPool(current_app.config["IMPORT_UPLOAD_WORKERS"]) as uploads:
+        for rows in row_batches:
+            if memory_guard.is_over():
+                count += memory_guard.throttle(uploads.drain)
+            docs = [parse_conflict(item_dict, conflict_type).to_dict() for item_dict in rows]
+            if cache:
+                # NOTE: cached before the snapshot diff so the cache always has every doc
+                cache.write(docs)
+            if snapshot:
+                docs = snapshot.filter_changed(docs)
+            encoded_docs = [json.dumps(doc).encode() for doc in docs]
+            batch.extend(encoded_docs)
+            batch_sizes.extend(len(encoded) + 1 for encoded in encoded_docs)
+            batch_keys.extend(row["nr_num"] if conflict_type == "NR" else row["corp_num"] for row in rows)
+            last_record = docs[-1] if docs else last_record
+            while filled := _get_filled_count(batch_sizes, batch_size, max_bytes):
+                # NOTE: the keys go with the batch holding the last doc of their rows (acknowledged in order)
+                keys = batch_keys if filled == len(batch) else []
+                count += _import_batch(
+                    uploads,
+                    upload,
+                    (join_encoded_docs(batch[:filled]), filled),
+                    keys,
+                    data_name=data_name,
+                    checkpoint=checkpoint,
+                )
+                batch = batch[filled:]
+                batch_sizes = batch_sizes[filled:]
+                if keys:
+                    batch_keys = []
+
+        current_app.logger.debug("Importing remaining data...")
+        if batch:
+            count += _import_batch(
+                uploads,
+                upload,
+                (join_encoded_docs(batch), len(batch)),
+                batch_keys,
+                data_name=data_name,
+                checkpoint=checkpoint,
+            )
+        count += uploads.drain()
 
     final_record = [last_record], data_name
     return count, final_record
 
 
-def _load_nrs():
+def _get_import_core(checkpoint: ImportCheckpoint) -> str:
+    """Return the core the run imports into ("shadow" while rebuilding the shadow core for a swap reindex)."""
+    return "shadow" if checkpoint.is_reindex and is_swap_reindex() else "live"
+
+
+def _get_delta_since(source: str) -> datetime | None:
+    """Return the watermark to extract the source from (None for full extractions)."""
+    if not current_app.config["DELTA_IMPORT"]:
+        return None
+    since = get_watermark(source)
+    current_app.logger.debug(f"{source} delta import since: {since or 'no watermark (full extraction)'}")
+    return since
+
+
+def _load_nrs(checkpoint: ImportCheckpoint, cache: ReplayCacheWriter | None = None):
     """Load namex search with the nr possible conflicts."""
     current_app.logger.debug("---------- Collecting/Importing NRs ----------")
-    namex_data_cur = collect_namex_data()
-    count, final_record = _load_conflicts(namex_data_cur, "NameX NR", "NR")
+    since = _get_delta_since("namex")
+    # NOTE: watermark captured before extracting so updates made during the import are picked up next run
+    key_range = checkpoint.start_source("namex", [(None, None)], get_namex_watermark())[0]
+    namex_data_cur = collect_namex_data(since, key_range)
+    row_batches = fetch_row_dicts(namex_data_cur, current_app.config["BATCH_SIZE"])
+    count, final_record = _load_conflicts(
+        row_batches, "NameX NR", "NR", checkpoint=checkpoint, cache=cache, core=_get_import_core(checkpoint)
+    )
+    set_watermark("namex", checkpoint.watermark)
     current_app.logger.debug("---------- NR import completed ----------.")
     return count, final_record
 
 
-def _load_colin_corps():
+def _colin_row_batches(key_range: KeyRange | None = None, connection=None) -> Iterable[list[dict]]:
+    """Return the COLIN row dict batches for the key range."""
+    batch_size = current_app.config["BATCH_SIZE"]
+    if current_app.config["COLIN_VECTORIZED_FETCH"]:
+        return parse_conflict_frames(collect_colin_data_frames(batch_size, key_range, connection))
+    return fetch_row_dicts(collect_colin_data(key_range, connection), batch_size)
+
+
+def _lear_row_batches(
+    key_range: KeyRange | None = None, connection=None, since: datetime | None = None
+) -> Iterable[list[dict]]:
+    """Return the LEAR row dict batches for the key range."""
+    return fetch_row_dicts(collect_lear_data(key_range, connection, since), current_app.config["BATCH_SIZE"])
+
+
+def _get_colin_snapshot(checkpoint: ImportCheckpoint) -> SnapshotDiff | None:
+    """Return the COLIN snapshot to diff the extraction against (if enabled)."""
+    if not current_app.config["COLIN_SNAPSHOT_DIFF"]:
+        return None
+    # NOTE: a reindex clears the core so every doc is sent (the snapshot is still recorded)
+    return SnapshotDiff(
+        get_state_path(COLIN_SNAPSHOT_FILE),
+        send_all=checkpoint.is_reindex,
+        resume=checkpoint.is_resuming("colin"),
+    )
+
+
+def _delete_removed_colin_corps(snapshot: SnapshotDiff, core: str):
+    """Delete the COLIN docs that are no longer extracted and record the snapshot for the next run."""
+    current_app.logger.debug(
+        f"COLIN snapshot diff: {snapshot.inserted} inserted, {snapshot.changed} changed, "
+        f"{snapshot.unchanged} unchanged"
+    )
+    deleted = 0
+    for ids in snapshot.get_deleted_ids(current_app.config["BATCH_SIZE"]):
+        deleted += delete_conflicts(ids, "COLIN Corps", core)
+    current_app.logger.debug(f"COLIN snapshot diff: {deleted} deleted")
+    snapshot.commit()
+
+
+def _load_colin_corps(checkpoint: ImportCheckpoint, cache: ReplayCacheWriter | None = None):
     """Load namex search with the colin corp possible conflicts."""
     current_app.logger.debug("---------- Collecting/Importing COLIN Corps ----------")
-    colin_data_cur = collect_colin_data()
-    count, final_record = _load_conflicts(colin_data_cur, "COLIN Corps", "CORP")
+    snapshot = _get_colin_snapshot(checkpoint)
+    core = _get_import_core(checkpoint)
+    key_ranges = checkpoint.start_source("colin", get_colin_key_ranges(current_app.config["COLIN_EXTRACT_WORKERS"]))
+    try:
+        if len(key_ranges) > 1:
+            # each partition gets its own connection from the oracle session pool
+            connections = [oracle_db.connection for _ in key_ranges]
+            try:
+                extracts = [
+                    partial(_colin_row_batches, key_range, connection)
+                    for key_range, connection in zip(key_ranges, connections, strict=True)
+                ]
+                row_batches = stream_partitioned_rows(extracts)
+                count, final_record = _load_conflicts(
+                    row_batches, "COLIN Corps", "CORP", snapshot=snapshot, checkpoint=checkpoint, cache=cache, core=core
+                )
+            finally:
+                for connection in connections:
+                    connection.close()
+        else:
+            row_batches = _colin_row_batches(key_ranges[0])
+            count, final_record = _load_conflicts(
+                row_batches, "COLIN Corps", "CORP", snapshot=snapshot, checkpoint=checkpoint, cache=cache, core=core
+            )
+        if snapshot:
+            _delete_removed_colin_corps(snapshot, core)
+    finally:
+        if snapshot:
+            snapshot.close()
     current_app.logger.debug("---------- COLIN Corp import completed ----------.")
     return count, final_record
 
 
-def _load_lear_corps():
+def _load_lear_corps(checkpoint: ImportCheckpoint, cache: ReplayCacheWriter | None = None):
     """Load namex search with the lear corp possible conflicts."""
     current_app.logger.debug("---------- Collecting/Importing LEAR Corps ----------")
-    lear_data_cur = collect_lear_data()
-    count, final_record = _load_conflicts(lear_data_cur, "LEAR Corps", "CORP")
+    since = _get_delta_since("lear")
+    core = _get_import_core(checkpoint)
+    # NOTE: watermark captured before extracting so updates made during the import are picked up next run
+    key_ranges = checkpoint.start_source(
+        "lear", get_lear_key_ranges(current_app.config["LEAR_EXTRACT_WORKERS"]), get_lear_watermark()
+    )
+    if len(key_ranges) > 1:
+        # each partition gets its own connection from the lear engine pool
+        connections = [lear_db.db.engine.connect() for _ in key_ranges]
+        try:
+            extracts = [
+                partial(_lear_row_batches, key_range, connection, since)
+                for key_range, connection in zip(key_ranges, connections, strict=True)
+            ]
+            row_batches = stream_partitioned_rows(extracts)
+            count, final_record = _load_conflicts(
+                row_batches, "LEAR Corps", "CORP", checkpoint=checkpoint, cache=cache, core=core
+            )
+        finally:
+            for connection in connections:
+                connection.close()
+    else:
+        row_batches = _lear_row_batches(key_ranges[0], since=since)
+        count, final_record = _load_conflicts(
+            row_batches, "LEAR Corps", "CORP", checkpoint=checkpoint, cache=cache, core=core
+        )
+    set_watermark("lear", checkpoint.watermark)
     current_app.logger.debug("---------- LEAR Corp import completed ----------.")
     return count, final_record
 
 
-def load_conflicts_core():
+# source, include config, loader, data name (in load order, the synonyms loader only takes the cache)
+SOURCES = (
+    ("synonyms", "INCLUDE_SYNONYM_LOAD", _load_synonyms, "Synonyms"),
+    ("namex", "INCLUDE_NAMEX_LOAD", _load_nrs, "NameX NR"),
+    ("colin", "INCLUDE_COLIN_LOAD", _load_colin_corps, "COLIN Corps"),
+    ("lear", "INCLUDE_LEAR_LOAD", _load_lear_corps, "LEAR Corps"),
+)
+
+
+def _get_checkpoint(resume: bool) -> ImportCheckpoint:
+    """Return the checkpoint for the run (the unfinished run's checkpoint if resuming)."""
+    previous = ImportCheckpoint.load() if current_app.config.get("IMPORT_CHECKPOINTS") else None
+    if resume and previous:
+        current_app.logger.debug(f"Resuming import from checkpoint: {previous.state}")
+        return previous
+    if resume:
+        current_app.logger.error("No checkpoint to resume from. Starting a new import.")
+
+    if previous and previous.is_reindex:
+        # the unfinished reindex was left without a restore (to allow resuming) so restore it before starting over
+        current_app.logger.debug("Unfinished reindex found. Restoring the index before starting a new import...")
+        reindex_recovery()
+
+    is_reindex = current_app.config.get("REINDEX_CORE")
+    if is_reindex and current_app.config.get("IS_PARTIAL_IMPORT"):
+        current_app.logger.error("Attempted reindex on partial data set.")
+        current_app.logger.debug(
+            "Setting reindex to False to prevent potential data loss."
+        )
+        is_reindex = False
+    return ImportCheckpoint.new(datetime.now(UTC), is_reindex)
+
+
+def _get_replay_cache(source: str, checkpoint: ImportCheckpoint) -> ReplayCacheWriter | None:
+    """Return the replay cache writer for the source (if enabled and the source is extracted in full)."""
+    if not current_app.config.get("REPLAY_CACHE") or current_app.config.get("REPLAY_IMPORT"):
+        return None
+    if (source in DELTA_SOURCES and current_app.config.get("DELTA_IMPORT")) or checkpoint.is_resuming(source):
+        current_app.logger.debug(f"Partial {source} extraction. Keeping the previous replay cache.")
+        return None
+    return ReplayCacheWriter(
+        current_app.config["REPLAY_CACHE_DIR"],
+        source,
+        checkpoint.import_started_at,
+        current_app.config["REPLAY_CACHE_CHUNK_SIZE"],
+    )
+
+
+def _get_replay_since() -> datetime:
+    """Return the start of the oldest run in the replay cache (i.e. what to resync from after replaying)."""
+    created_at = [
+        datetime.fromisoformat(get_replay_manifest(current_app.config["REPLAY_CACHE_DIR"], source)["created_at"])
+        for source, include_config, _, _ in SOURCES
+        if current_app.config.get(include_config)
+    ]
+    return min(created_at)
+
+
+def _replay_source(source: str, data_name: str, core: str):
+    """Update namex search with the cached docs for the source."""
+    current_app.logger.debug(f"---------- Replaying {source} ----------")
+    count = 0
+    last_record = None
+    with UploadPool(current_app.config["IMPORT_UPLOAD_WORKERS"]) as uploads:
+        for docs in read_replay_batches(current_app.config["REPLAY_CACHE_DIR"], source):
+            if source == "synonyms":
+                update_synonyms(docs[0])
+                continue
+            count += uploads.submit(partial(import_conflicts, core=core), docs, data_name)
+            last_record = docs[-1]
+        count += uploads.drain()
+    current_app.logger.debug(f"---------- {source} replay completed ----------.")
+    return count, ([last_record], data_name)
+
+
+def _load_sources(checkpoint: ImportCheckpoint):
+    """Load the included sources (skipping any already completed by a resumed run)."""
+    final_record = None
+    total_count = 0
+    core = _get_import_core(checkpoint)
+    for source, include_config, load_source, data_name in SOURCES:
+        if not current_app.config.get(include_config) or checkpoint.is_completed(source):
+            continue
+        if current_app.config.get("REPLAY_IMPORT"):
+            count, record = _replay_source(source, data_name, core)
+        else:
+            cache = _get_replay_cache(source, checkpoint)
+            count, record = load_source(cache) if source == "synonyms" else load_source(checkpoint, cache)
+            if cache:
+                cache.commit()
+                current_app.logger.debug(f"Cached {cache.docs} {source} docs for replay.")
+        checkpoint.complete_source(source)
+        if source == "synonyms":
+            continue
+        final_record = record
+        current_app.logger.debug(f"Total {data_name} records imported: {count}")
+        total_count += count
+
+    current_app.logger.debug(f"Total possible conflicts imported: {total_count}")
+    return final_record
+
+
+def _resync(since: datetime):
+    """Resync the records updated during the import."""
+    try:
+        current_app.logger.debug("---------- Resync ----------")
+        resync(since)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        current_app.logger.debug(error.with_traceback(None))
+        current_app.logger.error("Resync failed.")
+
+
+def _final_commit(final_record: tuple[list[dict], str] | None, core: str):
+    """Import the last record again (with a commit) so the changes are visible on the leader."""
+    try:
+        current_app.logger.debug("---------- Final Commit ----------")
+        current_app.logger.debug(
+            "Triggering final commit on leader to make changes visible to searching on leader..."
+        )
+        # NOTE: the record is None if the last source had nothing to import (i.e. quiet delta import)
+        if final_record:
+            import_conflicts([doc for doc in final_record[0] if doc], final_record[1], core=core)
+        current_app.logger.debug("Final commit complete.")
+
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        current_app.logger.debug(error.with_traceback(None))
+        current_app.logger.error(
+            "Final commit failed. (This will only effect DEV)."
+        )
+
+
+def load_conflicts_core(resume: bool = False):
     """Load data from Synonyms, NameX, LEAR and COLIN into the conflicts core."""
     try:
-        is_reindex = current_app.config.get("REINDEX_CORE")
-        import_started_at = datetime.now(UTC)
-        include_synonym_load = current_app.config.get("INCLUDE_SYNONYM_LOAD")
-        include_namex_load = current_app.config.get("INCLUDE_NAMEX_LOAD")
-        include_colin_load = current_app.config.get("INCLUDE_COLIN_LOAD")
-        include_lear_load = current_app.config.get("INCLUDE_LEAR_LOAD")
-        final_record = None
+        checkpoint = _get_checkpoint(resume)
+        is_reindex = checkpoint.is_reindex
+        import_started_at = checkpoint.import_started_at
 
         current_app.logger.debug(
             "Import watermark captured at: %s",
             import_started_at.isoformat(),
         )
 
-        if is_reindex and current_app.config.get("IS_PARTIAL_IMPORT"):
-            current_app.logger.error("Attempted reindex on partial data set.")
-            current_app.logger.debug(
-                "Setting reindex to False to prevent potential data loss."
-            )
-            is_reindex = False
-
-        if is_reindex:
+        resync_since = import_started_at
+        if current_app.config.get("REPLAY_IMPORT"):
+            try:
+                # NOTE: checked before the reindex prep so a missing cache doesn't leave the index cleared
+                resync_since = _get_replay_since()
+            except FileNotFoundError as err:
+                current_app.logger.error(f"{err} Run an import with REPLAY_CACHE=True first.")
+                current_app.logger.debug("SOLR import failed.")
+                sys.exit(1)
+            current_app.logger.debug(f"Replaying cached docs. Resyncing changes since: {resync_since.isoformat()}")
+
+        if is_reindex and not checkpoint.resumed:
             current_app.logger.debug("---------- Pre Reindex Actions ----------")
             reindex_prep()
 
-        try:
-            if include_synonym_load:
-                _load_synonyms()
-
-            nr_count = 0
-            if include_namex_load:
-                nr_count, final_record = _load_nrs()
-                current_app.logger.debug(f"Total NR records imported: {nr_count}")
-
-            colin_count = 0
-            if include_colin_load:
-                colin_count, final_record = _load_colin_corps()
-                current_app.logger.debug(
-                    f"Total COLIN Corp records imported: {colin_count}"
-                )
+        # NOTE: a swap reindex rebuilds the shadow core and only resyncs once it has been swapped in
+        core = _get_import_core(checkpoint)
+        is_swap = core == "shadow"
 
-            lear_count = 0
-            if include_lear_load:
-                lear_count, final_record = _load_lear_corps()
-                current_app.logger.debug(
-                    f"Total LEAR Corp records imported: {lear_count}"
-                )
-
-            current_app.logger.debug(
-                f"Total possible conflicts imported: {nr_count + colin_count + lear_count}"
-            )
+        try:
+            final_record = _load_sources(checkpoint)
 
         except Exception as err:
-            if is_reindex:
+            if is_reindex and checkpoint.enabled:
+                # NOTE: the follower keeps serving the previous index until the reindex post actions
+                current_app.logger.error(
+                    "Import failed. Rerun with --resume to continue from the last checkpoint "
+                    "(a new run will restore the previous index first)."
+                )
+            elif is_reindex:
                 reindex_recovery()
             raise err  # pass along
 
-        try:
-            current_app.logger.debug("---------- Resync ----------")
-            resync(import_started_at)
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            current_app.logger.debug(error.with_traceback(None))
-            current_app.logger.error("Resync failed.")
+        if not is_swap:
+            _resync(resync_since)
 
-        try:
-            current_app.logger.debug("---------- Final Commit ----------")
-            current_app.logger.debug(
-                "Triggering final commit on leader to make changes visible to searching on leader..."
-            )
-            import_conflicts(final_record[0], final_record[1])
-            current_app.logger.debug("Final commit complete.")
-
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            current_app.logger.debug(error.with_traceback(None))
-            current_app.logger.error(
-                "Final commit failed. (This will only effect DEV)."
-            )
+        _final_commit(final_record, core)
 
         if is_reindex:
             current_app.logger.debug("---------- Post Reindex Actions ----------")
             reindex_post()
 
-        current_app.logger.debug("SOLR import finished successfully.")
+        if is_swap:
+            _resync(resync_since)
+
+        checkpoint.clear()
+        _log_import_finished(import_started_at)
 
     except SolrException as err:
         current_app.logger.debug(f"SOLR gave status code: {err.status_code}")
@@ -269,6 +626,20 @@ def load_conflicts_core():
         sys.exit(1)
 
 
+def _log_import_finished(import_started_at: datetime):
+    """Log the bytes sent and time taken for the import (used to compare settings per environment)."""
+    current_app.logger.debug("SOLR import finished successfully.")
+    current_app.logger.info(
+        "Import metrics: %s docs, %s bytes, %s bytes on wire (%s), %.2fs uploading, %.2fs end to end",
+        import_metrics["docs"],
+        import_metrics["body_bytes"],
+        import_metrics["wire_bytes"],
+        current_app.config.get("IMPORT_COMPRESSION") or "uncompressed",
+        import_metrics["seconds"],
+        (datetime.now(UTC) - import_started_at).total_seconds(),
+    )
+
+
 def _write_sentinel():
     """Write sentinel file to signal sidecar that import is done."""
     try:
@@ -285,7 +656,8 @@ if __name__ == "__main__":
     app = create_app()
     with app.app_context():
         try:
-            load_conflicts_core()
+            load_conflicts_core(resume="--resume" in sys.argv[1:])
         finally:
+            api_client.close()
             _write_sentinel()
         sys.exit(0)
@@ -89,12 +89,13 @@ def create_app(
     app.logger = StructuredLogging(app).get_logger()
     solr.init_app(app)
     auth.init_app(app)
-    # Init relevant dbs
-    if app.config["INCLUDE_COLIN_LOAD"]:
+    # Init relevant dbs (none needed when replaying the cached docs)
+    uses_source_dbs = not app.config["REPLAY_IMPORT"]
+    if app.config["INCLUDE_COLIN_LOAD"] and uses_source_dbs:
         oracle_db.init_app(app)
-    if app.config["INCLUDE_LEAR_LOAD"]:
+    if app.config["INCLUDE_LEAR_LOAD"] and uses_source_dbs:
         lear_db.init_app(app)
-    if app.config["INCLUDE_NAMEX_LOAD"] or app.config["INCLUDE_SYNONYM_LOAD"]:
+    if (app.config["INCLUDE_NAMEX_LOAD"] or app.config["INCLUDE_SYNONYM_LOAD"]) and uses_source_dbs:
         namex_db.init_app(app)
 
     register_shellcontext(app)
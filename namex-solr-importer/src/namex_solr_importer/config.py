@@ -44,6 +44,8 @@ import os
 
 from dotenv import find_dotenv, load_dotenv
 
+from namex_solr_api.common.compression import SUPPORTED_ENCODINGS
+
 # this will load all the envars from a .env file located in the project root (api)
 load_dotenv(find_dotenv())
 
@@ -65,9 +67,63 @@ class Config:
     SOLR_RETRY_BACKOFF_FACTOR = int(os.getenv("SOLR_RETRY_BACKOFF_FACTOR", "5"))
 
     SOLR_API_URL = os.getenv("SOLR_API_URL", "http://")
+    # Content-Encoding for the import batches sent to the api ("", "gzip" or "zstd")
+    IMPORT_COMPRESSION = os.getenv("IMPORT_COMPRESSION", "")
+    if IMPORT_COMPRESSION and IMPORT_COMPRESSION not in SUPPORTED_ENCODINGS:
+        raise ValueError(f"Unsupported IMPORT_COMPRESSION: {IMPORT_COMPRESSION} (expecting one of {SUPPORTED_ENCODINGS})")
+    # Number of import batches uploaded to the api concurrently (over one keep-alive connection pool)
+    IMPORT_UPLOAD_WORKERS = int(os.getenv("IMPORT_UPLOAD_WORKERS", "1"))
+    # Seconds before the api token expires to get a new one (API_TOKEN_TTL is used if the expiry isn't readable)
+    API_TOKEN_REFRESH_MARGIN = int(os.getenv("API_TOKEN_REFRESH_MARGIN", "60"))
+    API_TOKEN_TTL = int(os.getenv("API_TOKEN_TTL", "300"))
+
+    # Direct to solr import (sends the import batches straight to the leader instead of via the api)
+    IMPORT_DIRECT_TO_SOLR = os.getenv("IMPORT_DIRECT_TO_SOLR", "False") == "True"
+    SOLR_SVC_NAMEX_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_LEADER_CORE", "name_request")
+    SOLR_SVC_NAMEX_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_FOLLOWER_CORE", "name_request_follower")
+    SOLR_SVC_NAMEX_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_SHADOW_CORE", "name_request_shadow")
+    SOLR_SVC_NAMEX_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_LEADER_URL", "http://localhost:8863/solr")
+    SOLR_SVC_NAMEX_FOLLOWER_URL = os.getenv("SOLR_SVC_NAMEX_FOLLOWER_URL", "http://localhost:8863/solr")
+    SOLR_SVC_NAMEX_TIMEOUT = int(os.getenv("SOLR_SVC_NAMEX_TIMEOUT", "60"))
+    # historical / corp tiers (same as the api config) so the direct import splits the docs between the same cores
+    SOLR_SVC_NAMEX_HISTORICAL_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_LEADER_CORE", "")
+    SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_CORE", "")
+    SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_SHADOW_CORE",
+                                                      "name_request_historical_shadow")
+    SOLR_SVC_NAMEX_HISTORICAL_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_HISTORICAL_LEADER_URL") or SOLR_SVC_NAMEX_LEADER_URL
+    SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_URL = (os.getenv("SOLR_SVC_NAMEX_HISTORICAL_FOLLOWER_URL")
+                                              or SOLR_SVC_NAMEX_FOLLOWER_URL)
+    SOLR_SVC_NAMEX_HISTORICAL_TIMEOUT = SOLR_SVC_NAMEX_TIMEOUT
+    SOLR_SVC_NAMEX_CORP_LEADER_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_LEADER_CORE", "")
+    SOLR_SVC_NAMEX_CORP_FOLLOWER_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_FOLLOWER_CORE", "")
+    SOLR_SVC_NAMEX_CORP_SHADOW_CORE = os.getenv("SOLR_SVC_NAMEX_CORP_SHADOW_CORE", "name_request_corp_shadow")
+    SOLR_SVC_NAMEX_CORP_LEADER_URL = os.getenv("SOLR_SVC_NAMEX_CORP_LEADER_URL") or SOLR_SVC_NAMEX_LEADER_URL
+    SOLR_SVC_NAMEX_CORP_FOLLOWER_URL = os.getenv("SOLR_SVC_NAMEX_CORP_FOLLOWER_URL") or SOLR_SVC_NAMEX_FOLLOWER_URL
+    SOLR_SVC_NAMEX_CORP_TIMEOUT = SOLR_SVC_NAMEX_TIMEOUT
 
     BATCH_SIZE = int(os.getenv("SOLR_BATCH_UPDATE_SIZE", "1000"))
+    # Number of parallel key range partitions (each on its own pooled connection) per source
+    COLIN_EXTRACT_WORKERS = int(os.getenv("COLIN_EXTRACT_WORKERS", "1"))
+    LEAR_EXTRACT_WORKERS = int(os.getenv("LEAR_EXTRACT_WORKERS", "1"))
+    # Number of worker processes parsing / encoding the extracted rows (1 parses them in process)
+    PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "1"))
+    # False uploads the batches as their workers finish (forced True when IMPORT_CHECKPOINTS is set)
+    PARSE_ORDERED = os.getenv("PARSE_ORDERED", "True") == "True"
+    # Row batches buffered per extract partition (bounds the extract side when it outruns the uploads)
+    EXTRACT_QUEUE_SIZE = int(os.getenv("EXTRACT_QUEUE_SIZE", "2"))
+    # Max (estimated) json bytes per upload batch on top of the BATCH_SIZE doc count (0 for no byte limit)
+    IMPORT_BATCH_MAX_BYTES = int(os.getenv("IMPORT_BATCH_MAX_BYTES", "10000000"))
+    # RSS watchdog: extraction is throttled while the RSS is over IMPORT_MEMORY_HIGH_RATIO of the memory limit
+    # (IMPORT_MEMORY_LIMIT bytes, or the container limit if 0)
+    IMPORT_MEMORY_LIMIT = int(os.getenv("IMPORT_MEMORY_LIMIT", "0"))
+    IMPORT_MEMORY_HIGH_RATIO = float(os.getenv("IMPORT_MEMORY_HIGH_RATIO", "0.85"))
+    IMPORT_MEMORY_THROTTLE_SECONDS = int(os.getenv("IMPORT_MEMORY_THROTTLE_SECONDS", "30"))
     REINDEX_CORE = os.getenv("REINDEX_CORE", "False") == "True"
+    # restore: backup, clear and rebuild the leader core (restored on failure)
+    # swap: rebuild a shadow core and swap it with the leader core (previous index kept for rollback)
+    REINDEX_MODE = os.getenv("REINDEX_MODE", "restore")
+    # max seconds to wait for a reindex job (prep/post/recovery) run by the api to finish
+    REINDEX_JOB_TIMEOUT = int(os.getenv("REINDEX_JOB_TIMEOUT", "7200"))
 
     MODERNIZED_LEGAL_TYPES = (
         os.getenv("MODERNIZED_LEGAL_TYPES", "BEN,CBEN,CP,GP,SP").upper().split(",")
@@ -85,7 +141,22 @@ class Config:
     INCLUDE_SYNONYM_LOAD = os.getenv("INCLUDE_SYNONYM_LOAD", "True") == "True"
     RESYNC_OFFSET = os.getenv("RESYNC_OFFSET", "60")
 
-    IS_PARTIAL_IMPORT = not INCLUDE_COLIN_LOAD or not INCLUDE_NAMEX_LOAD
+    # Delta imports only extract the NameX/LEAR rows updated since the last recorded watermark (no reindex)
+    DELTA_IMPORT = os.getenv("DELTA_IMPORT", "False") == "True"
+    # Local state kept between runs (watermarks etc.) -- should be on a persistent volume
+    IMPORT_STATE_DIR = os.getenv("IMPORT_STATE_DIR", "import_state")
+    # Only send the COLIN docs inserted/changed/deleted since the last run's snapshot (kept in the IMPORT_STATE_DIR)
+    COLIN_SNAPSHOT_DIFF = os.getenv("COLIN_SNAPSHOT_DIFF", "False") == "True"
+    # Record progress per batch (in the IMPORT_STATE_DIR) so a failed import can be continued with --resume
+    IMPORT_CHECKPOINTS = os.getenv("IMPORT_CHECKPOINTS", "False") == "True"
+    # Cache the parsed docs of each full source extraction locally (gzipped json lines chunks)
+    REPLAY_CACHE = os.getenv("REPLAY_CACHE", "False") == "True"
+    # Import the cached docs instead of extracting them (no source database access)
+    REPLAY_IMPORT = os.getenv("REPLAY_IMPORT", "False") == "True"
+    REPLAY_CACHE_DIR = os.getenv("REPLAY_CACHE_DIR", "replay_cache")
+    REPLAY_CACHE_CHUNK_SIZE = int(os.getenv("REPLAY_CACHE_CHUNK_SIZE", "50000"))
+
+    IS_PARTIAL_IMPORT = not INCLUDE_COLIN_LOAD or not INCLUDE_NAMEX_LOAD or DELTA_IMPORT
 
     # Service account details
     ACCOUNT_SVC_AUTH_URL = os.getenv("ACCOUNT_SVC_AUTH_URL")
@@ -102,6 +173,10 @@ class Config:
     ORACLE_DB_NAME = os.getenv("ORACLE_DB_NAME", "")
     ORACLE_HOST = os.getenv("ORACLE_HOST", "")
     ORACLE_PORT = int(os.getenv("ORACLE_PORT", "1521"))
+    # thick mode requires the Oracle Instant Client (set to False to use thin mode without it)
+    ORACLE_THICK_MODE = os.getenv("ORACLE_THICK_MODE", "True") == "True"
+    # fetch COLIN data as Arrow batches (python-oracledb fetch_df_batches) instead of row tuples
+    COLIN_VECTORIZED_FETCH = os.getenv("COLIN_VECTORIZED_FETCH", "False") == "True"
 
     # POSTGRESQL
     SQLALCHEMY_TRACK_MODIFICATIONS = False
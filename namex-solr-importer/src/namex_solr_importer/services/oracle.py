@@ -37,6 +37,9 @@ class OracleDB:  # pylint: disable=duplicate-code
         :return: naked
         """
         self.app = app
+        if app.config.get("ORACLE_THICK_MODE") and oracledb.is_thin_mode():
+            # NOTE: thick mode requires the Oracle Instant Client. Thin mode has no client dependency.
+            oracledb.init_oracle_client()
         app.teardown_appcontext(self.teardown)
 
     @staticmethod
@@ -55,12 +58,9 @@ class OracleDB:  # pylint: disable=duplicate-code
     def _create_pool():
         """Create the oracledb connection pool from the Flask Config Environment.
 
-        :return: an instance of the OCI Session Pool
+        :return: an instance of the oracledb ConnectionPool
         """
 
-        if not getattr(oracledb, "thick_mode", False):
-            oracledb.init_oracle_client()
-
         def init_session(conn, *args):
             cursor = conn.cursor()
             cursor.execute("alter session set TIME_ZONE = 'America/Vancouver'")
@@ -71,21 +71,22 @@ class OracleDB:  # pylint: disable=duplicate-code
             f"{current_app.config.get('ORACLE_DB_NAME')}"
         )
 
-        return oracledb.SessionPool(
+        return oracledb.create_pool(
             user=current_app.config.get("ORACLE_USER"),
             password=current_app.config.get("ORACLE_PASSWORD"),
             dsn=dsn_val,
             min=1,
-            max=10,
+            # NOTE: each COLIN extract partition holds a connection for the whole extraction (NOWAIT fails if short)
+            max=max(10, current_app.config.get("COLIN_EXTRACT_WORKERS", 1)),
             increment=1,
-            getmode=oracledb.SPOOL_ATTRVAL_NOWAIT,
+            getmode=oracledb.POOL_GETMODE_NOWAIT,
             wait_timeout=1500,
             timeout=3600,
             session_callback=init_session,
         )
 
     @property
-    def connection(self):  # pylint: disable=inconsistent-return-statements
+    def connection(self) -> oracledb.Connection:
         """Create connection property.
 
         If this is running in a Flask context,
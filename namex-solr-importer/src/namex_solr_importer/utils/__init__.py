@@ -34,11 +34,39 @@
 """Manages util functions for the importer."""
 
 from .data_collection import (
+    KeyRange,
     collect_colin_data,
+    collect_colin_data_frames,
     collect_lear_data,
     collect_namex_data,
     collect_synonyms_data,
+    fetch_row_dicts,
+    get_colin_key_ranges,
+    get_lear_key_ranges,
+    get_lear_watermark,
+    get_namex_watermark,
+)
+from .data_parsing import parse_conflict, parse_conflict_frames, parse_synonyms
+from .http_client import UploadPool, api_client
+from .import_state import (
+    ImportCheckpoint,
+    get_state_path,
+    get_watermark,
+    read_state,
+    set_watermark,
+    write_state,
+)
+from .memory_guard import MemoryGuard, get_memory_limit, get_rss
+from .parallel_extract import stream_partitioned_rows
+from .parallel_parse import EncodedBatch, encode_batches, join_encoded_docs
+from .reindex import is_swap_reindex, reindex_post, reindex_prep, reindex_recovery
+from .replay_cache import ReplayCacheWriter, get_replay_manifest, read_replay_batches
+from .snapshot_diff import SnapshotDiff
+from .solr_api import (
+    delete_conflicts,
+    import_conflicts,
+    import_encoded_batch,
+    import_metrics,
+    resync,
+    update_synonyms,
 )
-from .data_parsing import parse_conflict, parse_synonyms
-from .reindex import reindex_post, reindex_prep, reindex_recovery
-from .solr_api import import_conflicts, resync, update_synonyms
@@ -33,11 +33,18 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Data collection functions."""
 
+from collections.abc import Iterator
+from datetime import datetime
+
+import pyarrow
 from flask import current_app
 from sqlalchemy import CursorResult, text
 
 from namex_solr_importer import lear_db, namex_db, oracle_db
 
+# (inclusive lower key, exclusive upper key) -- None means unbounded
+KeyRange = tuple[str | None, str | None]
+
 
 def _get_stringified_list_for_sql(config_value: str) -> str:
     """Return the values from the config in a format usable for the execute statement."""
@@ -47,12 +54,76 @@ def _get_stringified_list_for_sql(config_value: str) -> str:
     return ""
 
 
-def collect_colin_data():
-    """Collect data from COLIN."""
-    current_app.logger.debug("Connecting to Oracle instance...")
-    cursor = oracle_db.connection.cursor()
-    current_app.logger.debug("Collecting COLIN data...")
-    cursor.execute(f"""
+def _get_key_range_clause(column: str, key_range: KeyRange | None) -> tuple[str, dict]:
+    """Return the sql clause and bind params restricting the column to the key range."""
+    if not key_range:
+        return "", {}
+
+    clause = ""
+    params = {}
+    lower, upper = key_range
+    if lower is not None:
+        clause += f" and {column} >= :lower_key"
+        params["lower_key"] = lower
+    if upper is not None:
+        clause += f" and {column} < :upper_key"
+        params["upper_key"] = upper
+    return clause, params
+
+
+def get_key_ranges(lower_bounds: list[str]) -> list[KeyRange]:
+    """Return contiguous key ranges covering the full key space for the sorted partition lower bounds.
+
+    The first range is open below and the last range is open above so no rows are missed
+    if keys are added between calculating the bounds and running the partition queries.
+    """
+    bounds = sorted({bound for bound in lower_bounds if bound is not None})[1:]
+    if not bounds:
+        return [(None, None)]
+
+    return list(zip([None, *bounds], [*bounds, None], strict=True))
+
+
+def _colin_filters() -> str:
+    """Return the where clause used to select COLIN possible conflict corps."""
+    return f"""
+        c.corp_typ_cd in ({_get_stringified_list_for_sql("CONFLICT_LEGAL_TYPES")})
+            and c.corp_typ_cd not in ({_get_stringified_list_for_sql("MODERNIZED_LEGAL_TYPES")})"""
+
+
+def get_colin_key_ranges(partitions: int) -> list[KeyRange]:
+    """Return the corp_num key ranges splitting the COLIN data into roughly equal partitions."""
+    if partitions <= 1:
+        return [(None, None)]
+
+    current_app.logger.debug(f"Calculating {partitions} COLIN corp_num partitions...")
+    connection = oracle_db.connection
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            f"""
+            SELECT MIN(corp_num) FROM (
+                SELECT c.corp_num, NTILE(:partitions) OVER (ORDER BY c.corp_num) as bucket
+                FROM corporation c
+                WHERE {_colin_filters()}
+            )
+            GROUP BY bucket
+            """,
+            partitions=partitions,
+        )
+        return get_key_ranges([row[0] for row in cursor.fetchall()])
+    finally:
+        connection.close()
+
+
+def _get_order_clause(column: str) -> str:
+    """Return the order by clause needed to checkpoint the extraction by key (if checkpoints are enabled)."""
+    return f" ORDER BY {column}" if current_app.config.get("IMPORT_CHECKPOINTS") else ""
+
+
+def _colin_query(key_range_clause: str = "") -> str:
+    """Return the COLIN possible conflict query."""
+    return f"""
         SELECT c.corp_num, c.recognition_dts as start_date,
             cn.corp_nme as name, j.can_jur_typ_cd as jurisdiction,
             CASE cos.op_state_typ_cd
@@ -65,21 +136,82 @@ def collect_colin_data():
         join corp_op_state cos on cos.state_typ_cd = cs.state_typ_cd
         join corp_name cn on cn.corp_num = c.corp_num
         left join (select * from jurisdiction where end_event_id is null) j on j.corp_num = c.corp_num
-        WHERE c.corp_typ_cd in ({_get_stringified_list_for_sql("CONFLICT_LEGAL_TYPES")})
-            and c.corp_typ_cd not in ({_get_stringified_list_for_sql("MODERNIZED_LEGAL_TYPES")})
+        WHERE {_colin_filters()}
             and cs.end_event_id is null
             and cn.end_event_id is null
             and cn.corp_name_typ_cd in ('CO', 'NB')
-            and cos.op_state_typ_cd in ('ACT','HLD','HIS')
-        """)
+            and cos.op_state_typ_cd in ('ACT','HLD','HIS'){key_range_clause}{_get_order_clause("c.corp_num")}
+        """
+
+
+def collect_colin_data(key_range: KeyRange | None = None, connection=None):
+    """Collect data from COLIN (optionally restricted to the corp_num key range)."""
+    current_app.logger.debug("Connecting to Oracle instance...")
+    cursor = (connection or oracle_db.connection).cursor()
+    key_range_clause, params = _get_key_range_clause("c.corp_num", key_range)
+    current_app.logger.debug(f"Collecting COLIN data {key_range or ''}...")
+    cursor.execute(_colin_query(key_range_clause), params)
     return cursor
 
 
-def collect_lear_data() -> CursorResult:
-    """Collect data from LEAR."""
+def collect_colin_data_frames(
+    batch_size: int, key_range: KeyRange | None = None, connection=None
+) -> Iterator[pyarrow.Table]:
+    """Collect data from COLIN as Arrow tables of up to batch_size rows (vectorized fetch)."""
+    current_app.logger.debug("Connecting to Oracle instance...")
+    conn = connection or oracle_db.connection
+    key_range_clause, params = _get_key_range_clause("c.corp_num", key_range)
+    current_app.logger.debug(f"Collecting COLIN data frames {key_range or ''}...")
+    for odf in conn.fetch_df_batches(statement=_colin_query(key_range_clause), parameters=params, size=batch_size):
+        yield pyarrow.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+
+
+def _lear_filters() -> str:
+    """Return the where clause used to select LEAR possible conflict businesses."""
+    return f"""
+        legal_type in ({_get_stringified_list_for_sql("CONFLICT_LEGAL_TYPES")})
+            and legal_type in ({_get_stringified_list_for_sql("MODERNIZED_LEGAL_TYPES")})
+            and state in ('ACTIVE', 'HISTORICAL')"""
+
+
+def get_lear_key_ranges(partitions: int) -> list[KeyRange]:
+    """Return the identifier key ranges splitting the LEAR data into roughly equal partitions."""
+    if partitions <= 1:
+        return [(None, None)]
+
+    current_app.logger.debug(f"Calculating {partitions} LEAR identifier partitions...")
+    with lear_db.db.engine.connect() as conn:
+        rows = conn.execute(
+            text(f"""
+            SELECT MIN(identifier) FROM (
+                SELECT identifier, NTILE(:partitions) OVER (ORDER BY identifier) as bucket
+                FROM businesses
+                WHERE {_lear_filters()}
+            ) as partitioned
+            GROUP BY bucket
+            """),
+            {"partitions": partitions},
+        ).fetchall()
+    return get_key_ranges([row[0] for row in rows])
+
+
+def get_lear_watermark() -> datetime | None:
+    """Return the latest LEAR business update timestamp (high-water mark for delta imports)."""
+    with lear_db.db.engine.connect() as conn:
+        return conn.execute(text("SELECT MAX(last_modified) FROM businesses")).scalar()
+
+
+def collect_lear_data(
+    key_range: KeyRange | None = None, connection=None, since: datetime | None = None
+) -> CursorResult:
+    """Collect data from LEAR (optionally restricted to the identifier key range / businesses updated since)."""
     current_app.logger.debug("Connecting to LEAR Postgres instance...")
-    conn = lear_db.db.engine.connect()
-    current_app.logger.debug("Collecting LEAR data...")
+    conn = connection or lear_db.db.engine.connect()
+    key_range_clause, params = _get_key_range_clause("b.identifier", key_range)
+    if since:
+        key_range_clause += " and b.last_modified >= :since"
+        params["since"] = since
+    current_app.logger.debug(f"Collecting LEAR data {key_range or ''} {since or ''}...")
     return conn.execute(
         text(f"""
         SELECT b.identifier as corp_num, b.legal_name as name,
@@ -91,20 +223,29 @@ def collect_lear_data() -> CursorResult:
             END as jurisdiction
         FROM businesses b
         LEFT JOIN jurisdictions j on j.business_id = b.id
-        WHERE legal_type in ({_get_stringified_list_for_sql("CONFLICT_LEGAL_TYPES")})
-            and legal_type in ({_get_stringified_list_for_sql("MODERNIZED_LEGAL_TYPES")})
-            and state in ('ACTIVE', 'HISTORICAL')
-        """)
+        WHERE {_lear_filters()}{key_range_clause}{_get_order_clause("b.identifier")}
+        """),
+        params,
     )
 
 
-def collect_namex_data() -> CursorResult:
-    """Collect data from NameX."""
+def get_namex_watermark() -> datetime | None:
+    """Return the latest NameX request update timestamp (high-water mark for delta imports)."""
+    with namex_db.db.engine.connect() as conn:
+        return conn.execute(text("SELECT MAX(last_update) FROM requests")).scalar()
+
+
+def collect_namex_data(since: datetime | None = None, key_range: KeyRange | None = None) -> CursorResult:
+    """Collect data from NameX (optionally only the requests updated since / in the nr_num key range)."""
     current_app.logger.debug("Connecting to NameX Postgres instance...")
     conn = namex_db.db.engine.connect()
-    current_app.logger.debug("Collecting NameX data...")
+    current_app.logger.debug(f"Collecting NameX data {since or ''} {key_range or ''}...")
+    key_range_clause, params = _get_key_range_clause("r.nr_num", key_range)
+    if since:
+        key_range_clause += " and r.last_update >= :since"
+        params["since"] = since
     return conn.execute(
-        text("""
+        text(f"""
         SELECT r.nr_num,
             COALESCE(NULLIF(n.corp_num, ''), NULLIF(r.corp_num, '')) as corp_num,
             CASE
@@ -124,8 +265,10 @@ def collect_namex_data() -> CursorResult:
             r.request_type_cd as sub_type
         FROM requests r
             JOIN names n on n.nr_id = r.id
+        WHERE true{key_range_clause}
         ORDER BY r.nr_num, n.choice
-        """)
+        """),
+        params,
     )
 
 
@@ -142,3 +285,18 @@ def collect_synonyms_data() -> CursorResult:
         WHERE enabled='t'
         """)
     )
+
+
+def fetch_row_dicts(data_cur, batch_size: int) -> Iterator[list[dict]]:
+    """Yield the rows of the cursor as lists of dicts keyed by the lowercase column names."""
+    # NOTE: for the colin connection the data_cur is not a 'CursorResult' type
+    if isinstance(data_cur, CursorResult):
+        descs = list(data_cur.keys())
+    else:
+        descs = [desc[0].lower() for desc in data_cur.description]
+
+    try:
+        while rows := data_cur.fetchmany(batch_size):
+            yield [dict(zip(descs, row, strict=False)) for row in rows]
+    finally:
+        data_cur.close()
@@ -33,8 +33,12 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Data parsing functions."""
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 
+import pyarrow
+import pyarrow.compute as pc
+
 from namex_solr_api.services.namex_solr.doc_models import Name, PossibleConflict
 
 
@@ -60,9 +64,14 @@ def parse_conflict(data: dict, conflict_type: str) -> PossibleConflict:
     """Parse the data as a PossibleConflict."""
     converted_start_date = None
     if start_date := data.get("start_date"):
-        converted_start_date = datetime.isoformat(
-            start_date, timespec="seconds"
-        ).replace("+00:00", "")
+        # NOTE: vectorized batches already have the start_date formatted (see parse_conflict_frames)
+        converted_start_date = (
+            start_date
+            if isinstance(start_date, str)
+            else datetime.isoformat(start_date, timespec="seconds").replace(
+                "+00:00", ""
+            )
+        )
     nr_num = "".join(data["nr_num"].split()) if data.get("nr_num") else None
     return PossibleConflict(
         id=nr_num if conflict_type == "NR" else data["corp_num"],
@@ -77,6 +86,32 @@ def parse_conflict(data: dict, conflict_type: str) -> PossibleConflict:
     )
 
 
+def _parse_conflict_frame(table: pyarrow.Table) -> list[dict]:
+    """Apply the column level conflict defaults/formatting to the table and return it as row dicts."""
+    table = table.rename_columns([name.lower() for name in table.column_names])
+    column_names = table.column_names
+    if "start_date" in column_names and pyarrow.types.is_timestamp(start_type := table["start_date"].type):
+        # NOTE: %S includes the fractional seconds for ms/us/ns units (the row path drops them)
+        start_dates = pc.cast(pc.floor_temporal(table["start_date"], unit="second"), pyarrow.timestamp("s", start_type.tz))
+        start_dates = pc.strftime(start_dates, format="%Y-%m-%dT%H:%M:%S")
+        table = table.set_column(column_names.index("start_date"), "start_date", start_dates)
+    if "jurisdiction" in column_names:
+        jurisdictions = table["jurisdiction"]
+        is_blank = pc.fill_null(pc.equal(jurisdictions, ""), True)
+        table = table.set_column(
+            column_names.index("jurisdiction"),
+            "jurisdiction",
+            pc.if_else(is_blank, "BC", jurisdictions),
+        )
+    return table.to_pylist()
+
+
+def parse_conflict_frames(tables: Iterable[pyarrow.Table]) -> Iterator[list[dict]]:
+    """Yield the row dicts for each Arrow table with the conflict defaults applied column-wise."""
+    for table in tables:
+        yield _parse_conflict_frame(table)
+
+
 def parse_synonyms(data: list[tuple[str]]) -> dict[str, list[str]]:
     """Parse the synonym data in preparation for namex solr api update call."""
     # i.e. [('test, tester, testing',), ('something, somethingelse',)] -> {'test': ['test', 'tester'...], 'something': [...]}
@@ -0,0 +1,184 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Pooled keep-alive http client for the namex solr api (shared by every importer call to the api)."""
+
+import base64
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+
+from namex_solr_api.services.auth import auth_cache
+from namex_solr_importer import auth
+
+
+def _get_token_expiry(token: str) -> float | None:
+    """Return the expiry (epoch seconds) of the jwt (None if it isn't a readable jwt)."""
+    try:
+        payload = token.split(".")[1]
+        # NOTE: only read to schedule the refresh, the api validates the token
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+class ApiClient:
+    """Keeps one connection pool and service account token for all the calls to the api."""
+
+    def __init__(self):
+        """Initialize the client (the session is created on first use)."""
+        self._session: requests.Session | None = None
+        self._token: str | None = None
+        self._token_expiry = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the keep-alive session (pool sized for the concurrent uploads)."""
+        if not self._session:
+            pool_size = max(current_app.config.get("IMPORT_UPLOAD_WORKERS", 1), 1) + 1
+            session = requests.Session()
+            # NOTE: no adapter retries, the callers already retry / back off per batch
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def get_token(self) -> str:
+        """Return the service account token (refreshed before it expires)."""
+        with self._lock:
+            margin = current_app.config.get("API_TOKEN_REFRESH_MARGIN", 60)
+            if not self._token or time.time() >= self._token_expiry - margin:
+                current_app.logger.debug("Getting token for the api...")
+                # NOTE: drop the shared cached token so the new one gets its full lifetime
+                auth_cache.delete("view/token")
+                self._token = auth.get_bearer_token()
+                self._token_expiry = _get_token_expiry(self._token) or (
+                    time.time() + current_app.config.get("API_TOKEN_TTL", 300)
+                )
+                current_app.logger.debug("Token set.")
+            return self._token
+
+    def invalidate_token(self):
+        """Force a new token on the next call (i.e. after a 401)."""
+        with self._lock:
+            self._token = None
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Call the api endpoint (retried once with a new token if unauthorized)."""
+        url = f"{current_app.config.get('SOLR_API_URL')}{path}"
+        headers = kwargs.pop("headers", {})
+        resp = self.session.request(
+            method, url, headers={**headers, "Authorization": f"Bearer {self.get_token()}"}, **kwargs
+        )
+        if resp.status_code == HTTPStatus.UNAUTHORIZED:
+            self.invalidate_token()
+            resp = self.session.request(
+                method, url, headers={**headers, "Authorization": f"Bearer {self.get_token()}"}, **kwargs
+            )
+        return resp
+
+    def close(self):
+        """Close the pooled connections."""
+        if self._session:
+            self._session.close()
+            self._session = None
+
+
+api_client = ApiClient()
+
+
+class UploadPool:
+    """Runs up to the given number of uploads concurrently, handling their results in submission order.
+
+    Results (and errors) are handled on the calling thread in the order the uploads were submitted, so a
+    failure is raised for the earliest failed batch and the on_done callbacks (i.e. checkpointing) only ever
+    see a contiguous run of acknowledged batches. With 1 worker the uploads run inline.
+    """
+
+    def __init__(self, workers: int):
+        """Initialize the pool."""
+        self.workers = workers
+        self._app = current_app._get_current_object()
+        self._executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._pending: deque[tuple[Future, Callable | None]] = deque()
+
+    def __enter__(self):
+        """Return the pool."""
+        return self
+
+    def __exit__(self, *args):
+        """Stop the pool (in flight uploads are finished, queued ones cancelled)."""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, upload: Callable, *args):
+        with self._app.app_context():
+            return upload(*args)
+
+    def _finish_next(self) -> int:
+        future, on_done = self._pending.popleft()
+        count = future.result()
+        if on_done:
+            on_done(count)
+        return count
+
+    def submit(self, upload: Callable, *args, on_done: Callable[[int], None] | None = None) -> int:
+        """Submit the upload (returning its doc count) and return the doc count of the uploads finished."""
+        if not self._executor:
+            count = upload(*args)
+            if on_done:
+                on_done(count)
+            return count
+        self._pending.append((self._executor.submit(self._run, upload, *args), on_done))
+        count = 0
+        while len(self._pending) > self.workers:
+            count += self._finish_next()
+        return count
+
+    def drain(self) -> int:
+        """Wait for the remaining uploads and return their doc count."""
+        count = 0
+        while self._pending:
+            count += self._finish_next()
+        return count
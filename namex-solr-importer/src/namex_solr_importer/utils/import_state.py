@@ -0,0 +1,196 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Local state kept between import runs (i.e. the per source watermarks and the run checkpoint)."""
+
+import json
+import os
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+
+from flask import current_app
+
+from .data_collection import KeyRange
+
+CHECKPOINT_FILE = "checkpoint.json"
+WATERMARKS_FILE = "watermarks.json"
+
+
+def get_state_path(file_name: str) -> Path:
+    """Return the path of the state file (creating the state directory if needed)."""
+    state_dir = Path(current_app.config["IMPORT_STATE_DIR"])
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir / file_name
+
+
+def read_state(file_name: str) -> dict:
+    """Return the contents of the json state file (empty if it does not exist yet)."""
+    path = get_state_path(file_name)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def write_state(file_name: str, state: dict):
+    """Write the json state file (replaced atomically so a failed run can't leave it half written)."""
+    path = get_state_path(file_name)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2))
+    os.replace(tmp_path, path)
+
+
+def get_watermark(source: str) -> datetime | None:
+    """Return the high-water mark recorded by the last successful import of the source."""
+    if value := read_state(WATERMARKS_FILE).get(source):
+        return datetime.fromisoformat(value)
+    return None
+
+
+def set_watermark(source: str, value: datetime | None):
+    """Record the high-water mark for the source."""
+    if value is None:
+        return
+    state = read_state(WATERMARKS_FILE)
+    state[source] = value.isoformat()
+    write_state(WATERMARKS_FILE, state)
+    current_app.logger.debug(f"{source} watermark set to: {state[source]}")
+
+
+class ImportCheckpoint:
+    """Durable progress of an import run (written after each acknowledged batch when enabled).
+
+    Tracks the completed sources and, for the source in progress, its extraction key ranges with the
+    last acknowledged key in each one so a failed run can be resumed from there.
+    """
+
+    def __init__(self, state: dict, enabled: bool = True, resumed: bool = False):
+        """Initialize the checkpoint."""
+        self.state = state
+        self.enabled = enabled
+        self.resumed = resumed
+
+    @classmethod
+    def new(cls, import_started_at: datetime, is_reindex: bool) -> "ImportCheckpoint":
+        """Return a new checkpoint for the run (only persisted if IMPORT_CHECKPOINTS is enabled)."""
+        checkpoint = cls(
+            {
+                "import_started_at": import_started_at.isoformat(),
+                "is_reindex": is_reindex,
+                "completed": [],
+                "counts": {},
+                "current": None,
+            },
+            enabled=current_app.config.get("IMPORT_CHECKPOINTS", False),
+        )
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls) -> "ImportCheckpoint | None":
+        """Return the checkpoint left by an unfinished run (if there is one)."""
+        if state := read_state(CHECKPOINT_FILE):
+            return cls(state, resumed=True)
+        return None
+
+    @property
+    def import_started_at(self) -> datetime:
+        """Return the start of the (original) run."""
+        return datetime.fromisoformat(self.state["import_started_at"])
+
+    @property
+    def is_reindex(self) -> bool:
+        """Return True if the run is a reindex."""
+        return self.state["is_reindex"]
+
+    @property
+    def watermark(self) -> datetime | None:
+        """Return the high-water mark captured when the source in progress was started."""
+        if (current := self.state["current"]) and current["watermark"]:
+            return datetime.fromisoformat(current["watermark"])
+        return None
+
+    def save(self):
+        """Write the checkpoint."""
+        if self.enabled:
+            write_state(CHECKPOINT_FILE, self.state)
+
+    def clear(self):
+        """Remove the checkpoint (the run finished)."""
+        if self.enabled:
+            get_state_path(CHECKPOINT_FILE).unlink(missing_ok=True)
+
+    def is_completed(self, source: str) -> bool:
+        """Return True if the source was already completed by this run."""
+        return source in self.state["completed"]
+
+    def is_resuming(self, source: str) -> bool:
+        """Return True if the source was in progress when the resumed run stopped."""
+        return self.resumed and (self.state["current"] or {}).get("source") == source
+
+    def start_source(
+        self, source: str, key_ranges: list[KeyRange], watermark: datetime | None = None
+    ) -> list[KeyRange]:
+        """Return the key ranges left to extract for the source (continuing from the last acknowledged keys)."""
+        if self.is_resuming(source):
+            current = self.state["current"]
+            current_app.logger.debug(f"Resuming {source} from keys: {current['last_keys']}")
+            # NOTE: the last acknowledged key is sent again (upserted) which is harmless
+            return [
+                (last_key or lower, upper)
+                for (lower, upper), last_key in zip(current["key_ranges"], current["last_keys"], strict=True)
+            ]
+
+        self.state["current"] = {
+            "source": source,
+            "key_ranges": key_ranges,
+            "last_keys": [None] * len(key_ranges),
+            "watermark": watermark.isoformat() if watermark else None,
+        }
+        self.save()
+        return key_ranges
+
+    def record_batch(self, keys: list[str], count: int):
+        """Record the keys of an acknowledged batch (extracted in key order within each key range)."""
+        current = self.state["current"]
+        lower_bounds = [lower for lower, _ in current["key_ranges"][1:]]
+        for key in keys:
+            current["last_keys"][bisect_right(lower_bounds, key)] = key
+        self.state["counts"][current["source"]] = self.state["counts"].get(current["source"], 0) + count
+        self.save()
+
+    def complete_source(self, source: str):
+        """Record the source as completed."""
+        self.state["completed"].append(source)
+        self.state["current"] = None
+        self.save()
@@ -0,0 +1,143 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Memory budgeting for the import (RSS watchdog that throttles extraction near the pod memory limit)."""
+
+import gc
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from flask import current_app
+
+# cgroup v2 / v1 memory limit files (v1 reports a huge number when unlimited)
+CGROUP_LIMIT_FILES = ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes")
+_UNLIMITED = 2**60
+# cgroup v2 / v1 memory usage file, stat file and the stat holding its reclaimable (inactive) page cache
+CGROUP_USAGE_FILES = (
+    ("/sys/fs/cgroup/memory.current", "/sys/fs/cgroup/memory.stat", "inactive_file"),
+    ("/sys/fs/cgroup/memory/memory.usage_in_bytes", "/sys/fs/cgroup/memory/memory.stat", "total_inactive_file"),
+)
+
+
+def _get_working_set(usage_file: str, stat_file: str, inactive_stat: str) -> int:
+    """Return the cgroup usage minus its inactive page cache (the working set the kubelet / OOM killer go by)."""
+    usage = int(Path(usage_file).read_text(encoding="utf-8").strip())
+    for line in Path(stat_file).read_text(encoding="utf-8").splitlines():
+        name, _, value = line.partition(" ")
+        if name == inactive_stat:
+            return max(usage - int(value), 0)
+    return usage
+
+
+def get_rss() -> int | None:
+    """Return the container working set, otherwise the process RSS in bytes (None if neither can be read).
+
+    The forkserver parse workers are separate processes so the process RSS alone would miss their memory. The
+    inactive page cache (i.e. from the replay cache / snapshot files) is excluded as it's reclaimed before an OOM.
+    """
+    for usage_file, stat_file, inactive_stat in CGROUP_USAGE_FILES:
+        try:
+            return _get_working_set(usage_file, stat_file, inactive_stat)
+        except (OSError, ValueError):
+            continue
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text(encoding="utf-8").split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_memory_limit() -> int | None:
+    """Return the configured memory limit, otherwise the container (cgroup) limit (None if unlimited)."""
+    if limit := current_app.config.get("IMPORT_MEMORY_LIMIT"):
+        return limit
+    for limit_file in CGROUP_LIMIT_FILES:
+        try:
+            value = Path(limit_file).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < _UNLIMITED:
+            return int(value)
+        return None
+    return None
+
+
+class MemoryGuard:
+    """Throttles the extraction while the RSS is over the high watermark of the memory limit."""
+
+    def __init__(self):
+        """Initialize the guard (disabled if there is no limit or the RSS can't be read)."""
+        limit = get_memory_limit()
+        self.high_watermark = int(limit * current_app.config["IMPORT_MEMORY_HIGH_RATIO"]) if limit else 0
+        self.enabled = bool(self.high_watermark and get_rss() is not None)
+        self.throttled = 0
+        self._last_throttled_rss = 0
+
+    def is_over(self) -> bool:
+        """Return True if the RSS is over the high watermark."""
+        return self.enabled and self._get_rss() > self.high_watermark
+
+    @staticmethod
+    def _get_rss() -> int:
+        """Return the RSS (0 if it can no longer be read so the import isn't held)."""
+        return get_rss() or 0
+
+    def throttle(self, drain: Callable[[], int]) -> int:
+        """Release what memory the import can and wait (bounded) for the RSS to drop.
+
+        The in flight uploads are drained first (their batches are the bulk of the buffered docs). The
+        extraction is then held, with backoff, until the RSS is back under the high watermark or
+        IMPORT_MEMORY_THROTTLE_SECONDS has passed. If the RSS hasn't grown since the last throttle, only
+        the drain is done (freed memory isn't always returned to the os, so waiting wouldn't help) and the
+        import carries on one batch at a time instead of being OOM killed.
+        Returns the doc count of the drained uploads.
+        """
+        count = drain()
+        gc.collect()
+        self.throttled += 1
+        rss = self._get_rss()
+        if rss > self.high_watermark and rss > self._last_throttled_rss:
+            current_app.logger.warning(
+                f"Import RSS {rss} bytes over the high watermark ({self.high_watermark}). Throttling extraction..."
+            )
+            deadline = time.monotonic() + current_app.config["IMPORT_MEMORY_THROTTLE_SECONDS"]
+            interval = 1
+            while rss > self.high_watermark and time.monotonic() < deadline:
+                time.sleep(interval)
+                interval = min(interval * 2, 10)
+                gc.collect()
+                rss = self._get_rss()
+            self._last_throttled_rss = rss
+        return count
@@ -0,0 +1,95 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Parallel (key range partitioned) data extraction."""
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+_PARTITION_DONE = object()
+
+
+def stream_partitioned_rows(extracts: list[Callable[[], Iterable[list[dict]]]]) -> Iterator[list[dict]]:
+    """Yield row dict batches from each partition extract as they arrive.
+
+    Each extract is called in its own worker thread and must return the row dict batches for its partition.
+    The batches from all partitions are merged (unordered) into a single stream so they can be fed
+    into the upload stage. A bounded queue keeps the extract side from outrunning the uploads.
+    """
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    results = queue.Queue(maxsize=len(extracts) * current_app.config.get("EXTRACT_QUEUE_SIZE", 2))
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        """Put the item on the queue unless the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _extract_partition(extract: Callable):
+        """Fetch the partition rows and pass them to the consumer."""
+        with app.app_context():
+            try:
+                for rows in extract():
+                    if not _put(rows):
+                        break
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                _put(err)
+            finally:
+                _put(_PARTITION_DONE)
+
+    with ThreadPoolExecutor(max_workers=len(extracts), thread_name_prefix="extract") as executor:
+        for extract in extracts:
+            executor.submit(_extract_partition, extract)
+        try:
+            remaining = len(extracts)
+            while remaining:
+                item = results.get()
+                if item is _PARTITION_DONE:
+                    remaining -= 1
+                    current_app.logger.debug(f"Partition extract finished ({remaining} remaining).")
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # unblock any workers still waiting on the queue
+            stop.set()
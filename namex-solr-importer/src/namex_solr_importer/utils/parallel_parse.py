@@ -0,0 +1,116 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Process pool parse/serialize stage (spreads the CPU bound doc parsing and json encoding over every core)."""
+
+import json
+import multiprocessing
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+from .data_parsing import parse_conflict
+
+
+class EncodedBatch(NamedTuple):
+    """A batch of docs already serialized for the import endpoint."""
+
+    body: bytes  # json list of the docs
+    count: int
+    keys: list[str]  # extraction keys of the rows (for checkpointing)
+    last_doc: dict | None
+
+
+def encode_rows(rows: list[dict], conflict_type: str, max_bytes: int = 0) -> list[EncodedBatch]:
+    """Parse the rows and return them as json encoded batches of up to max_bytes (runs in the worker processes).
+
+    The rows' keys are only given to the last batch, so they're checkpointed once every batch is acknowledged.
+    """
+    docs = [parse_conflict(row, conflict_type).to_dict() for row in rows]
+    keys = [row["nr_num"] if conflict_type == "NR" else row["corp_num"] for row in rows]
+    if not max_bytes:
+        return [EncodedBatch(json.dumps(docs).encode(), len(docs), keys, docs[-1] if docs else None)]
+
+    encoded_docs = [json.dumps(doc).encode() for doc in docs]
+    batches = []
+    start = 0
+    size = 2  # the list brackets
+    for index, encoded in enumerate(encoded_docs):
+        if index > start and size + len(encoded) + 1 > max_bytes:
+            batches.append(_join(encoded_docs[start:index], [], docs[index - 1]))
+            start, size = index, 2
+        size += len(encoded) + 1
+    batches.append(_join(encoded_docs[start:], keys, docs[-1] if docs else None))
+    return batches
+
+
+def join_encoded_docs(encoded_docs: list[bytes]) -> bytes:
+    """Return the json list body of the individually json encoded docs."""
+    return b"[" + b",".join(encoded_docs) + b"]"
+
+
+def _join(encoded_docs: list[bytes], keys: list[str], last_doc: dict | None) -> EncodedBatch:
+    return EncodedBatch(join_encoded_docs(encoded_docs), len(encoded_docs), keys, last_doc)
+
+
+def encode_batches(
+    row_batches: Iterable[list[dict]], conflict_type: str, workers: int, ordered: bool = True, max_bytes: int = 0
+) -> Iterator[EncodedBatch]:
+    """Yield the encoded batches for the row batches, parsed/serialized in a pool of worker processes.
+
+    Each row batch is sent to a worker as is (one pickle of plain row dicts in, one bytes body out) so
+    the batch size also sets the IPC chunk size. At most 2 batches per worker are in flight to bound
+    memory and each body is split to stay under max_bytes (if given). Batches are yielded in the order
+    given when ordered, otherwise as soon as they're done.
+    """
+    # NOTE: forkserver so the workers don't inherit the extract threads / db connection pools
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver")) as pool:
+        pending: deque[Future] = deque()
+        for rows in row_batches:
+            pending.append(pool.submit(encode_rows, rows, conflict_type, max_bytes))
+            while len(pending) >= workers * 2:
+                yield from _collect(pending, ordered)
+        while pending:
+            yield from _collect(pending, ordered)
+
+
+def _collect(pending: deque[Future], ordered: bool) -> Iterator[EncodedBatch]:
+    """Yield the encoded batches of the next finished row batch (the oldest one if ordered)."""
+    if ordered:
+        yield from pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
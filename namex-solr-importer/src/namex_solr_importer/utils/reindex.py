@@ -35,24 +35,46 @@
 
 """Wrapper methods to call the namex-solr-api reindex endpoints."""
 
+import time
 from http import HTTPStatus
 
-import requests
 from flask import current_app
 
 from namex_solr_api.exceptions import SolrException
-from namex_solr_importer import auth
 
+from .http_client import api_client
 
-def _call_reindex_endpoint(endpoint: str, timeout: int = 1800) -> bool:
-    """Helper to call a reindex endpoint via HTTP."""
-    token = auth.get_bearer_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    url = f"{current_app.config['SOLR_API_URL']}/internal/solr/reindex/{endpoint}"
 
+def _wait_for_job(job_id: int, endpoint: str) -> bool:
+    """Poll the reindex job status (with backoff) until it finishes."""
+    deadline = time.monotonic() + current_app.config.get("REINDEX_JOB_TIMEOUT", 7200)
+    interval = 2
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        interval = min(interval * 2, 30)
+        # NOTE: the job can outlive the token (refreshed by the client as needed)
+        resp = api_client.request("GET", f"/internal/solr/reindex/jobs/{job_id}", timeout=30)
+        if resp.status_code != HTTPStatus.OK:
+            current_app.logger.debug(f"Reindex job {job_id} status check failed: {resp.status_code}")
+            continue
+        job = resp.json()
+        current_app.logger.debug(f"Reindex job {job_id} ({endpoint}): {job['status']} {job.get('currentStep') or ''}")
+        if job["status"] == "COMPLETE":
+            return True
+        if job["status"] == "ERROR":
+            raise SolrException(
+                f"Reindex endpoint '{endpoint}' failed.", job.get("error"), HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+    raise SolrException(
+        f"Reindex endpoint '{endpoint}' timed out.", f"job {job_id}", HTTPStatus.GATEWAY_TIMEOUT
+    )
+
+
+def _call_reindex_endpoint(endpoint: str, timeout: int = 60) -> bool:
+    """Helper to call a reindex endpoint via HTTP (waiting for its background job to finish)."""
     current_app.logger.debug(f"Calling reindex endpoint: '{endpoint}' ...")
     try:
-        resp = requests.post(url, headers=headers, timeout=timeout)
+        resp = api_client.request("POST", f"/internal/solr/reindex/{endpoint}", timeout=timeout)
         if resp.status_code not in (
             HTTPStatus.OK,
             HTTPStatus.CREATED,
@@ -67,6 +89,8 @@ def _call_reindex_endpoint(endpoint: str, timeout: int = 1800) -> bool:
                 ),
                 resp.status_code,
             )
+        if resp.status_code == HTTPStatus.ACCEPTED:
+            _wait_for_job(resp.json()["jobId"], endpoint)
         current_app.logger.debug(
             f"Reindex endpoint '{endpoint}' completed successfully."
         )
@@ -76,16 +100,25 @@ def _call_reindex_endpoint(endpoint: str, timeout: int = 1800) -> bool:
         raise
 
 
+def is_swap_reindex() -> bool:
+    """Return True if reindexes rebuild a shadow core that is swapped in (instead of rebuilding in place)."""
+    return current_app.config.get("REINDEX_MODE") == "swap"
+
+
 def reindex_prep() -> bool:
     """Trigger pre-reindex operations via the API."""
-    return _call_reindex_endpoint("prep")
+    return _call_reindex_endpoint("swap/prep" if is_swap_reindex() else "prep")
 
 
 def reindex_post() -> bool:
     """Trigger post-reindex operations via the API."""
-    return _call_reindex_endpoint("post")
+    return _call_reindex_endpoint("swap/post" if is_swap_reindex() else "post")
 
 
 def reindex_recovery() -> bool:
     """Trigger reindex recovery operations via the API."""
+    if is_swap_reindex():
+        # the live core is only replaced once the rebuilt core is swapped in so there is nothing to restore
+        current_app.logger.debug("Swap reindex: live core untouched, no recovery needed.")
+        return True
     return _call_reindex_endpoint("recovery")
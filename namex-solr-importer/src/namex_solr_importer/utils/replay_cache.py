@@ -0,0 +1,111 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Local replay cache of the parsed docs (used to reindex without reading the source databases).
+
+Each source is written as gzipped JSON lines chunks (one import batch per line) to a temporary
+directory that only replaces the source's previous cache once the source has been fully extracted,
+so a failed run never leaves a partial cache behind.
+"""
+
+import gzip
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+MANIFEST_FILE = "manifest.json"
+
+
+class ReplayCacheWriter:
+    """Write the parsed docs of a source to the replay cache."""
+
+    def __init__(self, directory: str | Path, source: str, created_at: datetime, chunk_size: int = 50000):
+        """Initialize the cache writer (chunk_size is the number of docs per chunk file)."""
+        self.source_dir = Path(directory) / source
+        self.tmp_dir = Path(directory) / f"{source}.tmp"
+        self.created_at = created_at
+        self.chunk_size = chunk_size
+        self.chunks = 0
+        self.docs = 0
+        self._chunk_docs = 0
+        self._file = None
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        self.tmp_dir.mkdir(parents=True)
+
+    def _next_chunk(self):
+        """Close the current chunk file and open the next one."""
+        if self._file:
+            self._file.close()
+        self.chunks += 1
+        self._chunk_docs = 0
+        # closed on the next chunk / commit
+        self._file = gzip.open(self.tmp_dir / f"{self.chunks:05d}.jsonl.gz", "wb", compresslevel=6)  # noqa: SIM115
+
+    def write(self, docs: list[dict]):
+        """Write the batch of docs."""
+        if not docs:
+            return
+        if self._file is None or self._chunk_docs >= self.chunk_size:
+            self._next_chunk()
+        self._file.write(json.dumps(docs).encode() + b"\n")
+        self._chunk_docs += len(docs)
+        self.docs += len(docs)
+
+    def commit(self):
+        """Write the manifest and replace the source's previous cache."""
+        if self._file:
+            self._file.close()
+        manifest = {"created_at": self.created_at.isoformat(), "chunks": self.chunks, "docs": self.docs}
+        (self.tmp_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+        shutil.rmtree(self.source_dir, ignore_errors=True)
+        os.replace(self.tmp_dir, self.source_dir)
+
+
+def get_replay_manifest(directory: str | Path, source: str) -> dict:
+    """Return the manifest of the source's replay cache (FileNotFoundError if it hasn't been cached)."""
+    path = Path(directory) / source / MANIFEST_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No replay cache for {source} in {directory}.")
+    return json.loads(path.read_text())
+
+
+def read_replay_batches(directory: str | Path, source: str) -> Iterator[list[dict]]:
+    """Yield the cached batches of docs for the source (in the order they were written)."""
+    manifest = get_replay_manifest(directory, source)
+    for chunk in range(1, manifest["chunks"] + 1):
+        with gzip.open(Path(directory) / source / f"{chunk:05d}.jsonl.gz", "rb") as file:
+            for line in file:
+                yield json.loads(line)
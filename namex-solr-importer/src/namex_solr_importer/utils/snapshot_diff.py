@@ -0,0 +1,118 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Snapshot diffing for sources without reliable change timestamps (i.e. COLIN).
+
+The snapshot is a local SQLite table of id -> content hash for the docs indexed by the last
+successful run. Each run records the hashes of the fresh extraction in a separate table and only
+the inserted/changed docs are passed on. The ids missing from the fresh extraction are the deleted
+docs. The snapshot is only replaced once the run has been fully sent, so a failed run is diffed
+against the same snapshot next time.
+"""
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+
+class SnapshotDiff:
+    """Diff the extracted docs against the snapshot of the last indexed docs."""
+
+    def __init__(self, path: str | Path, send_all: bool = False, resume: bool = False):
+        """Initialize the snapshot.
+
+        send_all still records the snapshot but passes on every doc. resume keeps the hashes already
+        recorded by the unfinished run (see ImportCheckpoint).
+        """
+        self.send_all = send_all
+        self.inserted = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS snapshot (id TEXT PRIMARY KEY, hash BLOB NOT NULL)")
+        if not resume:
+            self.conn.execute("DROP TABLE IF EXISTS current_run")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS current_run (id TEXT PRIMARY KEY, hash BLOB NOT NULL)")
+        self.conn.commit()
+
+    @staticmethod
+    def get_hash(doc: dict) -> bytes:
+        """Return the content hash of the doc."""
+        return hashlib.blake2b(json.dumps(doc, sort_keys=True, default=str).encode(), digest_size=16).digest()
+
+    def filter_changed(self, docs: list[dict]) -> list[dict]:
+        """Record the docs for this run and return the ones that are new or changed since the snapshot."""
+        hashes = [(doc["id"], self.get_hash(doc)) for doc in docs]
+        # NOTE: INSERT OR REPLACE so a doc extracted twice (i.e. resumed runs) keeps the last version
+        self.conn.executemany("INSERT OR REPLACE INTO current_run (id, hash) VALUES (?, ?)", hashes)
+        self.conn.commit()
+        previous = {}
+        for offset in range(0, len(hashes), 500):
+            ids = [doc_id for doc_id, _ in hashes[offset:offset + 500]]
+            placeholders = ",".join("?" * len(ids))
+            previous.update(
+                self.conn.execute(f"SELECT id, hash FROM snapshot WHERE id IN ({placeholders})", ids).fetchall()
+            )
+
+        changed_docs = []
+        for doc, (doc_id, doc_hash) in zip(docs, hashes, strict=True):
+            if doc_id not in previous:
+                self.inserted += 1
+            elif previous[doc_id] != doc_hash:
+                self.changed += 1
+            else:
+                self.unchanged += 1
+                if not self.send_all:
+                    continue
+            changed_docs.append(doc)
+        return changed_docs
+
+    def get_deleted_ids(self, batch_size: int) -> Iterator[list[str]]:
+        """Yield the ids in the snapshot that were not extracted this run."""
+        cursor = self.conn.execute(
+            "SELECT id FROM snapshot WHERE id NOT IN (SELECT id FROM current_run) ORDER BY id"
+        )
+        while rows := cursor.fetchmany(batch_size):
+            yield [row[0] for row in rows]
+
+    def commit(self):
+        """Replace the snapshot with the docs recorded for this run."""
+        with self.conn:
+            self.conn.execute("DROP TABLE snapshot")
+            self.conn.execute("ALTER TABLE current_run RENAME TO snapshot")
+
+    def close(self):
+        """Close the snapshot db connection."""
+        self.conn.close()
@@ -33,6 +33,8 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Manages util methods for updating possible conflict records via the namex solr api."""
 
+import json
+import threading
 import time
 from datetime import datetime
 from http import HTTPStatus
@@ -40,12 +42,67 @@ from http import HTTPStatus
 import requests
 from flask import current_app
 
+from namex_solr_api.common.compression import compress
 from namex_solr_api.exceptions import SolrException
-from namex_solr_importer import auth
+from namex_solr_importer import solr
+
+from .http_client import api_client
+
+# running totals for the import batches (used to compare the compression settings per environment)
+import_metrics = {"docs": 0, "body_bytes": 0, "wire_bytes": 0, "seconds": 0.0}
+_metrics_lock = threading.Lock()
+
+
+def _get_direct_core(core: str) -> str | None:
+    """Return the solr core for the import target ("shadow" while rebuilding the shadow core for a swap reindex)."""
+    # NOTE: the tiers map the shadow core to their own shadow core (see NamexSolr.get_tier_core)
+    return solr.shadow_core if core == "shadow" else None
+
+
+def _put_body(
+    body: bytes, count: int, partial: bool, encoding: str, core: str
+) -> tuple[requests.Response, int, int]:
+    """Send the json list body to the api import endpoint and return the response, body size and bytes on wire."""
+    # NOTE: the docs list is the body (envelope in the params) so the api can pass it through to solr
+    data = compress(body, encoding) if encoding else body
+    headers = {"Content-Type": "application/json"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    import_resp = api_client.request(
+        "PUT",
+        "/internal/solr/import",
+        headers=headers,
+        params={
+            "count": count,
+            "timeout": "60",
+            "type": "partial" if partial else "full",
+            "core": core,
+        },
+        data=data,
+        timeout=90,
+    )
+    return import_resp, len(body), len(data)
+
+
+def _record_metrics(data_name: str, count: int, body_bytes: int, wire_bytes: int, elapsed: float):
+    """Add the import call to the running totals."""
+    with _metrics_lock:
+        import_metrics["docs"] += count
+        import_metrics["body_bytes"] += body_bytes
+        import_metrics["wire_bytes"] += wire_bytes
+        import_metrics["seconds"] += elapsed
+    if wire_bytes:
+        current_app.logger.debug(
+            f"{data_name} import: {body_bytes} bytes, {wire_bytes} bytes on wire "
+            f"({current_app.config.get('IMPORT_COMPRESSION') or 'uncompressed'}), {elapsed:.2f}s"
+        )
 
 
 def _get_wait_interval(err: Exception):
     """Return the base wait interval for the exception."""
+    if isinstance(err, SolrException) and "408" in str(err.error):
+        # increased base wait time for solr 408 error (direct import)
+        return 60
     if (
         isinstance(err.args, tuple | list)
         and err.args
@@ -57,47 +114,52 @@ def _get_wait_interval(err: Exception):
     return 20
 
 
-def import_conflicts(docs: list[dict], data_name: str, partial=False) -> int:
-    """Import data via namex solr api."""
-    current_app.logger.debug("Getting token for Import...")
-    token = auth.get_bearer_token()
-    headers = {"Authorization": "Bearer " + token}
-    current_app.logger.debug("Token set.")
-    count = 0
+def _send_batch(body: bytes, count: int, partial: bool, core: str) -> int:
+    """Send the json list body of docs via namex solr api (or directly to solr) and return the bytes on wire."""
+    if current_app.config.get("IMPORT_DIRECT_TO_SOLR"):
+        # NOTE: same client and commit policy used by the api import endpoint
+        if len(solr.tiers) > 1:
+            # NOTE: the docs are split between the tiers by type / state so they can't be forwarded as is
+            solr.create_or_replace_docs(raw_docs=json.loads(body), timeout=60, core=_get_direct_core(core))
+        else:
+            solr.create_or_replace_raw_docs(payload=body, doc_count=count, timeout=60, core=_get_direct_core(core))
+        return 0
+
+    import_resp, _, wire_bytes = _put_body(body, count, partial, current_app.config.get("IMPORT_COMPRESSION"), core)
+    if import_resp.status_code != HTTPStatus.CREATED:
+        # try again
+        raise Exception(  # pylint: disable=broad-exception-raised
+            {
+                "error": import_resp.json(),
+                "status_code": import_resp.status_code,
+            }
+        )  # pylint: disable=broad-exception-raised
+    return wire_bytes
+
+
+def _import_body(body: bytes, count: int, data_name: str, partial: bool, core: str) -> int:
+    """Import the json list body of docs (retrying failed batches) and return the doc count imported.
+
+    A failed batch is retried up to 5 times with a smaller slice of its docs each time, then once more after a
+    2 minute wait (with a new api token) before the import is aborted.
+    """
+    started_at = time.perf_counter()
+    body_bytes = wire_bytes = 0
+    # NOTE: only decoded if a retry needs to send a smaller slice of the docs
+    docs = None
     offset = 0
-    rows = current_app.config["BATCH_SIZE"]
     retry_count = 0
-    while count < len(docs) and rows > 0 and len(docs) - offset > 0:
-        batch_amount = int(min(rows, len(docs) - offset) / (retry_count + 1))
-        count += batch_amount
-        # call api import endpoint
+    while offset < count:
+        batch_amount = max(int((count - offset) / (retry_count + 1)), 1)
+        if batch_amount == count:
+            batch = body
+        else:
+            docs = docs if docs is not None else json.loads(body)
+            batch = json.dumps(docs[offset:offset + batch_amount]).encode()
         try:
             current_app.logger.debug("Importing batch...")
-            import_resp = requests.put(
-                url=f"{current_app.config.get('SOLR_API_URL')}/internal/solr/import",
-                headers=headers,
-                json={
-                    "possibleConflicts": docs[offset:count],
-                    "timeout": "60",
-                    "type": "partial" if partial else "full",
-                },
-                timeout=90,
-            )
-
-            if import_resp.status_code != HTTPStatus.CREATED:
-                if import_resp.status_code == HTTPStatus.UNAUTHORIZED:
-                    # renew token for next try
-                    current_app.logger.debug("Getting new token for Import...")
-                    token = auth.get_bearer_token()
-                    headers = {"Authorization": "Bearer " + token}
-                    current_app.logger.debug("New Token set.")
-                # try again
-                raise Exception(  # pylint: disable=broad-exception-raised
-                    {
-                        "error": import_resp.json(),
-                        "status_code": import_resp.status_code,
-                    }
-                )  # pylint: disable=broad-exception-raised
+            wire_bytes += _send_batch(batch, batch_amount, partial, core)
+            body_bytes += len(batch)
             retry_count = 0
         except Exception as err:
             current_app.logger.debug(err)
@@ -115,8 +177,6 @@ def import_conflicts(docs: list[dict], data_name: str, partial=False) -> int:
                     base_wait_time * retry_count,
                 )
                 time.sleep(base_wait_time * retry_count)
-                # set count back
-                count -= batch_amount
                 continue
             if retry_count == 5:  # noqa: PLR2004
                 # wait x minutes and then try one more time
@@ -124,42 +184,75 @@ def import_conflicts(docs: list[dict], data_name: str, partial=False) -> int:
                     "Max retries for batch exceeded. Awaiting 2 mins before trying one more time..."
                 )
                 time.sleep(120)
-                # renew token for next try
-                current_app.logger.debug("Getting new token for Import...")
-                token = auth.get_bearer_token()
-                headers = {"Authorization": "Bearer " + token}
-                current_app.logger.debug("New Token set.")
+                if not current_app.config.get("IMPORT_DIRECT_TO_SOLR"):
+                    # renew token for next try
+                    api_client.invalidate_token()
                 # try again
                 retry_count += 1
-                count -= batch_amount
                 continue
             # log and raise error
             current_app.logger.error("Retry count exceeded for batch.")
             raise SolrException(
                 "Retry count exceeded for updating SOLR. Aborting import."
             ) from err
-        offset = count
+        offset += batch_amount
         current_app.logger.debug(
-            f"Total batch {data_name} doc records imported: {count}"
+            f"Total batch {data_name} doc records imported: {offset}"
         )
+    _record_metrics(data_name, count, body_bytes, wire_bytes, time.perf_counter() - started_at)
+    return count
+
+
+def import_conflicts(docs: list[dict], data_name: str, partial=False, core="live") -> int:
+    """Import data via namex solr api (or directly to the solr leader if configured) into the "live"/"shadow" core."""
+    rows = current_app.config["BATCH_SIZE"]
+    count = 0
+    for offset in range(0, len(docs), rows):
+        batch = docs[offset:offset + rows]
+        count += _import_body(json.dumps(batch).encode(), len(batch), data_name, partial, core)
     return count
 
 
+def import_encoded_batch(body: bytes, count: int, data_name: str, core="live") -> int:
+    """Import the already json encoded batch of docs (see parallel_parse) via namex solr api or directly to solr."""
+    return _import_body(body, count, data_name, False, core)
+
+
+def delete_conflicts(ids: list[str], data_name: str, core="live") -> int:
+    """Delete the docs for the ids via namex solr api (or directly from the solr leader if configured)."""
+    batch_size = current_app.config["BATCH_SIZE"]
+    for offset in range(0, len(ids), batch_size):
+        batch = ids[offset:offset + batch_size]
+        if current_app.config.get("IMPORT_DIRECT_TO_SOLR"):
+            solr.delete_docs_by_id(batch, core=_get_direct_core(core))
+            continue
+
+        delete_resp = api_client.request(
+            "POST",
+            "/internal/solr/import/delete",
+            params={"core": core},
+            json={"ids": batch},
+            timeout=90,
+        )
+        if delete_resp.status_code != HTTPStatus.OK:
+            current_app.logger.error("Delete failed: %s, %s", delete_resp.status_code, delete_resp.json())
+            raise SolrException(f"Failed to delete {data_name} docs. Aborting import.")
+
+    current_app.logger.debug(f"Total {data_name} docs deleted: {len(ids)}")
+    return len(ids)
+
+
 def resync(since: datetime | None = None):
     """Resync to catch any records that had an update during the import."""
-    current_app.logger.debug("Getting token for Resync...")
-    token = auth.get_bearer_token()
-    headers = {"Authorization": "Bearer " + token}
-
     payload = {"minutesOffset": current_app.config.get("RESYNC_OFFSET")}
     if since:
         payload = {"since": since.isoformat()}
         current_app.logger.debug("Using explicit resync watermark: %s", payload["since"])
 
     current_app.logger.debug("Resyncing any overwritten docs during import...")
-    resync_resp = requests.post(
-        url=f"{current_app.config.get('SOLR_API_URL')}/internal/solr/update/resync",
-        headers=headers,
+    resync_resp = api_client.request(
+        "POST",
+        "/internal/solr/update/resync",
         json=payload,
         timeout=60,
     )
@@ -178,15 +271,11 @@ def resync(since: datetime | None = None):
 
 def update_synonyms(payload: dict):
     """Update synonyms via the solr api endpoint."""
-    current_app.logger.debug("Getting token for Synonym Update...")
-    token = auth.get_bearer_token()
-    headers = {"Authorization": "Bearer " + token}
-    current_app.logger.debug("Token set.")
     current_app.logger.debug("Updating Synonyms...")
     try:
-        resp = requests.put(
-            url=f"{current_app.config.get('SOLR_API_URL')}/internal/solr/update/synonyms?prune=true",
-            headers=headers,
+        resp = api_client.request(
+            "PUT",
+            "/internal/solr/update/synonyms?prune=true",
             json={"ALL": payload},
             timeout=1200,
         )
@@ -0,0 +1,111 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for importer data collection partitioning."""
+
+import pytest
+
+from namex_solr_importer.services import oracle
+from namex_solr_importer.utils import fetch_row_dicts, stream_partitioned_rows
+from namex_solr_importer.utils.data_collection import (
+    _get_key_range_clause,
+    get_key_ranges,
+)
+
+
+class _FakeCursor:
+    """Minimal dbapi style cursor returning the given rows."""
+
+    def __init__(self, rows: list[tuple]):
+        self.description = [("CORP_NUM",), ("NAME",)]
+        self.rows = rows
+        self.closed = False
+
+    def fetchmany(self, size: int):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+def test_get_key_ranges_covers_full_key_space():
+    """Partition ranges should be contiguous and open at both ends."""
+    assert get_key_ranges(["A0000001", "BC0000500", "BC0001000"]) == [
+        (None, "BC0000500"),
+        ("BC0000500", "BC0001000"),
+        ("BC0001000", None),
+    ]
+
+
+def test_get_key_ranges_single_partition():
+    """No bounds (or a single bound) should result in one unbounded range."""
+    assert get_key_ranges([]) == [(None, None)]
+    assert get_key_ranges(["BC0000001"]) == [(None, None)]
+
+
+def test_key_range_clause():
+    """Only the given bounds should be added to the sql clause."""
+    assert _get_key_range_clause("c.corp_num", None) == ("", {})
+    clause, params = _get_key_range_clause("c.corp_num", (None, "BC5"))
+    assert clause == " and c.corp_num < :upper_key"
+    assert params == {"upper_key": "BC5"}
+    clause, params = _get_key_range_clause("c.corp_num", ("BC1", "BC5"))
+    assert clause == " and c.corp_num >= :lower_key and c.corp_num < :upper_key"
+    assert params == {"lower_key": "BC1", "upper_key": "BC5"}
+
+
+def test_stream_partitioned_rows_merges_partitions(app):
+    """All rows from every partition should be streamed as dicts."""
+    cursors = [
+        _FakeCursor([("BC1", "ONE"), ("BC2", "TWO"), ("BC3", "THREE")]),
+        _FakeCursor([("BC4", "FOUR")]),
+        _FakeCursor([]),
+    ]
+    extracts = [lambda cur=cursor: fetch_row_dicts(cur, 2) for cursor in cursors]
+
+    rows = [row for batch in stream_partitioned_rows(extracts) for row in batch]
+
+    assert sorted(row["corp_num"] for row in rows) == ["BC1", "BC2", "BC3", "BC4"]
+    assert all(cursor.closed for cursor in cursors)
+
+
+@pytest.mark.parametrize("workers, expected_max", [(1, 10), (16, 16)])
+def test_oracle_pool_sized_for_partitions(app, monkeypatch, workers, expected_max):
+    """Assert the oracle pool has a connection for every COLIN extract partition."""
+    pool_args = {}
+    monkeypatch.setitem(app.config, "COLIN_EXTRACT_WORKERS", workers)
+    monkeypatch.setattr(oracle.oracledb, "create_pool", lambda **kwargs: pool_args.update(kwargs))
+
+    oracle.OracleDB._create_pool()  # pylint: disable=protected-access
+    assert pool_args["max"] == expected_max
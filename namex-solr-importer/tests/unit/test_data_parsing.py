@@ -33,7 +33,12 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Unit tests for importer data parsing."""
 
-from namex_solr_importer.utils.data_parsing import parse_conflict
+from datetime import datetime
+
+import pyarrow
+import pytest
+
+from namex_solr_importer.utils.data_parsing import parse_conflict, parse_conflict_frames
 
 
 def test_parse_conflict_normalizes_nr_num_for_nr_docs():
@@ -77,3 +82,28 @@ def test_parse_conflict_corp_id_unchanged():
 
     assert possible_conflict.id == "BC1234567"
     assert possible_conflict.nr_num is None
+
+
+@pytest.mark.parametrize("unit", ["s", "us"])
+def test_parse_conflict_frames_applies_column_defaults(unit):
+    """Vectorized batches should have formatted dates and jurisdiction defaults applied per column."""
+    table = pyarrow.table(
+        {
+            "CORP_NUM": ["0123456", "0123457", "0123458"],
+            "START_DATE": pyarrow.array(
+                [datetime(2001, 2, 3, 4, 5, 6, 0 if unit == "s" else 789000), None, datetime(2010, 1, 1)],
+                type=pyarrow.timestamp(unit),
+            ),
+            "NAME": ["ONE LTD.", "TWO LTD.", "THREE LTD."],
+            "JURISDICTION": ["AB", None, ""],
+            "STATE": ["ACTIVE", "ACTIVE", "HISTORICAL"],
+        }
+    )
+
+    rows = next(parse_conflict_frames([table]))
+
+    assert [row["start_date"] for row in rows] == ["2001-02-03T04:05:06", None, "2010-01-01T00:00:00"]
+    assert [row["jurisdiction"] for row in rows] == ["AB", "BC", "BC"]
+    possible_conflict = parse_conflict(rows[0], "CORP")
+    assert possible_conflict.start_date == "2001-02-03T04:05:06"
+    assert possible_conflict.jurisdiction == "AB"
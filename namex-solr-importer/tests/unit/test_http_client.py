@@ -0,0 +1,114 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the importer api client reuses its connections/token and orders the uploads."""
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from namex_solr_importer.utils import http_client
+from namex_solr_importer.utils.http_client import ApiClient, UploadPool
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class _Resp:
+    """Stand in for a requests response."""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class _Session:
+    """Stand in for the keep-alive session (records the auth header of each call)."""
+
+    def __init__(self, statuses: list[int]):
+        self.statuses = iter(statuses)
+        self.tokens = []
+
+    def request(self, method, url, headers, **kwargs):
+        self.tokens.append(headers["Authorization"])
+        return _Resp(next(self.statuses))
+
+
+def test_token_refreshed_before_expiry(app, monkeypatch):
+    """Assert the token is reused until it is within the refresh margin of its expiry."""
+    now = time.time()
+    tokens = iter([_jwt(now + 70), _jwt(now + 300)])
+    monkeypatch.setattr(http_client.auth, "get_bearer_token", lambda: next(tokens))
+    monkeypatch.setitem(app.config, "API_TOKEN_REFRESH_MARGIN", 60)
+    client = ApiClient()
+
+    first = client.get_token()
+    assert client.get_token() == first
+    monkeypatch.setattr(http_client.time, "time", lambda: now + 15)
+    assert client.get_token() != first
+
+
+def test_unauthorized_retried_with_new_token(app, monkeypatch):
+    """Assert a 401 gets a new token and is retried once on the same session."""
+    tokens = iter(["token1", "token2"])
+    monkeypatch.setattr(http_client.auth, "get_bearer_token", lambda: next(tokens))
+    client = ApiClient()
+    client._session = _Session([401, 201])
+
+    assert client.request("PUT", "/internal/solr/import").status_code == 201
+    assert client._session.tokens == ["Bearer token1", "Bearer token2"]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_upload_pool_ordered(app, workers):
+    """Assert the uploads are acknowledged in order and the earliest failure is raised."""
+    acknowledged = []
+    started = threading.Event()
+
+    def _upload(batch: int):
+        if batch == 0:
+            # finishes after the later batches when run concurrently
+            started.wait(0.2)
+        if batch == 2:
+            raise ValueError("batch 2 failed")
+        started.set()
+        return 10
+
+    with pytest.raises(ValueError, match="batch 2"), UploadPool(workers) as uploads:
+        for batch in range(5):
+            uploads.submit(_upload, batch, on_done=lambda _, batch=batch: acknowledged.append(batch))
+        uploads.drain()
+    assert acknowledged == [0, 1]
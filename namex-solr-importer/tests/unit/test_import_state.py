@@ -0,0 +1,104 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the local import state is kept as expected."""
+from datetime import UTC, datetime
+
+from namex_solr_importer.utils import (
+    ImportCheckpoint,
+    get_watermark,
+    read_state,
+    set_watermark,
+)
+
+
+def test_watermarks(app, monkeypatch, tmp_path):
+    """Assert the watermarks are recorded per source."""
+    monkeypatch.setitem(app.config, "IMPORT_STATE_DIR", str(tmp_path / "state"))
+    assert get_watermark("namex") is None
+
+    namex_watermark = datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+    set_watermark("namex", namex_watermark)
+    set_watermark("lear", None)
+    assert get_watermark("namex") == namex_watermark
+    assert get_watermark("lear") is None
+
+    lear_watermark = datetime(2025, 6, 2, tzinfo=UTC)
+    set_watermark("lear", lear_watermark)
+    assert read_state("watermarks.json") == {
+        "namex": namex_watermark.isoformat(),
+        "lear": lear_watermark.isoformat(),
+    }
+    assert not list((tmp_path / "state").glob("*.tmp"))
+
+
+def test_checkpoint_resume(app, monkeypatch, tmp_path):
+    """Assert a resumed checkpoint continues each key range after its last recorded key."""
+    monkeypatch.setitem(app.config, "IMPORT_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setitem(app.config, "IMPORT_CHECKPOINTS", True)
+    assert ImportCheckpoint.load() is None
+
+    started_at = datetime(2025, 6, 1, tzinfo=UTC)
+    watermark = datetime(2025, 6, 1, 1, tzinfo=UTC)
+    checkpoint = ImportCheckpoint.new(started_at, is_reindex=True)
+    checkpoint.complete_source("namex")
+    key_ranges = [(None, "0300000"), ("0300000", "0600000"), ("0600000", None)]
+    assert checkpoint.start_source("lear", key_ranges, watermark) == key_ranges
+    # partitions are streamed together so a batch can have keys from each range
+    checkpoint.record_batch(["0000001", "0300000", "0000002"], 3)
+    checkpoint.record_batch(["0300005", "0000009"], 2)
+
+    resumed = ImportCheckpoint.load()
+    assert resumed.resumed
+    assert resumed.is_reindex
+    assert resumed.import_started_at == started_at
+    assert resumed.is_completed("namex")
+    assert not resumed.is_resuming("colin")
+    assert resumed.is_resuming("lear")
+    assert resumed.start_source("lear", key_ranges) == [("0000009", "0300000"), ("0300005", "0600000"), ("0600000", None)]
+    assert resumed.watermark == watermark
+    assert resumed.state["counts"] == {"lear": 5}
+
+    resumed.complete_source("lear")
+    resumed.clear()
+    assert ImportCheckpoint.load() is None
+
+
+def test_checkpoint_disabled(app, monkeypatch, tmp_path):
+    """Assert nothing is written when checkpoints are disabled."""
+    monkeypatch.setitem(app.config, "IMPORT_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setitem(app.config, "IMPORT_CHECKPOINTS", False)
+    checkpoint = ImportCheckpoint.new(datetime(2025, 6, 1, tzinfo=UTC), is_reindex=False)
+    checkpoint.start_source("namex", [(None, None)])
+    checkpoint.record_batch(["NR 1234567"], 1)
+    assert ImportCheckpoint.load() is None
@@ -0,0 +1,91 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the RSS watchdog throttles the import near the memory limit."""
+from namex_solr_importer.utils import memory_guard
+from namex_solr_importer.utils.memory_guard import MemoryGuard, get_memory_limit, get_rss
+
+
+def test_get_rss(monkeypatch, tmp_path):
+    """Assert the cgroup working set (usage minus inactive page cache) is read, otherwise the process RSS."""
+    usage_file = tmp_path / "memory.current"
+    stat_file = tmp_path / "memory.stat"
+    monkeypatch.setattr(memory_guard, "CGROUP_USAGE_FILES", ((str(usage_file), str(stat_file), "inactive_file"),))
+    assert get_rss() > 0
+
+    usage_file.write_text("2147483648\n")
+    stat_file.write_text("anon 1073741824\nactive_file 1000\ninactive_file 1073741824\n")
+    assert get_rss() == 1073741824
+
+
+def test_get_memory_limit(app, monkeypatch, tmp_path):
+    """Assert the configured limit is used, otherwise the cgroup limit (None if unlimited)."""
+    limit_file = tmp_path / "memory.max"
+    monkeypatch.setattr(memory_guard, "CGROUP_LIMIT_FILES", (str(limit_file),))
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_LIMIT", 0)
+
+    limit_file.write_text("max\n")
+    assert get_memory_limit() is None
+    limit_file.write_text("2147483648\n")
+    assert get_memory_limit() == 2147483648
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_LIMIT", 1000)
+    assert get_memory_limit() == 1000
+
+
+def test_throttle(app, monkeypatch):
+    """Assert the uploads are drained and the extraction held until the RSS drops (once per new high)."""
+    rss = iter([900, 950, 950, 850, 700, 950, 950])
+    sleeps = []
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_LIMIT", 1000)
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_HIGH_RATIO", 0.8)
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_THROTTLE_SECONDS", 60)
+    monkeypatch.setattr(memory_guard, "get_rss", lambda: next(rss))
+    monkeypatch.setattr(memory_guard.time, "sleep", sleeps.append)
+
+    guard = MemoryGuard()
+    assert guard.high_watermark == 800
+    assert guard.is_over()
+    assert guard.throttle(lambda: 5) == 5
+    assert sleeps == [1, 2]
+
+    # not dropping within the throttle time: carries on
+    monkeypatch.setitem(app.config, "IMPORT_MEMORY_THROTTLE_SECONDS", 0)
+    assert guard.throttle(lambda: 3) == 3
+    # still over but no higher than the last throttle: drain only
+    assert guard.throttle(lambda: 2) == 2
+    assert sleeps == [1, 2]
+    assert guard.throttled == 3
+
+    # RSS no longer readable: not held
+    monkeypatch.setattr(memory_guard, "get_rss", lambda: None)
+    assert not guard.is_over()
@@ -0,0 +1,88 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for the importer process pool parse/serialize stage."""
+
+import json
+
+from namex_solr_importer.utils.parallel_parse import encode_batches, encode_rows
+
+
+def _corp_rows(start: int, count: int) -> list[dict]:
+    return [
+        {
+            "corp_num": f"BC{num:07d}",
+            "state": "ACTIVE",
+            "sub_type": "BC",
+            "jurisdiction": "BC",
+            "start_date": None,
+            "name": f"TEST CORP {num}",
+        }
+        for num in range(start, start + count)
+    ]
+
+
+def test_encode_rows():
+    """Assert the rows are parsed into a json encoded batch keyed by their extraction keys."""
+    [encoded] = encode_rows(_corp_rows(1, 3), "CORP")
+
+    docs = json.loads(encoded.body)
+    assert encoded.count == 3
+    assert encoded.keys == ["BC0000001", "BC0000002", "BC0000003"]
+    assert [doc["id"] for doc in docs] == encoded.keys
+    assert encoded.last_doc == docs[-1]
+
+
+def test_encode_batches():
+    """Assert the pool encodes every batch the same as in process (in order unless unordered)."""
+    row_batches = [_corp_rows(start, 5) for start in range(0, 50, 5)]
+    expected = [encode_rows(rows, "CORP")[0] for rows in row_batches]
+
+    assert list(encode_batches(iter(row_batches), "CORP", 2)) == expected
+
+    unordered = list(encode_batches(iter(row_batches), "CORP", 2, ordered=False))
+    assert sorted(unordered, key=lambda batch: batch.keys[0]) == expected
+
+
+def test_encode_rows_max_bytes():
+    """Assert the encoded batches are split under the byte limit with the keys on the last one."""
+    rows = _corp_rows(1, 10)
+    doc_bytes = len(encode_rows(rows[:1], "CORP")[0].body)
+
+    encoded = encode_rows(rows, "CORP", max_bytes=doc_bytes * 3)
+
+    assert [batch.count for batch in encoded] == [3, 3, 3, 1]
+    assert all(len(batch.body) <= doc_bytes * 3 for batch in encoded)
+    assert [doc for batch in encoded for doc in json.loads(batch.body)] == json.loads(encode_rows(rows, "CORP")[0].body)
+    assert [batch.keys for batch in encoded[:-1]] == [[], [], []]
+    assert encoded[-1].keys == [row["corp_num"] for row in rows]
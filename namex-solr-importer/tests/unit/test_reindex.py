@@ -0,0 +1,74 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the reindex jobs are started and polled as expected."""
+import pytest
+
+from namex_solr_api.exceptions import SolrException
+from namex_solr_importer.utils import reindex
+
+
+class _Resp:
+    """Stand in for a requests response."""
+
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {"Content-Type": "application/json"}
+
+    def json(self):
+        return self.body
+
+
+@pytest.mark.parametrize("final_status", ["COMPLETE", "ERROR"])
+def test_reindex_job_polled(app, monkeypatch, final_status):
+    """Assert the importer waits on the job started by the reindex endpoint."""
+    statuses = iter([
+        _Resp(200, {"status": "RUNNING", "currentStep": "verify_backup"}),
+        _Resp(503, {}),
+        _Resp(200, {"status": final_status, "error": "backup failed"}),
+    ])
+    sleeps = []
+    monkeypatch.setattr(reindex.time, "sleep", sleeps.append)
+    monkeypatch.setattr(
+        reindex.api_client,
+        "request",
+        lambda method, path, **kwargs: _Resp(202, {"jobId": 5}) if method == "POST" else next(statuses),
+    )
+
+    if final_status == "COMPLETE":
+        assert reindex.reindex_prep()
+    else:
+        with pytest.raises(SolrException):
+            reindex.reindex_prep()
+    assert sleeps == [2, 4, 8]
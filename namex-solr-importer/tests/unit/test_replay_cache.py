@@ -0,0 +1,70 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the replay cache works as expected."""
+from datetime import UTC, datetime
+
+import pytest
+
+from namex_solr_importer.utils import (
+    ReplayCacheWriter,
+    get_replay_manifest,
+    read_replay_batches,
+)
+
+
+def _docs(start: int, count: int) -> list[dict]:
+    """Return test docs."""
+    return [{"id": f"{num:07d}", "name": f"CORP {num} INC."} for num in range(start, start + count)]
+
+
+def test_replay_cache(tmp_path):
+    """Assert the cached batches are replayed in order and only replace the cache once committed."""
+    created_at = datetime(2025, 6, 1, tzinfo=UTC)
+    batches = [_docs(0, 3), _docs(3, 3), _docs(6, 1)]
+
+    cache = ReplayCacheWriter(tmp_path, "colin", created_at, chunk_size=5)
+    for batch in batches:
+        cache.write(batch)
+    cache.write([])
+    with pytest.raises(FileNotFoundError):
+        get_replay_manifest(tmp_path, "colin")
+    cache.commit()
+
+    assert get_replay_manifest(tmp_path, "colin") == {"created_at": created_at.isoformat(), "chunks": 2, "docs": 7}
+    assert list(read_replay_batches(tmp_path, "colin")) == batches
+
+    # an unfinished run keeps the previous cache
+    cache = ReplayCacheWriter(tmp_path, "colin", datetime.now(UTC))
+    cache.write(_docs(10, 2))
+    assert list(read_replay_batches(tmp_path, "colin")) == batches
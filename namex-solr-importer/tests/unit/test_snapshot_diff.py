@@ -0,0 +1,91 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the COLIN snapshot diff works as expected."""
+from namex_solr_importer.utils import SnapshotDiff
+
+
+def _doc(corp_num: str, name: str) -> dict:
+    """Return a test corp doc."""
+    return {"id": corp_num, "corp_num": corp_num, "names": [{"name": name}], "state": "ACTIVE"}
+
+
+def test_snapshot_diff(tmp_path):
+    """Assert only inserted/changed docs are passed on and removed ids are returned as deleted."""
+    path = tmp_path / "snapshot.sqlite"
+    first_run = [_doc("0000001", "ONE INC."), _doc("0000002", "TWO INC."), _doc("0000003", "THREE INC.")]
+
+    snapshot = SnapshotDiff(path)
+    assert snapshot.filter_changed(first_run) == first_run
+    assert list(snapshot.get_deleted_ids(10)) == []
+    snapshot.commit()
+    snapshot.close()
+
+    # 1 unchanged, 1 changed, 1 removed, 1 new
+    second_run = [_doc("0000001", "ONE INC."), _doc("0000002", "TWO LTD."), _doc("0000004", "FOUR INC.")]
+    snapshot = SnapshotDiff(path)
+    assert snapshot.filter_changed(second_run) == second_run[1:]
+    assert (snapshot.inserted, snapshot.changed, snapshot.unchanged) == (1, 1, 1)
+    assert list(snapshot.get_deleted_ids(10)) == [["0000003"]]
+    snapshot.close()
+
+    # not committed: the next run is diffed against the same snapshot
+    snapshot = SnapshotDiff(path, send_all=True)
+    assert snapshot.filter_changed(second_run) == second_run
+    assert list(snapshot.get_deleted_ids(10)) == [["0000003"]]
+    snapshot.commit()
+    snapshot.close()
+
+    snapshot = SnapshotDiff(path)
+    assert snapshot.filter_changed(second_run) == []
+    assert list(snapshot.get_deleted_ids(10)) == []
+    snapshot.close()
+
+
+def test_snapshot_diff_resume(tmp_path):
+    """Assert a resumed run keeps the docs already recorded by the unfinished run."""
+    path = tmp_path / "snapshot.sqlite"
+    docs = [_doc("0000001", "ONE INC."), _doc("0000002", "TWO INC.")]
+
+    snapshot = SnapshotDiff(path)
+    snapshot.filter_changed(docs[:1])
+    snapshot.close()
+
+    snapshot = SnapshotDiff(path, resume=True)
+    assert snapshot.filter_changed(docs[1:]) == docs[1:]
+    snapshot.commit()
+    snapshot.close()
+
+    snapshot = SnapshotDiff(path)
+    assert snapshot.filter_changed(docs) == []
+    snapshot.close()
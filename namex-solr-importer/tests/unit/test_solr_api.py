@@ -0,0 +1,164 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the import batches are sent to the configured target."""
+import gzip
+import json
+
+import pytest
+
+from namex_solr_importer.utils import solr_api
+
+
+def test_import_conflicts_direct_to_solr(app, monkeypatch):
+    """Assert the direct mode sends the batches to the solr leader without the api/token."""
+    sent = []
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("api hop should not be used")
+
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", True)
+    monkeypatch.setitem(app.config, "BATCH_SIZE", 2)
+    monkeypatch.setattr(solr_api.api_client, "request", _fail)
+    monkeypatch.setattr(solr_api.solr, "create_or_replace_raw_docs",
+                        lambda payload, doc_count, timeout, core: sent.append(json.loads(payload)))
+
+    docs = [{"id": str(i)} for i in range(5)]
+    assert solr_api.import_conflicts(docs, "test") == len(docs)
+    assert sent == [docs[0:2], docs[2:4], docs[4:5]]
+
+
+@pytest.mark.parametrize("tiered", [False, True])
+def test_import_encoded_batch_direct_to_solr(app, monkeypatch, tiered):
+    """Assert the direct mode forwards the encoded batch as is unless the docs are split between tiers."""
+    sent = []
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", True)
+    monkeypatch.setattr(solr_api.solr, "type_tiers", {"CORP": object()} if tiered else {})
+    monkeypatch.setattr(solr_api.solr, "create_or_replace_raw_docs",
+                        lambda payload, doc_count, timeout, core: sent.append(payload))
+    monkeypatch.setattr(solr_api.solr, "create_or_replace_docs",
+                        lambda raw_docs, timeout, core: sent.append(raw_docs))
+
+    body = json.dumps([{"id": "1"}]).encode()
+    assert solr_api.import_encoded_batch(body, 1, "test") == 1
+    assert sent == [[{"id": "1"}] if tiered else body]
+
+
+@pytest.mark.parametrize("encoding", ["", "gzip"])
+def test_import_conflicts_via_api(app, monkeypatch, encoding):
+    """Assert the api mode sends the docs list as the body with the envelope in the params."""
+    sent = []
+
+    class _Resp:
+        status_code = 201
+
+    def _put(method, path, headers, params, data, timeout):
+        assert method == "PUT"
+        assert headers["Content-Type"] == "application/json"
+        if encoding:
+            assert headers["Content-Encoding"] == encoding
+            data = gzip.decompress(data)
+        sent.append((params, json.loads(data)))
+        return _Resp()
+
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", False)
+    monkeypatch.setitem(app.config, "IMPORT_COMPRESSION", encoding)
+    monkeypatch.setitem(app.config, "BATCH_SIZE", 3)
+    monkeypatch.setattr(solr_api.api_client, "request", _put)
+
+    docs = [{"id": str(i)} for i in range(4)]
+    assert solr_api.import_conflicts(docs, "test", partial=True) == len(docs)
+    assert [params["count"] for params, _ in sent] == [3, 1]
+    assert all(params["type"] == "partial" for params, _ in sent)
+    assert [body for _, body in sent] == [docs[0:3], docs[3:4]]
+
+
+def test_import_retry_smaller_batch(app, monkeypatch):
+    """Assert a failed batch is retried with a smaller slice of its docs (the same for both import paths)."""
+    sent = []
+
+    class _Resp:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def json(self):
+            return {}
+
+    def _put(method, path, headers, params, data, timeout):
+        sent.append(len(json.loads(data)))
+        return _Resp(500 if len(sent) == 1 else 201)
+
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", False)
+    monkeypatch.setitem(app.config, "IMPORT_COMPRESSION", "")
+    monkeypatch.setitem(app.config, "BATCH_SIZE", 4)
+    monkeypatch.setattr(solr_api.api_client, "request", _put)
+    monkeypatch.setattr(solr_api.time, "sleep", lambda _: None)
+
+    docs = [{"id": str(i)} for i in range(4)]
+    assert solr_api.import_conflicts(docs, "test") == len(docs)
+    assert sent == [4, 2, 2]
+
+    sent.clear()
+    assert solr_api.import_encoded_batch(json.dumps(docs).encode(), len(docs), "test") == len(docs)
+    assert sent == [4, 2, 2]
+
+
+def test_import_target_shadow(app, monkeypatch):
+    """Assert the batches / deletes are sent to the given target core."""
+    sent = []
+
+    class _Resp:
+        status_code = 201
+
+    def _put(method, path, headers, params, data, timeout):
+        sent.append(params["core"])
+        return _Resp()
+
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", False)
+    monkeypatch.setattr(solr_api.api_client, "request", _put)
+
+    solr_api.import_conflicts([{"id": "1"}], "test", core="shadow")
+    solr_api.import_conflicts([{"id": "2"}], "test")
+    assert sent == ["shadow", "live"]
+
+    # direct imports write to the shadow core through the solr client (without changing its leader core)
+    sent = []
+    monkeypatch.setitem(app.config, "IMPORT_DIRECT_TO_SOLR", True)
+    monkeypatch.setattr(solr_api.solr, "create_or_replace_raw_docs",
+                        lambda payload, doc_count, timeout, core: sent.append(core))
+    monkeypatch.setattr(solr_api.solr, "delete_docs_by_id", lambda ids, core: sent.append(core))
+    solr_api.import_conflicts([{"id": "1"}], "test", core="shadow")
+    solr_api.delete_conflicts(["1"], "test", core="shadow")
+    solr_api.import_conflicts([{"id": "2"}], "test")
+    assert sent == [solr_api.solr.shadow_core, solr_api.solr.shadow_core, None]
+    assert solr_api.solr.leader_core == app.config["SOLR_SVC_NAMEX_LEADER_CORE"]